@@ -0,0 +1,59 @@
+"""
+Compare a column of optional values stored as one container per row with the
+columnar OptionArray: build time, map time and memory.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_array.py
+```
+"""
+import time
+import tracemalloc
+
+from fateful.monad.array import opt_array
+from fateful.monad.option import opt
+
+N = 1_000_000
+ROWS = [None if i % 10 == 0 else float(i) for i in range(N)]
+
+
+def _measure(fn) -> tuple[float, float]:
+    """seconds and megabytes allocated by fn"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size / 1e6
+
+
+def main() -> None:
+    containers = [opt(v) for v in ROWS]
+    column = opt_array(ROWS, dtype=float)
+    rows = [
+        ("[opt(v) for v]", _measure(lambda: [opt(v) for v in ROWS])),
+        ("opt_array(rows)", _measure(lambda: opt_array(ROWS, dtype=float))),
+        ("[o.map(f) for o]", _measure(lambda: [o.map(abs) for o in containers])),
+        ("column.map(f)", _measure(lambda: column.map(abs, dtype=float))),
+    ]
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        rows.append(
+            (
+                "column.map(np.abs, vec)",
+                _measure(lambda: column.map(np.abs, vectorized=True, dtype=float)),
+            )
+        )
+    print(f"{'operation':<24}{'seconds':>10}{'MB':>10}")
+    for name, (seconds, mb) in rows:
+        print(f"{name:<24}{seconds:>10.3f}{mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
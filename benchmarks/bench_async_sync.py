@@ -0,0 +1,84 @@
+"""
+AsyncTry chains made of synchronous steps: an async head followed by sync maps,
+and a chain without any coroutine, awaited or run with `run_sync()` without event
+loop.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_async_sync.py
+```
+"""
+import asyncio
+import time
+
+from fateful.monad.async_result import async_try
+
+N = 20_000
+
+
+async def fetch(value: str) -> str:
+    return value
+
+
+def steps(chain):
+    return (
+        chain.map(str.strip)
+        .map(int)
+        .map(lambda v: v * 2)
+        .map(lambda v: {"value": v})
+        .map(lambda d: d["value"])
+    )
+
+
+ASYNC_HEAD = steps(async_try(fetch, ValueError))
+ALL_SYNC = steps(async_try(str, ValueError))
+
+
+async def _awaited_us(chain) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(N):
+            await chain(" 21 ").execute()
+        best = min(best, (time.perf_counter() - start) / N)
+    return best * 1e6
+
+
+def _run_sync_us(chain) -> float:
+    if not hasattr(type(chain), "run_sync"):
+        return float("nan")
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(N):
+            chain(" 21 ").run_sync()
+        best = min(best, (time.perf_counter() - start) / N)
+    return best * 1e6
+
+
+def _asyncio_run_us(chain) -> float:
+    # what a synchronous caller has to do without run_sync()
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(N // 100):
+            asyncio.run(chain(" 21 ").execute())
+        best = min(best, (time.perf_counter() - start) / (N // 100))
+    return best * 1e6
+
+
+def main() -> None:
+    rows = [
+        ("async head, await", asyncio.run(_awaited_us(ASYNC_HEAD))),
+        ("all sync, await", asyncio.run(_awaited_us(ALL_SYNC))),
+        ("all sync, asyncio.run", _asyncio_run_us(ALL_SYNC)),
+        ("all sync, run_sync()", _run_sync_us(ALL_SYNC)),
+    ]
+    print(f"{'chain of 5 maps':<24}{'us/run':>8}")
+    for name, us in rows:
+        print(f"{name:<24}{us:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Per request cost of an AsyncTry pipeline: rebuilding the map / recover chain for
+each request, compared to building it once and calling the template with the
+request arguments, one by one or through `run_many`.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_async_template.py
+```
+"""
+import asyncio
+import time
+
+from fateful.monad.async_result import async_try
+
+N = 20_000
+
+
+async def fetch(user_id: int) -> dict:
+    return {"id": user_id, "name": f"user {user_id}"}
+
+
+def build():
+    return (
+        async_try(fetch, KeyError)
+        .map(lambda user: user["name"])
+        .map(str.upper)
+        .map(lambda name: name.split())
+        .recover_with(["anonymous"])
+    )
+
+
+TEMPLATE = build()
+
+
+async def rebuilt(user_id: int):
+    return await build()(user_id).execute()
+
+
+async def template(user_id: int):
+    return await TEMPLATE(user_id).execute()
+
+
+async def _us(f) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for i in range(N):
+            await f(i)
+        best = min(best, (time.perf_counter() - start) / N)
+    return best * 1e6
+
+
+async def _run_many_us() -> float:
+    best = float("inf")
+    if not hasattr(type(TEMPLATE), "run_many"):
+        return float("nan")
+    for _ in range(5):
+        start = time.perf_counter()
+        await TEMPLATE.run_many(range(N))
+        best = min(best, (time.perf_counter() - start) / N)
+    return best * 1e6
+
+
+async def _main() -> None:
+    rows = [
+        ("rebuilt per request", await _us(rebuilt)),
+        ("template(arg)", await _us(template)),
+        ("template.run_many", await _run_many_us()),
+    ]
+    print(f"{'pipeline':<22}{'us/request':>12}")
+    for name, us in rows:
+        print(f"{name:<22}{us:>12.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,47 @@
+"""
+Calls to a degraded dependency, failing after 10 ms: without breaker every call
+waits for it, an open CircuitBreaker answers Err(CircuitOpenError) right away.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_breaker.py
+```
+"""
+import asyncio
+import time
+
+from fateful.breaker import CircuitBreaker
+from fateful.monad.async_result import async_try
+
+N = 200
+
+
+async def _run(with_breaker: bool) -> tuple[float, int]:
+    sent = 0
+
+    async def dependency(i: int) -> int:
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(0.01)
+        raise ConnectionError()
+
+    call = async_try(dependency)
+    if with_breaker:
+        call = call.breaker(CircuitBreaker("dependency", window=20, min_calls=10))
+    start = time.perf_counter()
+    for i in range(N):
+        await call(i)
+    return (time.perf_counter() - start) / N * 1e3, sent
+
+
+def main() -> None:
+    print(f"{N} calls to a dependency failing after 10 ms")
+    print(f"{'':<16}{'ms/call':>8}{'sent':>8}")
+    for name, with_breaker in [("no breaker", False), ("CircuitBreaker", True)]:
+        ms, sent = asyncio.run(_run(with_breaker))
+        print(f"{name:<16}{ms:>8.2f}{sent:>8}")
+
+
+if __name__ == "__main__":
+    main()
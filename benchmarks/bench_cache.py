@@ -0,0 +1,42 @@
+"""
+Cost of a cache hit with `memoize` compared to `functools.lru_cache`, and of an
+expected failure answered by the negative cache instead of being recomputed.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_cache.py
+```
+"""
+import functools
+import timeit
+
+from fateful.cache import memoize
+from fateful.monad.result import to_result
+
+N = 200_000
+
+
+def parse(value: str) -> int:
+    return int(value)
+
+
+def main() -> None:
+    safe_parse = to_result(exc=ValueError)(parse)
+    rows = [
+        ("to_result(int)('1')", safe_parse, "1"),
+        ("lru_cache hit", functools.lru_cache(safe_parse), "1"),
+        ("memoize hit", memoize(safe_parse), "1"),
+        ("to_result(int)('x')", safe_parse, "x"),
+        ("lru_cache, Err", functools.lru_cache(safe_parse), "x"),
+        ("memoize negative hit", memoize(negative_ttl=60)(safe_parse), "x"),
+    ]
+    print(f"{'operation':<24}{'ns/call':>10}")
+    for name, f, value in rows:
+        call = functools.partial(f, value)
+        ns = min(timeit.repeat(call, repeat=5, number=N)) / N * 1e9
+        print(f"{name:<24}{ns:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of the core containers: construction cost, `map` cost and
+per-instance memory of Some / Empty / Ok / Err.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_containers.py
+```
+"""
+import timeit
+import tracemalloc
+
+from fateful.monad.option import Empty, Some, opt
+from fateful.monad.result import Err, ErrorCode, Ok, err_code, sync_try
+
+N = 200_000
+ERROR = ValueError("boom")
+
+
+def _not_found_raise() -> int:
+    raise LookupError("not found")
+
+
+def _not_found_code() -> "Ok[int] | Err[ErrorCode]":
+    return err_code("not_found")
+
+
+def _instance_bytes(factory, value) -> float:
+    """average bytes allocated per instance, measured with tracemalloc"""
+    instances = [None] * N
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for i in range(N):
+        instances[i] = factory(value)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / N
+
+
+def _timeit(stmt: str, **ns) -> float:
+    """best time in nanoseconds per call"""
+    timer = timeit.Timer(stmt, globals=ns)
+    number = 100_000
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    rows = [
+        ("Some(1)", _timeit("Some(1)", Some=Some)),
+        ("opt(1)", _timeit("opt(1)", opt=opt)),
+        ("Empty()", _timeit("Empty()", Empty=Empty)),
+        ("Ok(1)", _timeit("Ok(1)", Ok=Ok)),
+        ("Err(e)", _timeit("Err(e)", Err=Err, e=ERROR)),
+        ("Err(ValueError())", _timeit("Err(ValueError())", Err=Err)),
+        (
+            "Err(ErrorCode(c))",
+            _timeit("Err(ErrorCode('c'))", Err=Err, ErrorCode=ErrorCode),
+        ),
+        ("err_code(c)", _timeit("err_code('c')", err_code=err_code)),
+        ("sync_try(raise)", _timeit("f()", f=sync_try(_not_found_raise))),
+        ("return err_code(c)", _timeit("f()", f=_not_found_code)),
+        ("Some(1).map(f)", _timeit("s.map(f)", s=Some(1), f=lambda x: x + 1)),
+        ("Ok(1).map(f)", _timeit("o.map(f)", o=Ok(1), f=lambda x: x + 1)),
+    ]
+    print(f"{'operation':<20}{'ns/op':>10}")
+    for name, ns in rows:
+        print(f"{name:<20}{ns:>10.1f}")
+
+    print()
+    print(f"{'container':<20}{'bytes/instance':>16}")
+    for name, factory, value in (
+        ("Some", Some, 1),
+        ("Ok", Ok, 1),
+        ("Err", Err, ERROR),
+    ):
+        print(f"{name:<20}{_instance_bytes(factory, value):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
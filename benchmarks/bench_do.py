@@ -0,0 +1,99 @@
+"""
+Early return on a failed step: `result_shortcut` with `._` raises and catches a
+ResultShortcutError, `do_result` / `do_async` short-circuit without exception.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_do.py
+```
+"""
+import asyncio
+import time
+import timeit
+
+from fateful.monad.async_result import do_async
+from fateful.monad.result import (Err, Ok, ResultShortcutError, do_result,
+                                  err_code, result_shortcut)
+
+N = 100_000
+FAILED = err_code("failed")
+
+
+def step(value: int):
+    return FAILED if value < 0 else Ok(value)
+
+
+@result_shortcut
+def with_shortcut(value: int):
+    a = step(value)._
+    b = step(a - 1)._
+    return Ok(b)
+
+
+@do_result
+def with_do(value: int):
+    a = yield step(value)
+    b = yield step(a - 1)
+    return b
+
+
+async def async_step(value: int):
+    return step(value)
+
+
+async def async_with_shortcut(value: int):
+    # result_shortcut only wraps sync functions, catch the shortcut by hand
+    try:
+        a = (await async_step(value))._
+        b = (await async_step(a - 1))._
+        return Ok(b)
+    except ResultShortcutError as e:
+        return Err(e.error)
+
+
+@do_async
+def async_with_do(value: int):
+    a = yield async_step(value)
+    b = yield async_step(a - 1)
+    return b
+
+
+def _ns(f, value: int) -> float:
+    return min(timeit.repeat(lambda: f(value), repeat=5, number=N)) / N * 1e9
+
+
+async def _async_ns(f, value: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(N // 10):
+            await f(value)
+        best = min(best, (time.perf_counter() - start) / (N // 10))
+    return best * 1e9
+
+
+async def _async_rows() -> list[tuple[str, float, float]]:
+    return [
+        (
+            name,
+            await _async_ns(async_with_shortcut, value),
+            await _async_ns(async_with_do, value),
+        )
+        for name, value in [("async success", 5), ("async failure", -1)]
+    ]
+
+
+def main() -> None:
+    rows = [
+        (name, _ns(with_shortcut, value), _ns(with_do, value))
+        for name, value in [("success", 5), ("failure", -1)]
+    ]
+    rows += asyncio.run(_async_rows())
+    print(f"{'path':<16}{'result_shortcut':>18}{'do':>10}")
+    for name, shortcut, do in rows:
+        print(f"{name:<16}{shortcut:>18.0f}{do:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
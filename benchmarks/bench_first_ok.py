@@ -0,0 +1,63 @@
+"""
+Latency of reading from 3 replicas answering in 10 to 100 ms, one of them failing
+fast 20 % of the time: waiting for all of them with `AsyncTry.gather` and keeping the
+first Ok, compared to `AsyncTry.first_ok` cancelling the others on the first Ok.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_first_ok.py
+```
+"""
+import asyncio
+import random
+import time
+
+from fateful.monad.async_result import AsyncTry, async_try
+
+N = 100
+
+
+async def replica(key: int, latency: float, fails: bool) -> int:
+    await asyncio.sleep(latency)
+    if fails:
+        raise ConnectionError()
+    return key
+
+
+def _tries(key: int) -> list:
+    fails = random.random() < 0.2
+    return [
+        async_try(replica)(key, random.uniform(0.01, 0.1), fails and i == 0)
+        for i in range(3)
+    ]
+
+
+async def gathered(key: int):
+    results = await AsyncTry.gather(_tries(key))
+    return next((r for r in results if r.is_ok()), results[0])
+
+
+async def first_ok(key: int):
+    return await AsyncTry.first_ok(*_tries(key))
+
+
+async def _ms(f) -> float:
+    random.seed(0)
+    start = time.perf_counter()
+    for i in range(N):
+        await f(i)
+    return (time.perf_counter() - start) / N * 1e3
+
+
+async def _main() -> None:
+    rows = [("gather, first Ok", gathered)]
+    if hasattr(AsyncTry, "first_ok"):
+        rows.append(("AsyncTry.first_ok", first_ok))
+    print(f"{'':<20}{'ms/read':>8}")
+    for name, f in rows:
+        print(f"{name:<20}{await _ms(f):>8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,69 @@
+"""
+Running many AsyncTry: `asyncio.gather` over all of them creates one task per
+AsyncTry up front, `AsyncTry.gather` runs them with limit workers pulling from a
+lazy iterable. Peak memory is measured with tracemalloc in a separate run.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_gather.py
+```
+"""
+import asyncio
+import time
+import tracemalloc
+
+from fateful.monad.async_result import AsyncTry, async_try
+
+N = 100_000
+LIMIT = 100
+
+
+async def fetch(value: int) -> int:
+    await asyncio.sleep(0)
+    return value
+
+
+TEMPLATE = async_try(fetch)
+
+
+async def with_asyncio_gather() -> None:
+    await asyncio.gather(*(TEMPLATE(i).execute() for i in range(N)))
+
+
+async def with_try_gather() -> None:
+    await AsyncTry.gather((TEMPLATE(i) for i in range(N)), limit=LIMIT)
+
+
+async def with_as_completed() -> None:
+    async for _ in AsyncTry.as_completed((TEMPLATE(i) for i in range(N)), limit=LIMIT):
+        pass
+
+
+def _measure(f) -> tuple[float, float]:
+    start = time.perf_counter()
+    asyncio.run(f())
+    elapsed = (time.perf_counter() - start) / N * 1e6
+    tracemalloc.start()
+    asyncio.run(f())
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    rows = [("asyncio.gather", with_asyncio_gather)]
+    if hasattr(AsyncTry, "gather"):
+        rows += [
+            (f"AsyncTry.gather({LIMIT})", with_try_gather),
+            (f"AsyncTry.as_completed({LIMIT})", with_as_completed),
+        ]
+    print(f"{N} AsyncTry")
+    print(f"{'runner':<28}{'us/try':>8}{'peak MiB':>10}")
+    for name, f in rows:
+        elapsed, peak = _measure(f)
+        print(f"{name:<28}{elapsed:>8.1f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Tail latency of a dependency answering in 10 ms, but in 200 ms for 5 % of the
+calls, without hedging, hedged after a fixed 20 ms and hedged after the adaptive
+p95 of the latencies.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_hedge.py
+```
+"""
+import asyncio
+import random
+import time
+
+from fateful.hedge import LatencyPercentile
+from fateful.monad.async_result import async_try
+
+N = 300
+SENT = 0
+
+
+async def read(key: int) -> int:
+    global SENT
+    SENT += 1
+    await asyncio.sleep(0.2 if random.random() < 0.05 else 0.01)
+    return key
+
+
+def _ms(latencies: list[float], percentile: float) -> float:
+    return sorted(latencies)[int(percentile * (len(latencies) - 1))] * 1e3
+
+
+async def _run(template) -> tuple[float, float, float, int]:
+    global SENT
+    random.seed(0)
+    SENT = 0
+    latencies = []
+    for i in range(N):
+        start = time.perf_counter()
+        await template(i)
+        latencies.append(time.perf_counter() - start)
+    return _ms(latencies, 0.5), _ms(latencies, 0.99), max(latencies) * 1e3, SENT
+
+
+async def _main() -> None:
+    rows = [("no hedge", async_try(read))]
+    if hasattr(type(rows[0][1]), "hedge"):
+        rows += [
+            ("hedge(after=0.02)", async_try(read).hedge(after=0.02)),
+            ("hedge(after=p95)", async_try(read).hedge(after=LatencyPercentile())),
+        ]
+    print(f"{'':<20}{'p50 ms':>8}{'p99 ms':>8}{'max ms':>8}{'sent':>6}")
+    for name, template in rows:
+        p50, p99, worst, sent = await _run(template)
+        print(f"{name:<20}{p50:>8.1f}{p99:>8.1f}{worst:>8.1f}{sent:>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
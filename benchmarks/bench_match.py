@@ -0,0 +1,50 @@
+"""
+Event router: a message matched against 20 guards, the last guard matching, with
+`.match` on each message and with a matcher compiled once by `compile_match`.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_match.py
+```
+"""
+
+import timeit
+
+from fateful.monad.func import _, default
+from fateful.monad.result import Err, Ok
+
+try:
+    from fateful.monad.func import compile_match
+except ImportError:  # before compile_match
+    compile_match = None
+
+N = 20_000
+ARMS = 20
+
+
+def guards() -> list:
+    arms = [Err(ValueError()) >> (lambda: "error")]
+    arms += [
+        Ok({"type": f"event_{i}", "id": _}) >> (lambda i: i) for i in range(ARMS - 2)
+    ]
+    arms += [Ok({"type": "last", "id": _}) >> (lambda i: i), default >> None]
+    return arms
+
+
+def main() -> None:
+    message = Ok({"type": "last", "id": 1})
+    arms = guards()
+    rows = [("value.match(*20 guards)", lambda: message.match(*arms))]
+    if compile_match is not None:
+        route = compile_match(*guards())
+        rows.append(("compile_match(...)(value)", lambda: route(message)))
+    print(f"{'operation':<28}{'us/message':>12}")
+    for name, f in rows:
+        assert f() == 1
+        seconds = min(timeit.repeat(f, repeat=5, number=N)) / N
+        print(f"{name:<28}{seconds * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Pickle round-trip time and payload size of the containers, as sent through
+multiprocessing queues.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_pickle.py
+```
+"""
+import pickle
+import timeit
+
+from fateful.monad.option import Null, Some
+from fateful.monad.result import Err, Ok
+
+N = 1000
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def _error() -> Exception:
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        return e
+
+
+def main() -> None:
+    samples = [
+        ("Some(1)", Some(1)),
+        ("Null", Null),
+        ("Ok(1)", Ok(1)),
+        ("Err(ValueError)", Err(_error())),
+        ("[Ok(i)] * 1000", [Ok(i) for i in range(N)]),
+        ("[Null] * 1000", [Null] * N),
+    ]
+    print(f"{'payload':<20}{'bytes':>10}{'us/round-trip':>16}")
+    for name, obj in samples:
+        size = len(pickle.dumps(obj, PROTOCOL))
+        timer = timeit.Timer(lambda obj=obj: pickle.loads(pickle.dumps(obj, PROTOCOL)))
+        seconds = min(timer.repeat(repeat=5, number=200)) / 200
+        print(f"{name:<20}{size:>10}{seconds * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
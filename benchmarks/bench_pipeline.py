@@ -0,0 +1,53 @@
+"""
+Compare a 5 steps chain of `map` calls with the same chain compiled by
+`opt_pipeline` / `try_pipeline`.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_pipeline.py
+```
+"""
+import timeit
+
+from fateful.monad.option import opt
+from fateful.monad.pipeline import opt_pipeline, try_pipeline
+from fateful.monad.result import Ok
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def _timeit(fn) -> float:
+    """best time in nanoseconds per call"""
+    number = 100_000
+    return min(timeit.repeat(fn, repeat=5, number=number)) / number * 1e9
+
+
+def chained_opt() -> int:
+    return opt(1).map(inc).map(inc).map(inc).map(inc).map(inc).or_(0)
+
+
+def chained_ok() -> object:
+    return Ok(1).map(inc).map(inc).map(inc).map(inc).map(inc)
+
+
+def main() -> None:
+    opt_compiled = opt_pipeline().map(inc).map(inc).map(inc).map(inc).map(inc)
+    opt_or = opt_compiled.or_(0)
+    ok_compiled = try_pipeline().map(inc).map(inc).map(inc).map(inc).map(inc)
+    rows = [
+        ("opt(x).map(f) x5 .or_", chained_opt),
+        ("opt_pipeline .or_", lambda: opt_or(1)),
+        ("opt_pipeline", lambda: opt_compiled(1)),
+        ("Ok(x).map(f) x5", chained_ok),
+        ("try_pipeline", lambda: ok_compiled(1)),
+    ]
+    print(f"{'operation':<26}{'ns/op':>10}")
+    for name, fn in rows:
+        print(f"{name:<26}{_timeit(fn):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
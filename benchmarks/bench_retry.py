@@ -0,0 +1,48 @@
+"""
+Load sent to a dependency failing every call, for 1000 calls retried up to 4
+attempts: without budget every call is attempted 4 times, a shared RetryBudget
+stops the retries once half of its tokens are spent.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_retry.py
+```
+"""
+import asyncio
+
+from fateful.monad.async_result import async_try
+from fateful.retry import RetryBudget
+
+N = 1000
+ATTEMPTS = 4
+
+
+async def _attempts(failure_rate: float, budget: RetryBudget | None) -> int:
+    sent = 0
+
+    async def dependency(i: int) -> int:
+        nonlocal sent
+        sent += 1
+        # failures spread over the calls
+        if (sent * failure_rate) % 1 + failure_rate >= 1:
+            raise ConnectionError()
+        return i
+
+    call = async_try(dependency).retry(ATTEMPTS, delay=0, budget=budget)
+    for i in range(N):
+        await call(i)
+    return sent
+
+
+def main() -> None:
+    print(f"{N} calls, up to {ATTEMPTS} attempts")
+    print(f"{'failure rate':<14}{'no budget':>12}{'RetryBudget()':>16}")
+    for rate in (0.0, 0.1, 0.5, 1.0):
+        without = asyncio.run(_attempts(rate, None))
+        with_budget = asyncio.run(_attempts(rate, RetryBudget()))
+        print(f"{rate:<14}{without:>12}{with_budget:>16}")
+
+
+if __name__ == "__main__":
+    main()
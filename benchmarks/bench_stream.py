@@ -0,0 +1,84 @@
+"""
+Processing 50 pages of 200 records, each page taking 10 ms to fetch and each page
+of records 10 ms to process: collecting all the pages before processing them,
+compared to an `AsyncTryStream`, without and with a `buffer` of 2 pages. Peak memory is measured
+with tracemalloc.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_stream.py
+```
+"""
+import asyncio
+import time
+import tracemalloc
+
+PAGES = 50
+RECORDS = 200
+
+
+async def pages():
+    for number in range(PAGES):
+        await asyncio.sleep(0.01)
+        yield [
+            {"id": number * RECORDS + i, "payload": bytes(1000)} for i in range(RECORDS)
+        ]
+
+
+async def process(record: dict) -> int:
+    if record["id"] % RECORDS == 0:
+        await asyncio.sleep(0.01)
+    return record["id"]
+
+
+async def collected() -> int:
+    records = [record async for page in pages() for record in page]
+    return sum([await process(record) for record in records])
+
+
+def _stream(buffer: int | None):
+    from fateful.monad.async_stream import AsyncTryStream
+
+    stream = AsyncTryStream(pages())
+    if buffer is not None:
+        # the next pages are fetched while the current one is processed
+        stream = stream.buffer(buffer)
+    return stream.flat_map(lambda page: page).map(process)
+
+
+async def streamed(buffer: int | None = None) -> int:
+    return sum([result.get() async for result in _stream(buffer)])
+
+
+async def _measure(f) -> tuple[float, float]:
+    # tracemalloc slows down the allocations, it is not running during the timing
+    start = time.perf_counter()
+    await f()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    await f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak / 2**20
+
+
+async def _main() -> None:
+    rows = [("collect, then process", collected)]
+    try:
+        import fateful.monad.async_stream  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        rows += [
+            ("AsyncTryStream", streamed),
+            ("AsyncTryStream.buffer(2)", lambda: streamed(2)),
+        ]
+    print(f"{'':<28}{'ms':>8}{'peak MB':>9}")
+    for name, f in rows:
+        ms, mb = await _measure(f)
+        print(f"{name:<28}{ms:>8.0f}{mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,72 @@
+"""
+Throughput of `opt(x).map(f)`, `sync_try(f)(x)` and `match` run by 1 to cpu_count
+threads. On a free-threaded build (python3.13t and later) the speedup should grow
+linearly with the number of threads, with the GIL it stays around 1.
+
+run it with:
+
+```bash
+pdm run python benchmarks/bench_threads.py
+```
+"""
+import os
+import sys
+import threading
+import time
+
+from fateful.monad.func import _
+from fateful.monad.option import Null, Some, opt
+from fateful.monad.result import sync_try
+
+N = 200_000
+
+safe_int = sync_try(int, ValueError)
+
+
+def opt_map() -> None:
+    for i in range(N):
+        opt(i).map(lambda v: v + 1)
+
+
+def sync_try_call() -> None:
+    for _i in range(N):
+        safe_int("1")
+
+
+def match() -> None:
+    value = Some(1)
+    for _i in range(N // 20):
+        value.match(Null >> (lambda: 0), Some(_) >> (lambda v: v))
+
+
+def _throughput(work, threads: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        work()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, gil {'enabled' if gil else 'disabled'}")
+    counts = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    counts = [c for c in counts if c <= (os.cpu_count() or 1)]
+    print(f"{'workload':<16}" + "".join(f"{c:>8}" for c in counts))
+    for work in (opt_map, sync_try_call, match):
+        base = _throughput(work, 1)
+        speedups = [_throughput(work, c) / base for c in counts]
+        print(f"{work.__name__:<16}" + "".join(f"{s:>8.2f}" for s in speedups))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Public API of fateful, e.g. `from fateful import opt, Null, Some`.
+
+Names are resolved on first access through the module `__getattr__`, so importing
+fateful only loads the modules actually used: asyncio, aiohttp, numpy, orjson and
+pampy are not imported by `from fateful import opt`.
+"""
+
+# ruff: noqa: F401
+import importlib
+
+# typing is not imported either, it is the largest part of the import time left
+TYPE_CHECKING = False
+
+_EXPORTS: dict[str, str] = {
+    # options
+    "Some": "fateful.monad.option",
+    "Empty": "fateful.monad.option",
+    "Null": "fateful.monad.option",
+    "none": "fateful.monad.option",
+    "option": "fateful.monad.option",
+    "opt": "fateful.monad.option",
+    "lift_opt": "fateful.monad.option",
+    "opt_path": "fateful.monad.option",
+    "EmptyError": "fateful.monad.container",
+    # results
+    "Ok": "fateful.monad.result",
+    "Err": "fateful.monad.result",
+    "Result": "fateful.monad.result",
+    "ErrorCode": "fateful.monad.result",
+    "CodedError": "fateful.monad.result",
+    "TracebackPolicy": "fateful.monad.result",
+    "err_code": "fateful.monad.result",
+    "sync_try": "fateful.monad.result",
+    "to_result": "fateful.monad.result",
+    "result_shortcut": "fateful.monad.result",
+    "do_result": "fateful.monad.result",
+    # async
+    "AsyncTry": "fateful.monad.async_result",
+    "async_try": "fateful.monad.async_result",
+    "lift_future": "fateful.monad.async_result",
+    "do_async": "fateful.monad.async_result",
+    "AsyncTryStream": "fateful.monad.async_stream",
+    # pattern matching
+    "_": "fateful.monad.func",
+    "when": "fateful.monad.func",
+    "default": "fateful.monad.func",
+    "identity": "fateful.monad.func",
+    "MatchError": "fateful.monad.func",
+    "compile_match": "fateful.monad.func",
+    # pipelines and arrays
+    "opt_pipeline": "fateful.monad.pipeline",
+    "try_pipeline": "fateful.monad.pipeline",
+    "opt_array": "fateful.monad.array",
+    "sync_try_array": "fateful.monad.array",
+    # helpers
+    "memoize": "fateful.cache",
+    "try_map": "fateful.parallel",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fateful.cache import memoize
+    from fateful.monad.array import opt_array, sync_try_array
+    from fateful.monad.async_result import AsyncTry, async_try, do_async, lift_future
+    from fateful.monad.async_stream import AsyncTryStream
+    from fateful.monad.container import EmptyError
+    from fateful.monad.func import (
+        MatchError,
+        _,
+        compile_match,
+        default,
+        identity,
+        when,
+    )
+    from fateful.monad.option import (
+        Empty,
+        Null,
+        Some,
+        lift_opt,
+        none,
+        opt,
+        opt_path,
+        option,
+    )
+    from fateful.monad.pipeline import opt_pipeline, try_pipeline
+    from fateful.monad.result import (
+        CodedError,
+        Err,
+        ErrorCode,
+        Ok,
+        Result,
+        TracebackPolicy,
+        do_result,
+        err_code,
+        result_shortcut,
+        sync_try,
+        to_result,
+    )
+    from fateful.parallel import try_map
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # cached, next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
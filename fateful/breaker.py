@@ -0,0 +1,244 @@
+import functools
+import threading
+import time
+import typing as t
+from collections import deque
+from enum import Enum
+
+P = t.ParamSpec("P")
+T = t.TypeVar("T")
+
+_breakers: dict[str, "CircuitBreaker"] = {}
+_breakers_lock = threading.Lock()
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+Listener = t.Callable[["CircuitBreaker", CircuitState, CircuitState], t.Any]
+
+
+class CircuitOpenError(Exception):
+    """
+    Error of the calls refused by an open circuit breaker.
+
+    Attributes:
+        name (str): name of the breaker.
+        retry_after (float): seconds before the breaker lets probes through.
+    """
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"circuit {name!r} is open, retry in {retry_after:.3g}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker shared by the calls to a dependency, see `AsyncTry.breaker`.
+
+    Closed, it records the outcome of the last window calls and opens when at least
+    min_calls have been recorded and the failure rate reaches failure_rate. Open, it
+    refuses all calls with a `CircuitOpenError` for open_for seconds, then becomes
+    half open and lets probes calls through: a failed probe opens it again, probes
+    successes close it.
+
+    ```python
+    users_cb = CircuitBreaker("users", failure_rate=0.5, window=20, open_for=10)
+
+    get_user = async_try(fetch_user).breaker(users_cb)
+    await get_user(1)  # Err(CircuitOpenError(...)) while users is down
+    ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        open_for: float = 30.0,
+        probes: int = 1,
+        on: type[Exception] | tuple[type[Exception], ...] = (Exception,),
+        listener: Listener | None = None,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            name (str): name of the breaker, given to the errors.
+            failure_rate (float, optional): rate of failed calls opening the breaker.
+                Defaults to 0.5.
+            window (int, optional): number of calls in the sliding window.
+                Defaults to 20.
+            min_calls (int, optional): calls to record before the failure rate is
+                considered. Defaults to 10.
+            open_for (float, optional): seconds before an open breaker lets probes
+                through. Defaults to 30.
+            probes (int, optional): number of concurrent probes, and of successes
+                closing the half open breaker. Defaults to 1.
+            on (tuple[type[Exception], ...], optional): exceptions counted as
+                failures. Defaults to (Exception,).
+            listener (Listener | None, optional): called with the breaker, the
+                previous state and the new state on each transition.
+            clock (t.Callable[[], float], optional): time source. Defaults to
+                time.monotonic.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in ]0, 1]")
+        if window < 1 or probes < 1 or not 1 <= min_calls <= window:
+            raise ValueError("window, probes and min_calls must be at least 1")
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_for = open_for
+        self.probes = probes
+        self.on = on if isinstance(on, tuple) else (on,)
+        self._listener = listener
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """current state, an open breaker past open_for is reported half open"""
+        with self._lock:
+            if (
+                self._state is CircuitState.OPEN
+                and self._clock() >= self._opened_at + self.open_for
+            ):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def _transition(self, state: CircuitState) -> t.Callable[[], t.Any] | None:
+        # under the lock, the listener is called once it is released
+        previous, self._state = self._state, state
+        if state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif state is CircuitState.HALF_OPEN:
+            self._probing = self._probe_successes = 0
+        else:
+            self._outcomes.clear()
+            self._failures = 0
+        if self._listener is None:
+            return None
+        return functools.partial(self._listener, self, previous, state)
+
+    def acquire(self) -> bool:
+        """
+        Ask to run a call, to be followed by `record` or `release` when it is done.
+
+        Returns:
+            bool: False if the call is refused.
+        """
+        notify = None
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                if self._clock() < self._opened_at + self.open_for:
+                    return False
+                notify = self._transition(CircuitState.HALF_OPEN)
+            allowed = True
+            if self._state is CircuitState.HALF_OPEN:
+                allowed = self._probing < self.probes
+                self._probing += allowed
+        if notify is not None:
+            notify()
+        return allowed
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of an acquired call."""
+        notify = None
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                # max: the call may have been acquired before the breaker opened
+                self._probing = max(self._probing - 1, 0)
+                if not success:
+                    notify = self._transition(CircuitState.OPEN)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.probes:
+                        notify = self._transition(CircuitState.CLOSED)
+            elif self._state is CircuitState.CLOSED:
+                outcomes = self._outcomes
+                if len(outcomes) == outcomes.maxlen:
+                    self._failures -= not outcomes[0]
+                outcomes.append(success)
+                self._failures += not success
+                if len(
+                    outcomes
+                ) >= self.min_calls and self._failures >= self.failure_rate * len(
+                    outcomes
+                ):
+                    notify = self._transition(CircuitState.OPEN)
+        if notify is not None:
+            notify()
+
+    def release(self) -> None:
+        """Give back an acquired call without outcome, e.g. when it is cancelled."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probing = max(self._probing - 1, 0)
+
+    def retry_after(self) -> float:
+        """
+        Returns:
+            float: seconds before an open breaker lets probes through, 0 otherwise.
+        """
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(self._opened_at + self.open_for - self._clock(), 0.0)
+
+    def is_failure(self, error: BaseException) -> bool:
+        """Whether error counts as a failure."""
+        return isinstance(error, self.on)
+
+    def __call__(self, f: t.Callable[P, T]) -> t.Callable[P, T]:
+        """
+        Decorate a function returning AsyncTry, e.g. made by `lift_future`, so that
+        its AsyncTry go through the breaker.
+
+        ```python
+        @users_cb
+        @lift_future
+        async def fetch_user(user_id: int) -> User:
+            ...
+
+        await fetch_user(1)  # Err(CircuitOpenError(...)) while users is down
+        ```
+        """
+
+        @functools.wraps(f)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return f(*args, **kwargs).breaker(self)  # type: ignore
+
+        return wrapper
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker {self.name!r} {self.state.value}>"
+
+
+def circuit_breaker(name: str, **kwargs: t.Any) -> CircuitBreaker:
+    """
+    Return the breaker registered under name, created with kwargs (see
+    `CircuitBreaker`) on the first call, so that all the modules calling a
+    dependency share its breaker.
+
+    ```python
+    get_user = async_try(fetch_user).breaker(circuit_breaker("users", open_for=10))
+    ```
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **kwargs)
+        return breaker
@@ -0,0 +1,257 @@
+import functools
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from fateful.monad.option import Empty
+from fateful.monad.result import Err, ErrorCode
+
+P = t.ParamSpec("P")
+T = t.TypeVar("T")
+
+PolicyKey = t.Union[type[BaseException], str]
+
+_KWARGS_MARK = object()
+_FOREVER = None
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """
+    Counters of a memoized function.
+
+    Attributes:
+        hits (int): calls answered with a cached `Ok` / `Some` (or plain value).
+        negative_hits (int): calls answered with a cached `Err` / `Empty`.
+        misses (int): calls running the function.
+        evictions (int): entries dropped because a cache was full.
+        expirations (int): expired entries dropped on lookup.
+        currsize (int): entries in the value cache.
+        negative_currsize (int): entries in the negative cache.
+    """
+
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    negative_currsize: int
+
+
+class Memoized(t.Generic[P, T]):
+    """
+    Function wrapped by `memoize`, see `cache_info` and `cache_clear`.
+    """
+
+    def __init__(
+        self,
+        f: t.Callable[P, T],
+        maxsize: int | None,
+        ttl: float | None,
+        negative_ttl: float | None,
+        negative_maxsize: int | None,
+        policies: t.Mapping[PolicyKey, float | None],
+        clock: t.Callable[[], float],
+    ) -> None:
+        functools.update_wrapper(self, f)
+        self._f = f
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._negative_maxsize = negative_maxsize
+        self._policies = dict(policies)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: OrderedDict[t.Hashable, tuple[float | None, T, bool]] = (
+            OrderedDict()
+        )
+        self._failures: OrderedDict[t.Hashable, tuple[float | None, T, bool]] = (
+            OrderedDict()
+        )
+        self._error_ttls: dict[type[BaseException], float | None] = {}
+        self._hits = self._negative_hits = self._misses = 0
+        self._evictions = self._expirations = 0
+
+    def _failure_ttl(self, result: t.Any) -> float | None:
+        if isinstance(result, Empty):
+            return self._negative_ttl
+        error = result._under
+        if isinstance(error, ErrorCode):
+            return self._policies.get(error.code, self._negative_ttl)
+        clazz = type(error)
+        try:
+            return self._error_ttls[clazz]
+        except KeyError:
+            pass
+        ttl = next(
+            (self._policies[c] for c in clazz.__mro__ if c in self._policies),
+            self._negative_ttl,
+        )
+        self._error_ttls[clazz] = ttl
+        return ttl
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        key = (*args, _KWARGS_MARK, *kwargs.items()) if kwargs else args
+        with self._lock:
+            entry = self._values.get(key) or self._failures.get(key)
+            if entry is not None:
+                expires, cached, negative = entry
+                cache = self._failures if negative else self._values
+                if expires is _FOREVER or self._clock() < expires:
+                    cache.move_to_end(key)
+                    if negative:
+                        self._negative_hits += 1
+                    else:
+                        self._hits += 1
+                    return cached
+                del cache[key]
+                self._expirations += 1
+            self._misses += 1
+
+        # not under the lock: concurrent misses on the same key all run f
+        result = self._f(*args, **kwargs)
+
+        negative = isinstance(result, (Err, Empty))
+        if negative:
+            cache, other = self._failures, self._values
+            ttl, maxsize = self._failure_ttl(result), self._negative_maxsize
+        else:
+            cache, other = self._values, self._failures
+            ttl, maxsize = self._ttl, self._maxsize
+        if ttl is not _FOREVER and ttl <= 0:
+            return result
+        expires = _FOREVER if ttl is _FOREVER else self._clock() + ttl
+        with self._lock:
+            other.pop(key, None)
+            cache[key] = (expires, result, negative)
+            cache.move_to_end(key)
+            while maxsize is not None and len(cache) > maxsize:
+                cache.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def __get__(self, obj: t.Any, objtype: type | None = None) -> t.Any:
+        # behave like a function when used on methods
+        if obj is None:
+            return self
+        return functools.partial(self, obj)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns:
+            CacheInfo: current counters and sizes.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._negative_hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                len(self._values),
+                len(self._failures),
+            )
+
+    def cache_clear(self) -> None:
+        """Empty both caches and reset the counters."""
+        with self._lock:
+            self._values.clear()
+            self._failures.clear()
+            self._hits = self._negative_hits = self._misses = 0
+            self._evictions = self._expirations = 0
+
+
+@t.overload
+def memoize(
+    f: t.Callable[P, T],
+    *,
+    maxsize: int | None = ...,
+    ttl: float | None = ...,
+    negative_ttl: float | None = ...,
+    negative_maxsize: int | None = ...,
+    policies: t.Mapping[PolicyKey, float | None] | None = ...,
+    clock: t.Callable[[], float] = ...,
+) -> Memoized[P, T]: ...
+
+
+@t.overload
+def memoize(
+    f: None = ...,
+    *,
+    maxsize: int | None = ...,
+    ttl: float | None = ...,
+    negative_ttl: float | None = ...,
+    negative_maxsize: int | None = ...,
+    policies: t.Mapping[PolicyKey, float | None] | None = ...,
+    clock: t.Callable[[], float] = ...,
+) -> t.Callable[[t.Callable[P, T]], Memoized[P, T]]: ...
+
+
+def memoize(
+    f: t.Callable[P, T] | None = None,
+    *,
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    negative_ttl: float | None = 0.0,
+    negative_maxsize: int | None = None,
+    policies: t.Mapping[PolicyKey, float | None] | None = None,
+    clock: t.Callable[[], float] = time.monotonic,
+) -> Memoized[P, T] | t.Callable[[t.Callable[P, T]], Memoized[P, T]]:
+    """
+    Memoize a function returning options or results, e.g. decorated with
+    `to_result`, `sync_try` or `lift_opt`.
+
+    `Ok` / `Some` (and plain) values are kept in a LRU cache, `Err` / `Empty` in a
+    separate negative cache with its own, usually shorter, time to live. The time to
+    live of an `Err` can depend on its exception type (the most specific class of the
+    exception found in policies wins) or on the code of an `ErrorCode`.
+
+    A time to live of None never expires, 0 disables caching. Arguments must be
+    hashable.
+
+    Args:
+        f (t.Callable[P, T] | None, optional): function to memoize.
+        maxsize (int | None, optional): maximum number of cached values, None for
+            unbounded. Defaults to 128.
+        ttl (float | None, optional): time to live of values in seconds. Defaults to
+            None.
+        negative_ttl (float | None, optional): time to live of `Err` / `Empty` in
+            seconds. Defaults to 0, failures are not cached.
+        negative_maxsize (int | None, optional): maximum number of cached failures.
+            Defaults to maxsize.
+        policies (t.Mapping[type[BaseException] | str, float | None], optional):
+            time to live of `Err` by exception type or error code.
+        clock (t.Callable[[], float], optional): time source. Defaults to
+            time.monotonic.
+
+    Returns:
+        Memoized[P, T]: wrapped function, with `cache_info()` and `cache_clear()`.
+
+    ```python
+    @memoize(ttl=300, negative_ttl=5, policies={KeyError: 60, TimeoutError: 0})
+    @to_result(exc=(KeyError, TimeoutError))
+    def fetch_user(user_id: int) -> User:
+        ...
+
+    fetch_user(1)
+    fetch_user.cache_info()  # CacheInfo(hits=0, negative_hits=0, misses=1, ...)
+    ```
+    """
+
+    def decorator(func: t.Callable[P, T]) -> Memoized[P, T]:
+        return Memoized(
+            func,
+            maxsize,
+            ttl,
+            negative_ttl,
+            maxsize if negative_maxsize is None else negative_maxsize,
+            policies or {},
+            clock,
+        )
+
+    if f is None:
+        return decorator
+    return decorator(f)
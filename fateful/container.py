@@ -1,12 +1,18 @@
+import functools
 import typing as t
 from collections.abc import Iterator
 
 from fateful.monad.option import Empty, Some, none
 
-try:
-    import orjson as json  # type: ignore
-except ImportError:
-    import json  # type: ignore
+
+@functools.cache
+def _json() -> t.Any:
+    # orjson when installed, imported on first use only
+    try:
+        import orjson as json  # type: ignore
+    except ImportError:
+        import json  # type: ignore
+    return json
 
 
 class _ConverterProtocol(t.Protocol):
@@ -74,7 +80,7 @@ class opt_dict(dict[K, V], _ConverterProtocol):
             self[k] = self._convert(v)
 
     def stringify(self, *args: t.Any, **kwargs: t.Any) -> str:
-        r: str | bytes = json.dumps(self, *args, **kwargs)
+        r: str | bytes = _json().dumps(self, *args, **kwargs)
         if isinstance(r, bytes):
             return r.decode("utf-8")
         return r
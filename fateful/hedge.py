@@ -0,0 +1,69 @@
+import bisect
+import threading
+from collections import deque
+
+
+class LatencyPercentile:
+    """
+    Adaptive delay of `AsyncTry.hedge`: a percentile of the latencies of the last
+    completed runs, e.g. their p95 so that about 5 % of the calls are hedged. The
+    runs cancelled because another one won are not recorded.
+
+    ```python
+    p95 = LatencyPercentile(0.95, window=200, initial=0.05)
+    get_user = async_try(fetch_user).hedge(after=p95)
+    ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        *,
+        window: int = 200,
+        initial: float = 0.1,
+        min_samples: int = 20,
+    ) -> None:
+        """
+        Args:
+            percentile (float, optional): percentile of the latencies, in ]0, 1].
+                Defaults to 0.95.
+            window (int, optional): number of latencies kept. Defaults to 200.
+            initial (float, optional): delay in seconds while fewer than
+                min_samples latencies have been recorded. Defaults to 0.1.
+            min_samples (int, optional): latencies to record before using the
+                percentile. Defaults to 20.
+        """
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in ]0, 1]")
+        if window < 1 or not 1 <= min_samples <= window:
+            raise ValueError("window and min_samples must be at least 1")
+        self.percentile = percentile
+        self.initial = initial
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._sorted: list[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed run, in seconds."""
+        with self._lock:
+            samples = self._samples
+            if len(samples) == samples.maxlen:
+                # the sorted copy is kept up to date instead of sorted on each read
+                del self._sorted[bisect.bisect_left(self._sorted, samples[0])]
+            samples.append(latency)
+            bisect.insort(self._sorted, latency)
+
+    def delay(self) -> float:
+        """
+        Returns:
+            float: the percentile of the recorded latencies, in seconds.
+        """
+        with self._lock:
+            count = len(self._sorted)
+            if count < self.min_samples:
+                return self.initial
+            return self._sorted[min(int(self.percentile * count), count - 1)]
+
+    def __repr__(self) -> str:
+        return f"<LatencyPercentile p{self.percentile * 100:g} {self.delay():.3g}s>"
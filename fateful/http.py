@@ -1,19 +1,47 @@
+# annotations are not evaluated, aiohttp is only needed at runtime by requests
+from __future__ import annotations
+
+import asyncio
 import logging
 import typing as t
 from enum import Enum
 from functools import partial
 from json import JSONDecodeError
 
-try:
-    from aiohttp import ClientError, ClientSession
-    from yarl import URL
-except ImportError:
-    logging.warning("aiohttp and yarl are not installed")
-    raise
-
 from fateful.json import js_array, js_object, try_parse
 from fateful.monad.async_result import async_try
 from fateful.monad.result import Err, Ok
+from fateful.timeouts import remaining
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import ClientError, ClientSession, ClientTimeout
+    from yarl import URL
+
+
+def _client_error() -> type[Exception]:
+    # aiohttp is imported by the first request, not with this module
+    try:
+        from aiohttp import ClientError
+    except ImportError:
+        logging.warning("aiohttp and yarl are not installed")
+        raise
+    return ClientError
+
+
+def _budget_timeout(timeout: ClientTimeout | None, budget: float) -> ClientTimeout:
+    """timeout of a request, capped by the remaining budget of the deadline"""
+    from aiohttp import ClientTimeout
+
+    if timeout is None:
+        return ClientTimeout(total=budget)
+    if timeout.total is not None and timeout.total <= budget:
+        return timeout
+    return ClientTimeout(
+        total=budget,
+        connect=timeout.connect,
+        sock_read=timeout.sock_read,
+        sock_connect=timeout.sock_connect,
+    )
 
 
 class HttpMethods(str, Enum):
@@ -48,7 +76,17 @@ async def request(
 ) -> Ok[str | js_array | js_object | T | list[T]] | Err[ClientError | JSONDecodeError]:
     """
     Generic method for making a request
+
+    Inside a deadline (see `fateful.timeouts.deadline` and `AsyncTry.timeout`), the
+    remaining budget caps the total timeout of the request and an expired deadline
+    gives Err(TimeoutError) without sending anything. Timeouts give Err too.
     """
+    client_error = _client_error()
+    budget = remaining()
+    if budget is not None:
+        if budget <= 0:
+            return Err(TimeoutError("deadline exceeded"))
+        kwargs["timeout"] = _budget_timeout(kwargs.get("timeout"), budget)
     try:
         async with session.request(method.value, url, **kwargs) as resp:
             try:
@@ -59,10 +97,10 @@ async def request(
                 if is_json:
                     return try_parse(resp_as_text, object_hook=object_hook)
                 return Ok(resp_as_text)
-            except ClientError as e:  # pragma: no cover
+            except client_error as e:  # pragma: no cover
                 logging.error(e)
                 return Err(e)
-    except ClientError as e:
+    except (client_error, asyncio.TimeoutError) as e:
         logging.exception(e)
         return Err(e)
 
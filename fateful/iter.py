@@ -0,0 +1,229 @@
+import itertools
+import typing as t
+from collections import deque
+
+from fateful.monad.option import Empty, Some
+from fateful.monad.result import Err, Ok
+
+T = t.TypeVar("T")
+U = t.TypeVar("U")
+C = t.TypeVar("C")
+T_err = t.TypeVar("T_err", bound=Exception)
+
+Container = t.Union[Some[T], Empty, Ok[T], Err[t.Any]]
+Flavour = type[Some[t.Any]] | type[Ok[t.Any]] | None
+
+
+def collect(
+    containers: t.Iterable[Container[T]],
+    factory: t.Callable[[t.Iterator[T]], C],
+    *,
+    flavour: Flavour = None,
+) -> "Some[C] | Empty | Ok[C] | Err[t.Any]":
+    """
+    Collect the values of an iterable of options or results into a collection built
+    by factory. Iteration stops at the first `Empty` / `Err`, which is returned.
+
+    The values are streamed to factory, so no intermediate list is built.
+
+    Args:
+        containers (t.Iterable[Container[T]]): options or results.
+        factory (t.Callable[[t.Iterator[T]], C]): collection constructor,
+            e.g. `list`, `set`, `dict` or `sum`.
+        flavour (type[Some] | type[Ok] | None, optional): container of the
+            collection. Defaults to None, the flavour of the first container, `Some`
+            for an empty iterable.
+
+    Returns:
+        Some[C] | Ok[C] if all containers hold a value, the first Empty / Err
+        otherwise.
+
+    ```python
+    assert collect([Ok(1), Ok(2)], set) == Ok({1, 2})
+    assert collect([Some(("a", 1))], dict) == Some({"a": 1})
+    assert collect([Some(1), Null, Some(2)], list) == Null
+    assert collect([], list, flavour=Ok) == Ok([])
+    ```
+    """
+    if flavour not in (None, Some, Ok):
+        raise TypeError("flavour must be Some or Ok")
+    failure: list[t.Any] = []
+    wrap: list[t.Callable[[t.Any], t.Any]] = [flavour or Some]
+
+    def values() -> t.Iterator[T]:
+        for i, container in enumerate(containers):
+            if isinstance(container, (Empty, Err)):
+                failure.append(container)
+                return
+            if i == 0 and flavour is None and isinstance(container, Ok):
+                wrap[0] = Ok
+            yield container._under
+
+    collection = factory(values())
+    if failure:
+        return failure[0]
+    return wrap[0](collection)
+
+
+def sequence(
+    containers: t.Iterable[Container[T]], *, flavour: Flavour = None
+) -> "Some[list[T]] | Empty | Ok[list[T]] | Err[t.Any]":
+    """
+    Turn an iterable of options (resp. results) into an option (resp. result) of a
+    list, stopping at the first `Empty` / `Err`.
+
+    Args:
+        containers (t.Iterable[Container[T]]): options or results.
+        flavour (type[Some] | type[Ok] | None, optional): see `collect`.
+
+    Returns:
+        Some[list[T]] | Ok[list[T]] if all containers hold a value, the first
+        Empty / Err otherwise.
+
+    ```python
+    assert sequence([Some(1), Some(2)]) == Some([1, 2])
+    assert sequence(sync_try(int)(v) for v in ["1", "x", "3"]).is_error()
+    ```
+    """
+    return collect(containers, list, flavour=flavour)
+
+
+def traverse(
+    fn: t.Callable[[U], Container[T]],
+    iterable: t.Iterable[U],
+    *,
+    flavour: Flavour = None,
+) -> "Some[list[T]] | Empty | Ok[list[T]] | Err[t.Any]":
+    """
+    Apply fn to each item and sequence the results. fn is not called anymore once
+    an `Empty` / `Err` has been returned.
+
+    Args:
+        fn (t.Callable[[U], Container[T]]): function returning an option or a result.
+        iterable (t.Iterable[U]): items.
+        flavour (type[Some] | type[Ok] | None, optional): see `collect`, e.g. `Ok`
+            so that an empty iterable gives `Ok([])` for a fn returning results.
+
+    Returns:
+        Some[list[T]] | Ok[list[T]] if fn returned values only, the first
+        Empty / Err otherwise.
+
+    ```python
+    assert traverse(sync_try(int), ["1", "2"]) == Ok([1, 2])
+    ```
+    """
+    return sequence(map(fn, iterable), flavour=flavour)
+
+
+def filter_some(options: t.Iterable[Some[T] | Empty]) -> t.Iterator[T]:
+    """
+    Lazily yield the values of the `Some` containers, skipping `Empty` ones.
+
+    ```python
+    assert list(filter_some([Some(1), Null, Some(2)])) == [1, 2]
+    ```
+    """
+    for option in options:
+        if isinstance(option, Some):
+            yield option._under
+
+
+def filter_ok(results: t.Iterable[Ok[T] | Err[t.Any]]) -> t.Iterator[T]:
+    """
+    Lazily yield the values of the `Ok` containers, skipping `Err` ones.
+
+    ```python
+    assert list(filter_ok([Ok(1), Err(ValueError())])) == [1]
+    ```
+    """
+    for result in results:
+        if isinstance(result, Ok):
+            yield result._under
+
+
+def partition_results(
+    results: t.Iterable[Ok[T] | Err[T_err]], maxsize: int = 1024
+) -> tuple[t.Iterator[T], t.Iterator[T_err]]:
+    """
+    Split an iterable of results into two lazy iterators, one over the values of the
+    `Ok` containers and one over the exceptions of the `Err` containers. The source is
+    consumed once.
+
+    Items read from the source for the other iterator are buffered until it
+    consumes them. An iterator raises BufferError instead of reading the source when
+    the buffer of the other one holds maxsize items, so memory stays bounded whatever
+    the size of the source. No item is lost: once the other iterator has consumed
+    its buffered items, the raising one can be iterated again. Consume both
+    iterators in an interleaved fashion (e.g. with `zip_longest`) or use
+    `filter_ok` if only one side is needed.
+
+    Args:
+        results (t.Iterable[Ok[T] | Err[T_err]]): results.
+        maxsize (int, optional): maximum number of buffered items per side.
+            Defaults to 1024.
+
+    Returns:
+        tuple[t.Iterator[T], t.Iterator[T_err]]: values and exceptions.
+
+    ```python
+    oks, errors = partition_results(sync_try(int)(v) for v in ["1", "x", "3"])
+    assert list(oks) == [1, 3]
+    assert [type(e) for e in errors] == [ValueError]
+    ```
+    """
+    source = iter(results)
+    oks: deque[t.Any] = deque()
+    errors: deque[t.Any] = deque()
+    return (
+        _Side(source, True, oks, errors, maxsize),
+        _Side(source, False, errors, oks, maxsize),
+    )
+
+
+class _Side:
+    # an iterator, not a generator: it can still be resumed after a BufferError
+    __slots__ = ("source", "is_ok", "own", "other", "maxsize")
+
+    def __init__(
+        self,
+        source: t.Iterator[t.Any],
+        is_ok: bool,
+        own: deque[t.Any],
+        other: deque[t.Any],
+        maxsize: int,
+    ) -> None:
+        self.source = source
+        self.is_ok = is_ok
+        self.own = own
+        self.other = other
+        self.maxsize = maxsize
+
+    def __iter__(self) -> "_Side":
+        return self
+
+    def __next__(self) -> t.Any:
+        own, other = self.own, self.other
+        while not own:
+            # raised before reading, the item would have nowhere to go
+            if len(other) >= self.maxsize:
+                raise BufferError(f"more than {self.maxsize} items buffered")
+            result = next(self.source)
+            if isinstance(result, Ok) is self.is_ok:
+                return result._under
+            other.append(result._under)
+        return own.popleft()
+
+
+def chunked(iterable: t.Iterable[T], size: int) -> t.Iterator[list[T]]:
+    """
+    Lazily split an iterable into lists of at most size items.
+
+    ```python
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    ```
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
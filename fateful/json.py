@@ -1,18 +1,12 @@
 import typing as t
+from json.decoder import JSONDecodeError
 
-from fateful.container import opt_dict, opt_list
+from fateful.container import _json, opt_dict, opt_list
 from fateful.monad.result import sync_try
 
-try:
-    import orjson as json  # type: ignore
-except ImportError:
-    import json  # type: ignore
-
-from json.decoder import JSONDecodeError
-
-js_object: t.TypeAlias = opt_dict[str, t.Any | "js_array"]
+js_object: t.TypeAlias = opt_dict[str, t.Union[t.Any, "js_array"]]
 
-js_array: t.TypeAlias = opt_list[js_object | t.Any | "js_array"]
+js_array: t.TypeAlias = opt_list[t.Union[js_object, t.Any, "js_array"]]
 
 
 T = t.TypeVar("T")
@@ -26,7 +20,7 @@ def parse(
 ) -> js_array | js_object | list[T] | T:
     """Parse a JSON string into a JsObject or JsArray or
     a sequence of arbitrary objects."""
-    value = json.loads(string, **kwargs)
+    value = _json().loads(string, **kwargs)
     is_list = isinstance(value, t.Sequence)
     if object_hook is None:
         if is_list:
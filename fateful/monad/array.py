@@ -0,0 +1,613 @@
+import re
+import typing as t
+
+from fateful.monad.option import Empty, Null, Some
+from fateful.monad.result import Err, ErrorCode, Ok, Result
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+T = t.TypeVar("T")
+U = t.TypeVar("U")
+T_err = t.TypeVar("T_err", bound=Exception)
+
+# python scalar types that can be stored in a compact `array.array` when numpy is
+# not installed
+_TYPECODES: dict[t.Any, str] = {int: "q", float: "d", bool: "b"}
+
+# python type of the values of each numpy dtype kind
+_KINDS: dict[str, type] = {
+    "i": int,
+    "u": int,
+    "f": float,
+    "b": bool,
+    "c": complex,
+    "U": str,
+    "S": bytes,
+}
+
+# numpy dtype names understood without numpy, e.g. "int64" or "float32"
+_NAMES = re.compile(r"(?P<name>u?int|float|bool|complex|str|bytes)\d*_?")
+_NAME_TYPES: dict[str, type] = {
+    "int": int,
+    "uint": int,
+    "float": float,
+    "bool": bool,
+    "complex": complex,
+    "str": str,
+    "bytes": bytes,
+}
+
+
+def _scalar_type(dtype: t.Any) -> type | None:
+    """
+    python type of the values stored with dtype, None for python objects.
+    Raise TypeError for dtypes the buffers do not support.
+    """
+    if dtype is None:
+        return None
+    if np is not None:
+        try:
+            kind = np.dtype(dtype).kind
+        except TypeError as e:
+            raise TypeError(f"Unsupported dtype {dtype!r}") from e
+        if kind == "O":
+            return None
+        if kind not in _KINDS:
+            raise TypeError(f"Unsupported dtype {dtype!r}")
+        return _KINDS[kind]
+    if isinstance(dtype, type):
+        return dtype
+    match = _NAMES.fullmatch(dtype) if isinstance(dtype, str) else None
+    if match is None:
+        raise TypeError(f"Unsupported dtype {dtype!r}")
+    return _NAME_TYPES[match["name"]]
+
+
+def _buffer(values: list[t.Any], dtype: t.Any = None) -> t.Any:
+    """
+    build a value buffer from a list: a numpy array when numpy is installed,
+    an `array.array` for known scalar dtypes or the list itself otherwise
+    """
+    if np is not None:
+        if dtype is None:
+            # fromiter keeps nested sequences as objects instead of adding dimensions
+            return np.fromiter(values, dtype=object, count=len(values))
+        return np.asarray(values, dtype=dtype)
+    typecode = _TYPECODES.get(_scalar_type(dtype))
+    if typecode is not None:
+        from array import array
+
+        return array(typecode, values)
+    return values
+
+
+def _python(values: t.Any, dtype: t.Any) -> t.Sequence[t.Any]:
+    """
+    values of a buffer as python objects, whatever the backend: numpy scalars and
+    the 0 / 1 of a bool `array.array` are converted
+    """
+    if np is not None and isinstance(values, np.ndarray):
+        return values.tolist()
+    if _scalar_type(dtype) is bool:
+        return [bool(v) for v in values]
+    return values
+
+
+def _python_item(value: t.Any, dtype: t.Any) -> t.Any:
+    """one value of a buffer as a python object, see `_python`"""
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    if np is None and _scalar_type(dtype) is bool:
+        return bool(value)
+    return value
+
+
+def _mask(flags: t.Iterable[bool]) -> t.Any:
+    """build a presence mask: a numpy bool array or a bytearray"""
+    if np is not None:
+        return np.fromiter(flags, dtype=bool)
+    return bytearray(flags)
+
+
+def _fill(dtype: t.Any) -> t.Any:
+    """placeholder stored in the value buffer for missing values"""
+    scalar = _scalar_type(dtype)
+    return None if scalar is None else scalar()
+
+
+class OptionArray(t.Generic[T]):
+    """
+    Columnar counterpart of `Some` / `Empty`: a whole column of optional values is
+    kept as one value buffer plus a presence mask, instead of one container per
+    value.
+
+    Buffers are numpy arrays when numpy is installed, `array.array` / list
+    otherwise. Either way the values given to functions and read back from the
+    array are python objects, e.g. `int` rather than `numpy.int64`.
+
+    ```python
+    x = opt_array([1, None, 3], dtype=int)
+    assert x.map(lambda v: v * 2).to_list() == [Some(2), Null, Some(6)]
+    assert list(x.or_(0)) == [1, 0, 3]
+    ```
+    """
+
+    __slots__ = ("_values", "_mask", "_dtype")
+
+    def __init__(self, values: t.Any, mask: t.Any, dtype: t.Any = None) -> None:
+        """
+        Args:
+            values: value buffer, missing positions hold an arbitrary placeholder.
+            mask: presence mask of the same length as values.
+            dtype: dtype of the value buffer.
+        """
+        if len(values) != len(mask):
+            raise ValueError("values and mask must have the same length")
+        self._values = values
+        self._mask = mask
+        self._dtype = dtype
+
+    @classmethod
+    def from_iterable(
+        cls, iterable: t.Iterable[T | None], dtype: t.Any = None
+    ) -> "OptionArray[T]":
+        """
+        Build an OptionArray from raw values, None being a missing value like in `opt`.
+
+        Args:
+            iterable (t.Iterable[T | None]): raw values.
+            dtype (t.Any, optional): dtype of the buffer, e.g. `int` or `float`.
+                Defaults to None meaning python objects.
+
+        Returns:
+            OptionArray[T]: the columnar option.
+        """
+        fill = _fill(dtype)
+        values: list[t.Any] = []
+        flags: list[bool] = []
+        for value in iterable:
+            if value is None:
+                values.append(fill)
+                flags.append(False)
+            else:
+                values.append(value)
+                flags.append(True)
+        return cls(_buffer(values, dtype), _mask(flags), dtype)
+
+    @classmethod
+    def from_options(
+        cls, options: t.Iterable[Some[T] | Empty], dtype: t.Any = None
+    ) -> "OptionArray[T]":
+        """
+        Build an OptionArray from an iterable of `Some` / `Empty`.
+
+        Args:
+            options (t.Iterable[Some[T] | Empty]): containers to pack.
+            dtype (t.Any, optional): dtype of the buffer. Defaults to None.
+
+        Returns:
+            OptionArray[T]: the columnar option.
+        """
+        return cls.from_iterable((o.or_none() for o in options), dtype)
+
+    def is_some(self) -> t.Any:
+        """
+        Returns:
+            the presence mask, True where a value is present.
+        """
+        return self._mask
+
+    def is_empty(self) -> t.Any:
+        """
+        Returns:
+            the absence mask, True where a value is missing.
+        """
+        if np is not None:
+            return ~self._mask
+        return bytearray(not m for m in self._mask)
+
+    def count(self) -> int:
+        """
+        Returns:
+            int: number of present values.
+        """
+        if np is not None:
+            return int(np.count_nonzero(self._mask))
+        return sum(self._mask)
+
+    def _present(self) -> t.Any:
+        if np is not None:
+            return self._values[self._mask]
+        return [v for v, m in zip(self._values, self._mask) if m]
+
+    def map(
+        self,
+        fn: t.Callable[[T], U | None] | t.Callable[[t.Any], t.Any],
+        *,
+        vectorized: bool = False,
+        dtype: t.Any = None,
+    ) -> "OptionArray[U]":
+        """
+        Apply a function to every present value. As in `Some.map`, a None result
+        becomes a missing value.
+
+        Args:
+            fn: function to apply.
+            vectorized (bool, optional): call fn once with the buffer of present
+                values (a numpy array or a list) instead of once per value. It must
+                return a sequence of the same length. Defaults to False.
+            dtype (t.Any, optional): dtype of the resulting buffer. Defaults to None.
+
+        Returns:
+            OptionArray[U]: a new OptionArray.
+
+        ```python
+        x = opt_array([1.0, None, 4.0], dtype=float)
+        x.map(np.sqrt, vectorized=True, dtype=float)  # [Some(1.0), Null, Some(2.0)]
+        ```
+        """
+        if vectorized and np is not None:
+            return self._map_numpy(fn, dtype)
+        if vectorized:
+            mapped: t.Iterator[t.Any] = iter(fn(self._present()))
+        else:
+            values = _python(self._values, self._dtype)
+            mapped = (fn(v) for v, m in zip(values, self._mask) if m)
+        fill = _fill(dtype)
+        values: list[t.Any] = []
+        flags: list[bool] = []
+        for present in self._mask:
+            value = next(mapped) if present else None
+            if value is None:
+                values.append(fill)
+                flags.append(False)
+            else:
+                values.append(value)
+                flags.append(True)
+        return OptionArray(_buffer(values, dtype), _mask(flags), dtype)
+
+    def _map_numpy(self, fn: t.Callable[[t.Any], t.Any], dtype: t.Any) -> "OptionArray":
+        mapped = np.asarray(fn(self._present()), dtype=dtype)
+        if len(mapped) != self.count():
+            raise ValueError("vectorized function must preserve the length")
+        values = np.zeros(len(self), dtype=mapped.dtype)
+        values[self._mask] = mapped
+        mask = self._mask.copy()
+        if mapped.dtype == object:
+            mask[self._mask] = np.not_equal(mapped, None)
+        return OptionArray(values, mask, dtype)
+
+    def filter(
+        self,
+        predicate: t.Callable[[T], bool] | t.Callable[[t.Any], t.Any],
+        *,
+        vectorized: bool = False,
+    ) -> "OptionArray[T]":
+        """
+        Mark as missing every present value that does not satisfy the predicate.
+        The length of the array is preserved.
+
+        Args:
+            predicate: predicate to test.
+            vectorized (bool, optional): call the predicate once with the buffer of
+                present values, it must return a sequence of booleans.
+                Defaults to False.
+
+        Returns:
+            OptionArray[T]: a new OptionArray sharing the same value buffer.
+
+        ```python
+        x = opt_array([1, 2, None, 4])
+        x.filter(lambda v: v % 2 == 0).to_list()  # [Null, Some(2), Null, Some(4)]
+        ```
+        """
+        if vectorized:
+            kept: t.Iterator[t.Any] = iter(predicate(self._present()))
+        else:
+            values = _python(self._values, self._dtype)
+            kept = (predicate(v) for v, m in zip(values, self._mask) if m)
+        mask = _mask(bool(m and next(kept)) for m in self._mask)
+        return OptionArray(self._values, mask, self._dtype)
+
+    def flatten(self) -> "OptionArray[t.Any]":
+        """
+        Flatten nested options, i.e. present `Some(x)` values become x and present
+        `Empty` values become missing.
+
+        Returns:
+            OptionArray[t.Any]: a new OptionArray.
+        """
+
+        def unwrap(value: t.Any) -> t.Any:
+            while isinstance(value, (Some, Empty)):
+                value = value._under
+            return value
+
+        return self.map(unwrap, dtype=self._dtype)
+
+    def or_(self, obj: U) -> t.Any:
+        """
+        Return the value buffer with missing values replaced by obj.
+
+        Args:
+            obj (U): value for missing positions.
+
+        Returns:
+            a numpy array or a list.
+
+        ```python
+        assert list(opt_array([1, None]).or_(0)) == [1, 0]
+        ```
+        """
+        if np is not None:
+            result = self._values.copy()
+            result[~self._mask] = obj
+            return result
+        values = _python(self._values, self._dtype)
+        return [v if m else obj for v, m in zip(values, self._mask)]
+
+    def or_none(self) -> list[T | None]:
+        """
+        Returns:
+            list[T | None]: values, None for missing positions.
+        """
+        values = _python(self._values, self._dtype)
+        return [v if m else None for v, m in zip(values, self._mask)]
+
+    def to_list(self) -> list[Some[T] | Empty]:
+        """
+        Unpack the array into a list of `Some` / `Empty`.
+
+        Returns:
+            list[Some[T] | Empty]: the containers.
+        """
+        values = _python(self._values, self._dtype)
+        return [Some(v) if m else Null for v, m in zip(values, self._mask)]
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __getitem__(self, index: int) -> Some[T] | Empty:
+        if not self._mask[index]:
+            return Null
+        return Some(_python_item(self._values[index], self._dtype))
+
+    def __iter__(self) -> t.Iterator[Some[T] | Empty]:
+        for v, m in zip(_python(self._values, self._dtype), self._mask):
+            yield Some(v) if m else Null
+
+    def __str__(self) -> str:
+        return f"<OptionArray {self.or_none()}>"
+
+
+class ResultArray(t.Generic[T, T_err]):
+    """
+    Columnar counterpart of `Ok` / `Err`: successful values are kept in one value
+    buffer, failures in a side table mapping row indexes to exceptions.
+
+    ```python
+    x = sync_try_array(lambda v: 1 / v)([1, 0, 2])
+    assert x.errors().keys() == {1}
+    assert list(x.or_(0.0)) == [1.0, 0.0, 0.5]
+    ```
+    """
+
+    __slots__ = ("_values", "_errors", "_dtype")
+
+    def __init__(
+        self, values: t.Any, errors: dict[int, T_err], dtype: t.Any = None
+    ) -> None:
+        """
+        Args:
+            values: value buffer, failed rows hold an arbitrary placeholder.
+            errors (dict[int, T_err]): exceptions of the failed rows by index.
+            dtype: dtype of the value buffer.
+        """
+        self._values = values
+        self._errors = errors
+        self._dtype = dtype
+
+    @classmethod
+    def from_results(
+        cls, results: t.Iterable[Result[T, T_err]], dtype: t.Any = None
+    ) -> "ResultArray[T, T_err]":
+        """
+        Build a ResultArray from an iterable of `Ok` / `Err`.
+
+        Args:
+            results (t.Iterable[Result[T, T_err]]): containers to pack.
+            dtype (t.Any, optional): dtype of the buffer. Defaults to None.
+
+        Returns:
+            ResultArray[T, T_err]: the columnar result.
+        """
+        fill = _fill(dtype)
+        values: list[t.Any] = []
+        errors: dict[int, t.Any] = {}
+        for i, result in enumerate(results):
+            if isinstance(result, Err):
+                errors[i] = result._under
+                values.append(fill)
+            else:
+                values.append(result._under)
+        return cls(_buffer(values, dtype), errors, dtype)
+
+    def is_ok(self) -> t.Any:
+        """
+        Returns:
+            mask, True where the row is successful.
+        """
+        return _mask(i not in self._errors for i in range(len(self)))
+
+    def is_error(self) -> t.Any:
+        """
+        Returns:
+            mask, True where the row failed.
+        """
+        return _mask(i in self._errors for i in range(len(self)))
+
+    def errors(self) -> dict[int, T_err]:
+        """
+        Returns:
+            dict[int, T_err]: a copy of the error side table.
+        """
+        return dict(self._errors)
+
+    def map(
+        self,
+        fn: t.Callable[[T], U] | t.Callable[[t.Any], t.Any],
+        *,
+        vectorized: bool = False,
+        dtype: t.Any = None,
+    ) -> "ResultArray[U, T_err | Exception]":
+        """
+        Apply a function to every successful value, an exception raised for a row is
+        recorded in the error side table like in `Ok.map`.
+
+        Args:
+            fn: function to apply.
+            vectorized (bool, optional): call fn once with the buffer of successful
+                values. If it raises, every successful row fails with the same
+                exception. Defaults to False.
+            dtype (t.Any, optional): dtype of the resulting buffer. Defaults to None.
+
+        Returns:
+            ResultArray[U, T_err | Exception]: a new ResultArray.
+        """
+        errors: dict[int, t.Any] = dict(self._errors)
+        ok_rows = [i for i in range(len(self)) if i not in errors]
+        fill = _fill(dtype)
+        values: list[t.Any] = [fill] * len(self)
+        if vectorized:
+            if np is not None:
+                ok_values: t.Any = self._values[ok_rows]
+            else:
+                ok_values = [self._values[i] for i in ok_rows]
+            try:
+                # numpy scalars would be stored as is in an object buffer
+                mapped = list(_python(fn(ok_values), None))
+            except Exception as e:
+                errors.update((i, e) for i in ok_rows)
+            else:
+                for i, value in zip(ok_rows, mapped):
+                    values[i] = _python_item(value, None)
+        else:
+            python_values = _python(self._values, self._dtype)
+            for i in ok_rows:
+                try:
+                    values[i] = fn(python_values[i])
+                except Exception as e:
+                    errors[i] = e
+        return ResultArray(_buffer(values, dtype), errors, dtype)
+
+    def flatten(self) -> "ResultArray[t.Any, t.Any]":
+        """
+        Flatten nested results, i.e. `Ok(x)` values become x and `Err(e)` values
+        become failed rows.
+
+        Returns:
+            ResultArray[t.Any, t.Any]: a new ResultArray.
+        """
+        fill = _fill(self._dtype)
+        errors: dict[int, t.Any] = dict(self._errors)
+        values: list[t.Any] = list(_python(self._values, self._dtype))
+        for i, value in enumerate(values):
+            if i in errors:
+                continue
+            while isinstance(value, (Ok, Err)):
+                value = value._under
+            if isinstance(value, (Exception, ErrorCode)):
+                errors[i] = value
+                value = fill
+            values[i] = value
+        return ResultArray(_buffer(values, self._dtype), errors, self._dtype)
+
+    def or_(self, obj: U) -> t.Any:
+        """
+        Return the value buffer with failed rows replaced by obj.
+
+        Args:
+            obj (U): value for failed rows.
+
+        Returns:
+            a numpy array or a list.
+        """
+        if np is not None:
+            result = self._values.copy()
+            if self._errors:
+                result[list(self._errors)] = obj
+            return result
+        values = _python(self._values, self._dtype)
+        return [obj if i in self._errors else v for i, v in enumerate(values)]
+
+    def to_list(self) -> list[Result[T, T_err]]:
+        """
+        Unpack the array into a list of `Ok` / `Err`.
+
+        Returns:
+            list[Result[T, T_err]]: the containers.
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> Result[T, T_err]:
+        if index < 0:
+            index += len(self)
+        error = self._errors.get(index)
+        if error is not None:
+            return Err(error)
+        return Ok(_python_item(self._values[index], self._dtype))
+
+    def __iter__(self) -> t.Iterator[Result[T, T_err]]:
+        errors = self._errors
+        for i, value in enumerate(_python(self._values, self._dtype)):
+            yield Err(errors[i]) if i in errors else Ok(value)
+
+    def __str__(self) -> str:
+        return f"<ResultArray {[str(r) for r in self]}>"
+
+
+def sync_try_array(
+    f: t.Callable[[T], U],
+    exc: type[T_err] | tuple[type[T_err], ...] = (Exception,),  # type: ignore
+    dtype: t.Any = None,
+) -> t.Callable[[t.Iterable[T]], ResultArray[U, T_err]]:
+    """
+    Columnar `sync_try`: run a function that may raise an exception on every element
+    of an iterable and pack the outcomes into a ResultArray.
+
+    Args:
+        f (t.Callable[[T], U]): function to run.
+        exc (tuple[type[T_err], ...], optional): exceptions to catch, other
+            exceptions are raised. Defaults to (Exception,).
+        dtype (t.Any, optional): dtype of the value buffer. Defaults to None.
+
+    ```python
+    parsed = sync_try_array(int, ValueError)(["1", "x", "3"])
+    assert parsed.to_list() == [Ok(1), Err(ValueError(...)), Ok(3)]
+    ```
+    """
+    errors_types = exc if isinstance(exc, tuple) else (exc,)
+
+    def inner(iterable: t.Iterable[T]) -> ResultArray[U, T_err]:
+        fill = _fill(dtype)
+        values: list[t.Any] = []
+        errors: dict[int, t.Any] = {}
+        for i, item in enumerate(iterable):
+            try:
+                values.append(f(item))
+            except errors_types as e:
+                errors[i] = e
+                values.append(fill)
+        return ResultArray(_buffer(values, dtype), errors, dtype)
+
+    return inner
+
+
+# aliases
+opt_array = option_array = OptionArray.from_iterable
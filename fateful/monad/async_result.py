@@ -1,12 +1,29 @@
 import abc
 import asyncio
+import functools
+import inspect
+import sys
+import types
 import typing as t
 from inspect import isawaitable
 
 import typing_extensions as te
 
+from fateful.breaker import CircuitBreaker, CircuitOpenError
+from fateful.hedge import LatencyPercentile
 from fateful.monad.func import Default, MatchableMixin, When
-from fateful.monad.result import Err, Ok, Result, ResultShortcutError
+from fateful.monad.result import (
+    Err,
+    Ok,
+    Result,
+    ResultShortcutError,
+    TracebackPolicy,
+)
+from fateful.retry import Backoff, Jitter, RetryBudget, RetryEvent, delays
+from fateful.timeouts import deadline, remaining, wait_until
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import ExceptionGroup
 
 P_mapper = t.ParamSpec("P_mapper")
 P = t.ParamSpec("P")
@@ -27,7 +44,236 @@ async def _exec(
     return t.cast(U, current_result)
 
 
+# kinds of the steps of an AsyncTry, map-like steps first
+_MAP, _MAP_ASYNC, _GETATTR, _RECOVER, _RECOVER_WITH = range(5)
+
+
+class _Steps:
+    # persistent list of steps: a step links a node to the steps it extends in O(1),
+    # the flat tuple run by AsyncTry._run is built on the first run of the node
+    __slots__ = ("parent", "step", "_flat")
+
+    def __init__(self, parent: "_Steps | None", step: tuple[int, t.Any]) -> None:
+        self.parent = parent
+        self.step = step
+        self._flat: tuple[tuple[int, t.Any], ...] | None = None
+
+    def flat(self) -> tuple[tuple[int, t.Any], ...]:
+        flat = self._flat
+        if flat is None:
+            tail = []
+            node: _Steps | None = self
+            while node is not None and node._flat is None:
+                tail.append(node.step)
+                node = node.parent
+            head = () if node is None else node._flat
+            flat = self._flat = head + tuple(reversed(tail))  # type: ignore
+        return flat
+
+
+# builtin types of values never awaitable, checked before the slower isawaitable
+_plain_types = frozenset(
+    {int, float, complex, str, bytes, bool, type(None), list, tuple, dict, set}
+)
+
+
+def _await_iter(value: t.Awaitable[U]) -> t.Generator[t.Any, None, U]:
+    # generator based coroutines have no __await__
+    if type(value) is types.GeneratorType:
+        return value  # type: ignore
+    return value.__await__()  # type: ignore
+
+
+_DONE = object()
+
+
+def _bounded(
+    tries: t.Iterable[t.Any], limit: int | None
+) -> tuple[t.Iterator[t.Any], int]:
+    # iterator shared by the workers and number of workers
+    if limit is None:
+        items = list(tries)
+        return iter(items), max(len(items), 1)
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return iter(tries), limit
+
+
+def _retrieve(future: asyncio.Future[t.Any]) -> None:
+    # avoid "exception was never retrieved" warnings
+    if not future.cancelled():
+        future.exception()
+
+
+async def _settle(try_: "AsyncTry[t.Any, U, Exception]") -> Result[U, Exception]:
+    # never raises but for cancellation
+    try:
+        return await try_
+    except Exception as e:
+        return Err(e, try_.traceback_policy)
+
+
+async def _timed(
+    chain: "AsyncTry[t.Any, U, t.Any]", seconds: float | None, *args: t.Any, **kw: t.Any
+) -> U:
+    # head of the AsyncTry returned by timeout, args are given to chain
+    if args or kw:
+        chain = chain(*args, **kw)
+    with deadline(seconds) as at:
+        result = await (chain if at is None else wait_until(chain, at))
+    if isinstance(result, Err):
+        raise result._under
+    return result._under
+
+
+async def _retried(
+    chain: "AsyncTry[t.Any, U, t.Any]",
+    attempts: int,
+    next_delay: t.Callable[[int], float],
+    on: tuple[type[Exception], ...],
+    budget: RetryBudget | None,
+    hook: t.Callable[[RetryEvent], t.Any] | None,
+    *args: t.Any,
+    **kw: t.Any,
+) -> U:
+    # head of the AsyncTry returned by retry, args are given to chain
+    if args or kw:
+        chain = chain(*args, **kw)
+    attempt = 0
+    while True:
+        attempt += 1
+        result = await chain
+        failed = isinstance(result, Err)
+        if budget is not None:
+            budget.record(not failed)
+        wait: float | None = None
+        if (
+            failed
+            and attempt < attempts
+            and isinstance(result._under, on)
+            and (budget is None or budget.allows_retry())
+        ):
+            wait = next_delay(attempt)
+            left = remaining()
+            if left is not None and wait >= left:
+                wait = None
+        if hook is not None:
+            hook(RetryEvent(attempt, result, wait, wait is None))
+        if wait is None:
+            break
+        await asyncio.sleep(wait)
+    if failed:
+        raise result._under
+    return result._under
+
+
+async def _guarded(
+    chain: "AsyncTry[t.Any, U, t.Any]", cb: CircuitBreaker, *args: t.Any, **kw: t.Any
+) -> U:
+    # head of the AsyncTry returned by breaker, args are given to chain
+    if args or kw:
+        chain = chain(*args, **kw)
+    if not cb.acquire():
+        raise CircuitOpenError(cb.name, cb.retry_after())
+    try:
+        result = await chain
+    except Exception as e:
+        cb.record(not cb.is_failure(e))
+        raise
+    except BaseException:
+        cb.release()
+        raise
+    if isinstance(result, Err):
+        cb.record(not cb.is_failure(result._under))
+        raise result._under
+    cb.record(True)
+    return result._under
+
+
+async def _first(
+    tries: tuple["AsyncTry[t.Any, U, Exception]", ...], ok_only: bool
+) -> Result[U, Exception]:
+    # first result, or first Ok, of tries run concurrently, the others are cancelled
+    if not tries:
+        raise ValueError("at least one AsyncTry is needed")
+    runs = [asyncio.ensure_future(_settle(try_)) for try_ in tries]
+    pending = set(runs)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for run in runs:
+                # in the order of tries when several complete together
+                if run in done and (not ok_only or run.result().is_ok()):
+                    return run.result()
+    finally:
+        for run in pending:
+            run.cancel()
+            run.add_done_callback(_retrieve)
+    errors = [run.result()._under for run in runs]
+    return Err(
+        ExceptionGroup("all the AsyncTry failed", errors), tries[0].traceback_policy
+    )
+
+
+async def _hedged(
+    chain: "AsyncTry[t.Any, U, t.Any]",
+    after: float | LatencyPercentile,
+    max_extra: int,
+    *args: t.Any,
+    **kw: t.Any,
+) -> U:
+    # head of the AsyncTry returned by hedge, args are given to chain
+    if args or kw:
+        chain = chain(*args, **kw)
+    tracker = after if isinstance(after, LatencyPercentile) else None
+    delay = after if tracker is None else tracker.delay()
+    loop = asyncio.get_running_loop()
+    started: dict[asyncio.Future[t.Any], float] = {}
+    pending: set[asyncio.Future[t.Any]] = set()
+
+    def launch() -> None:
+        run = asyncio.ensure_future(chain._execute())
+        started[run] = loop.time()
+        pending.add(run)
+
+    launch()
+    # the extra runs start on a fixed schedule, a failed run does not shift it
+    next_at = loop.time() + delay
+    result: t.Any = None
+    try:
+        while pending:
+            timeout = None
+            if len(started) <= max_extra:
+                timeout = max(next_at - loop.time(), 0.0)
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                launch()
+                next_at += delay
+                continue
+            for run in done:
+                pending.discard(run)
+                result = run.result()
+                # every completed run, not only the winners, or the percentile
+                # would be biased towards the fast hedged runs
+                if tracker is not None:
+                    tracker.record(loop.time() - started[run])
+                if not isinstance(result, Err):
+                    return result._under
+    finally:
+        # the slower runs are cancelled without waiting for them
+        for run in pending:
+            run.cancel()
+            run.add_done_callback(_retrieve)
+    raise result._under
+
+
 class AsyncTryBase(abc.ABC, t.Generic[P, V_co, T_err]):
+    __slots__ = ()
+
     @abc.abstractmethod
     async def is_ok(self) -> bool:
         ...
@@ -128,18 +374,35 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
     z = await async_try(f, ZeroDivisionError)(0).or_(0)
     assert z == 0
     ```
+
+    An AsyncTry is never modified: `map`, `recover`... return new instances, and
+    calling it binds the arguments to a lightweight copy sharing the steps of the
+    chain, so a chain can be built once and reused as a template:
+
+    ```python linenums="1"
+    get_user = async_try(fetch_user).map(to_user).recover_with(anonymous)
+
+    async def handler(request):
+        return await get_user(request.user_id).or_raise()
+    ```
     """
 
+    __slots__ = ("_under", "args", "kwargs", "errors", "traceback_policy", "_steps")
+
     def __init__(
         self,
         aws: t.Callable[P, t.Awaitable[V_co]],
         exc: type[T_err]
         | tuple[type[T_err], ...] = t.cast(tuple[type[T_err], ...], (Exception,)),
+        traceback_policy: TracebackPolicy = TracebackPolicy.KEEP,
     ):
         """
 
         Args:
             aws (t.Callable[P, t.Awaitable[V]]):
+            exc: exceptions turned into Err, others are raised.
+            traceback_policy (TracebackPolicy, optional): what the Err keeps of the
+                traceback. Defaults to TracebackPolicy.KEEP.
 
 
         ```python linenums="1"
@@ -159,6 +422,28 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
         self.args: tuple[t.Any, ...] = ()
         self.kwargs: dict[str, t.Any] = {}
         self.errors = exc if isinstance(exc, tuple) else (exc,)
+        self.traceback_policy = traceback_policy
+        # steps run after aws, see _execute
+        self._steps: _Steps | None = None
+
+    def _copy(
+        self,
+        args: tuple[t.Any, ...],
+        kwargs: dict[str, t.Any],
+        steps: _Steps | None,
+    ) -> "AsyncTry[t.Any, t.Any, T_err]":
+        # bypass __init__, instances are created for each call and each step
+        r: AsyncTry[t.Any, t.Any, T_err] = object.__new__(AsyncTry)
+        r._under = self._under
+        r.args = args
+        r.kwargs = kwargs
+        r.errors = self.errors
+        r.traceback_policy = self.traceback_policy
+        r._steps = steps
+        return r
+
+    def _then(self, kind: int, arg: t.Any) -> "AsyncTry[t.Any, t.Any, T_err]":
+        return self._copy(self.args, self.kwargs, _Steps(self._steps, (kind, arg)))
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> te.Self:
         """
@@ -185,28 +470,245 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
 
         ```
         """
-        self.args = args
-        self.kwargs = kwargs
-        return self
+        # a new instance sharing the steps: an AsyncTry built once is a template
+        # that can be called concurrently with different arguments
+        return t.cast(te.Self, self._copy(args, kwargs, self._steps))
 
-    async def _exec(
-        self,
-        fn: t.Callable[P_mapper, t.Awaitable[U] | U],
-        *args: P_mapper.args,
-        **kwargs: P_mapper.kwargs,
-    ) -> Result[U, T_err]:
+    async def run_many(
+        self, arg_iter: t.Iterable[t.Any], *, limit: int | None = None
+    ) -> list[Result[V_co, T_err]]:
+        """
+        Run the AsyncTry concurrently on each item of arg_iter, passed as the single
+        positional argument of the underlying function.
+
+        Args:
+            arg_iter (t.Iterable[t.Any]): arguments.
+            limit (int | None, optional): maximum number of concurrent runs.
+                Defaults to None, unbounded.
+
+        Returns:
+            list[Result[V_co, T_err]]: one result per item, in the order of the
+            items.
+
+        ```python linenums="1"
+        get_user = async_try(fetch_user).map(to_user).recover_with(anonymous)
+        users = await get_user.run_many([1, 2, 3], limit=2)
+        # [Ok(User(1)), Ok(User(2)), Ok(anonymous)]
+        ```
+        """
+        return await AsyncTry.gather(map(self, arg_iter), limit=limit)
+
+    @staticmethod
+    async def gather(
+        tries: t.Iterable["AsyncTry[t.Any, U, Exception]"],
+        *,
+        limit: int | None = None,
+        ordered: bool = True,
+    ) -> list[Result[U, Exception]]:
+        """
+        Run bound AsyncTry concurrently, at most limit at a time. Exceptions not
+        caught by an AsyncTry are returned as Err too, nothing is raised.
+
+        limit workers pull the AsyncTry from tries as they go: no task is created per
+        AsyncTry and tries is consumed lazily, e.g. a generator of a million
+        AsyncTry only keeps limit of them in memory besides the results.
+
+        Args:
+            tries (t.Iterable[AsyncTry[t.Any, U, Exception]]): bound AsyncTry.
+            limit (int | None, optional): maximum number of concurrent runs.
+                Defaults to None, all at once.
+            ordered (bool, optional): results in the order of tries, or in the
+                order of completion. Defaults to True.
+
+        Returns:
+            list[Result[U, Exception]]: one result per AsyncTry.
+
+        ```python linenums="1"
+        results = await AsyncTry.gather(
+            (try_get(url) for url in urls), limit=20, ordered=False
+        )
+        ```
+        """
+        items, workers = _bounded(tries, limit)
+        indexed = enumerate(items)
+        results: list[t.Any] = []
+
+        async def worker() -> None:
+            for index, try_ in indexed:
+                if ordered:
+                    results.append(None)
+                    results[index] = await _settle(try_)
+                else:
+                    results.append(await _settle(try_))
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
+
+    @staticmethod
+    async def as_completed(
+        tries: t.Iterable["AsyncTry[t.Any, U, Exception]"],
+        *,
+        limit: int | None = None,
+    ) -> t.AsyncIterator[Result[U, Exception]]:
+        """
+        Run bound AsyncTry concurrently, at most limit at a time, and yield their
+        results as soon as they complete, see `gather`.
+
+        Completed results wait in a queue of limit items: a slow consumer pauses the
+        workers and the consumption of tries. Breaking out of the loop cancels the
+        runs in progress.
+
+        ```python linenums="1"
+        async for result in AsyncTry.as_completed(map(fetch, ids), limit=20):
+            ...
+        ```
+        """
+        items, workers = _bounded(tries, limit)
+        queue: asyncio.Queue[t.Any] = asyncio.Queue(workers)
+        failures: list[Exception] = []
+
+        async def worker() -> None:
+            # a worker always sends _DONE, the consumer would wait forever otherwise
+            try:
+                for try_ in items:
+                    await queue.put(await _settle(try_))
+            except Exception as e:
+                # raised by tries, given to the consumer with _DONE
+                failures.append(e)
+            await queue.put(_DONE)
+
+        running = asyncio.gather(*(worker() for _ in range(workers)))
+        try:
+            while workers:
+                result = await queue.get()
+                if result is _DONE:
+                    if failures:
+                        raise failures[0]
+                    workers -= 1
+                else:
+                    yield result
+        finally:
+            # the consumer stopped early
+            running.cancel()
+            running.add_done_callback(_retrieve)
+
+    @staticmethod
+    async def first_ok(*tries: "AsyncTry[t.Any, U, Exception]") -> Result[U, Exception]:
+        """
+        Run bound AsyncTry concurrently and return the first Ok, cancelling the
+        others as soon as it is there, e.g. to query replicas. When all fail, their
+        errors are returned in one Err of ExceptionGroup, in the order of tries.
+
+        Returns:
+            Result[U, Exception]: the first Ok, or Err(ExceptionGroup).
+
+        ```python linenums="1"
+        user = await AsyncTry.first_ok(
+            try_get(f"{primary}/users/1"), try_get(f"{replica}/users/1")
+        )
+        ```
+        """
+        return await _first(tries, True)
+
+    @staticmethod
+    async def race(*tries: "AsyncTry[t.Any, U, Exception]") -> Result[U, Exception]:
+        """
+        Run bound AsyncTry concurrently and return the first result, Ok or Err,
+        cancelling the others, see `first_ok`.
+
+        Returns:
+            Result[U, Exception]: the first result.
+
+        ```python linenums="1"
+        user = await AsyncTry.race(cached_user(1), fetch_user(1))
+        ```
+        """
+        return await _first(tries, False)
+
+    def _run(self) -> t.Generator[t.Any, None, Result[V_co, T_err]]:
+        # a single loop over the flat list of steps. It is a generator delegating to
+        # the awaitables returned by the steps with `yield from`: synchronous steps
+        # run inline, no coroutine is created to run the chain.
+        error: Exception | None = None
+        value: t.Any = None
         try:
-            r: U = await _exec(fn, *args, **kwargs)
+            value = self._under(*self.args, **self.kwargs)
+            while type(value) not in _plain_types and isawaitable(value):
+                value = yield from _await_iter(value)
         except Exception as e:
-            for err in self.errors:
-                if isinstance(e, err):
-                    return Err(e)
-            raise
-        else:
-            return Ok(r)
+            error = e
+        steps = () if self._steps is None else self._steps.flat()
+        for kind, arg in steps:
+            if kind <= _GETATTR:
+                if error is not None:
+                    continue
+                try:
+                    if kind is _MAP:
+                        value = arg(value)
+                    elif kind is _MAP_ASYNC:
+                        value = yield from arg(value).__await__()
+                    else:
+                        value = getattr(value, arg)
+                    while type(value) not in _plain_types and isawaitable(value):
+                        value = yield from _await_iter(value)
+                except Exception as e:
+                    error = e
+            elif error is None:
+                continue
+            elif kind is _RECOVER:
+                fn, a, kw = arg
+                error = None
+                try:
+                    value = fn(*a, **kw)
+                    while type(value) not in _plain_types and isawaitable(value):
+                        value = yield from _await_iter(value)
+                except Exception as e:
+                    error = e
+            else:
+                value, error = arg, None
+        if error is None:
+            return Ok(value)
+        if isinstance(error, self.errors):
+            return Err(error, self.traceback_policy)
+        raise error
 
     async def _execute(self) -> Result[V_co, T_err]:
-        return await self._exec(self._under, *self.args, **self.kwargs)
+        return await self
+
+    def __await__(self) -> t.Generator[t.Any, None, Result[V_co, T_err]]:
+        """
+        `await x` is `await x.execute()`.
+
+        ```python linenums="1"
+        assert await async_try(f, ZeroDivisionError)(1) == Ok(1.0)
+        ```
+        """
+        return self._run()
+
+    def run_sync(self) -> Result[V_co, T_err]:
+        """
+        Run the chain without event loop, e.g. when all its functions are
+        synchronous. Coroutines returned by the steps are run too, as long as they
+        do not wait on the event loop.
+
+        Raises:
+            RuntimeError: a step waits on the event loop, await the AsyncTry instead.
+
+        Returns:
+            Ok[V] | Err[T_err]: the result of the chain.
+
+        ```python linenums="1"
+        parse = async_try(json.loads, ValueError).map(lambda d: d["id"])
+        assert parse('{"id": 1}').run_sync() == Ok(1)
+        ```
+        """
+        run = self._run()
+        try:
+            run.send(None)
+        except StopIteration as stop:
+            return stop.value
+        run.close()
+        raise RuntimeError(f"{self} waits on the event loop, await it instead")
 
     async def execute(self) -> Result[V_co, T_err]:
         """
@@ -227,6 +729,196 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
         result = await self._execute()
         return result
 
+    def timeout(
+        self, seconds: float | None = None
+    ) -> "AsyncTry[P, V_co, T_err | TimeoutError]":
+        """
+        Bound the run of the chain built so far: once seconds have passed, the step
+        in progress is cancelled and the result is Err(TimeoutError).
+
+        The chain runs under a deadline (see `fateful.timeouts.deadline`) shared by
+        all its steps, `recover` fallbacks included, and by the nested timeouts
+        which can only shorten it. `fateful.http` requests made by the steps use
+        the remaining budget as their timeout.
+
+        Args:
+            seconds (float | None, optional): budget. Defaults to None, the deadline
+                of the caller, if any.
+
+        Returns:
+            AsyncTry[P, V_co, T_err | TimeoutError]: new AsyncTry.
+
+        ```python linenums="1"
+        user = await async_try(fetch_user).recover(fetch_cached_user).timeout(0.2)(1)
+        # Err(TimeoutError()) if both calls took more than 200 ms
+        ```
+        """
+        errors = self.errors
+        if not issubclass(TimeoutError, errors):
+            errors = (*errors, TimeoutError)
+        return AsyncTry(
+            functools.partial(_timed, self, seconds),  # type: ignore
+            errors,
+            self.traceback_policy,
+        )
+
+    def retry(
+        self,
+        attempts: int = 3,
+        *,
+        backoff: Backoff = "exponential",
+        delay: float = 0.1,
+        max_delay: float = 10.0,
+        jitter: Jitter = "full",
+        on: type[Exception] | tuple[type[Exception], ...] = (Exception,),
+        budget: RetryBudget | None = None,
+        hook: t.Callable[[RetryEvent], t.Any] | None = None,
+    ) -> "AsyncTry[P, V_co, T_err]":
+        """
+        Run the chain built so far again while it gives an Err of the on types, at
+        most attempts times in total, waiting between attempts (see
+        `fateful.retry.delays`).
+
+        A `RetryBudget` shared by the calls to a dependency stops the retries when
+        too many attempts fail, and no retry is made when its delay would exceed
+        the remaining budget of a deadline (see `timeout`). Exceptions not turned
+        into Err by the chain are raised without retry.
+
+        Args:
+            attempts (int, optional): maximum number of attempts. Defaults to 3.
+            backoff (Backoff, optional): "exponential", "linear", "constant" or a
+                function of the attempt number. Defaults to "exponential".
+            delay (float, optional): base delay in seconds. Defaults to 0.1.
+            max_delay (float, optional): maximum delay in seconds. Defaults to 10.
+            jitter (t.Literal["full", "equal"] | None, optional): randomization of
+                the delays. Defaults to "full".
+            on (tuple[type[Exception], ...], optional): exceptions retried.
+                Defaults to (Exception,).
+            budget (RetryBudget | None, optional): shared retry budget.
+            hook (t.Callable[[RetryEvent], t.Any] | None, optional): called after
+                each attempt, the last one with `final=True`.
+
+        Returns:
+            AsyncTry[P, V_co, T_err]: new AsyncTry.
+
+        ```python linenums="1"
+        budget = RetryBudget()
+        get_user = async_try(fetch_user, ClientError).retry(
+            4, on=ClientConnectionError, budget=budget, hook=log_attempt
+        )
+        await get_user(1)  # Ok(User(1)), or the Err of the last attempt
+        ```
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        return AsyncTry(
+            functools.partial(  # type: ignore
+                _retried,
+                self,
+                attempts,
+                delays(backoff, delay, max_delay, jitter),
+                on if isinstance(on, tuple) else (on,),
+                budget,
+                hook,
+            ),
+            self.errors,
+            self.traceback_policy,
+        )
+
+    def breaker(
+        self, cb: CircuitBreaker
+    ) -> "AsyncTry[P, V_co, T_err | CircuitOpenError]":
+        """
+        Run the chain built so far through a circuit breaker: while it is open, the
+        result is Err(CircuitOpenError) right away, the chain is not run. Results
+        are recorded by the breaker, Err of its `on` types and raised exceptions
+        as failures.
+
+        Args:
+            cb (CircuitBreaker): breaker shared by the calls to a dependency.
+
+        Returns:
+            AsyncTry[P, V_co, T_err | CircuitOpenError]: new AsyncTry.
+
+        ```python linenums="1"
+        users_cb = CircuitBreaker("users", failure_rate=0.5, open_for=10)
+        get_user = async_try(fetch_user, ClientError).breaker(users_cb)
+        await get_user(1)  # Err(CircuitOpenError(...)) while users is down
+        ```
+        """
+        errors = self.errors
+        if not issubclass(CircuitOpenError, errors):
+            errors = (*errors, CircuitOpenError)
+        return AsyncTry(
+            functools.partial(_guarded, self, cb),  # type: ignore
+            errors,
+            self.traceback_policy,
+        )
+
+    def hedge(
+        self, after: float | LatencyPercentile, max_extra: int = 1
+    ) -> "AsyncTry[P, V_co, T_err]":
+        """
+        Hedge the chain built so far: when it has not completed after seconds, run
+        it again concurrently, up to max_extra more times, and keep the first Ok,
+        cancelling the other runs. Only suitable for idempotent calls, e.g. reads.
+
+        The extra runs start after, 2 * after... seconds, a failed run neither
+        starts the next one early nor delays it. When all the runs started so far
+        have failed, the last Err is returned without waiting for the next extra
+        run: hedging cuts the latency, `retry` handles failures.
+
+        Args:
+            after (float | LatencyPercentile): seconds before each extra run, e.g.
+                the p95 latency of the calls, or a `LatencyPercentile` adapting it
+                to the latencies of the completed runs.
+            max_extra (int, optional): maximum number of extra runs. Defaults to 1.
+
+        Returns:
+            AsyncTry[P, V_co, T_err]: new AsyncTry.
+
+        ```python linenums="1"
+        p95 = LatencyPercentile(0.95)
+        get_user = async_try(fetch_user, ClientError).hedge(after=p95)
+        user = await get_user(1)
+        ```
+        """
+        if max_extra < 0:
+            raise ValueError("max_extra must not be negative")
+        return AsyncTry(
+            functools.partial(_hedged, self, after, max_extra),  # type: ignore
+            self.errors,
+            self.traceback_policy,
+        )
+
+    def shared(self, *, cache_errors: bool = True) -> "SharedAsyncTry[P, V_co, T_err]":
+        """
+        Run the chain at most once: concurrent and later awaits, whatever the terminal
+        operation (`is_ok`, `get`, `match`...), reuse the stored result, as do the
+        chains built on top of it.
+
+        Exceptions not turned into Err are raised to the concurrent awaiters and never
+        stored, the next await runs the chain again. An awaiter being cancelled does
+        not cancel the shared run.
+
+        Args:
+            cache_errors (bool, optional): store Err results too. When False, an Err
+                is given to the concurrent awaiters and the next await runs the chain
+                again. Defaults to True.
+
+        Returns:
+            SharedAsyncTry[P, V_co, T_err]: memoized AsyncTry.
+
+        ```python linenums="1"
+        user = async_try(fetch_user)(1).shared()
+        if await user.is_ok():  # one request
+            name = await user.map(lambda u: u.name).get()  # still one request
+        ```
+        """
+        return SharedAsyncTry(self, cache_errors)
+
+    memoize = shared
+
     async def is_ok(self):
         """
         Check if the underlying function returned an Ok.
@@ -303,15 +995,9 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
         ```
         """
 
-        async def compose(*args: P.args, **kwargs: P.kwargs) -> U:
-            result: V_co = await _exec(self._under, *args, **kwargs)
-            r: U = await _exec(fn, result)
-            return r
-
-        r: AsyncTry[P, U, T_err] = AsyncTry(compose, self.errors)
-        r.args = self.args
-        r.kwargs = self.kwargs
-        return r
+        # detected once, coroutine functions are awaited without checks
+        kind = _MAP_ASYNC if inspect.iscoroutinefunction(fn) else _MAP
+        return t.cast("AsyncTry[P, U, T_err]", self._then(kind, fn))
 
     async def for_each(self, fn: t.Callable[[V_co | T_err], None]) -> None:
         """
@@ -348,17 +1034,7 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
         ```
         """
 
-        async def compose(*p_args: P.args, **p_kwargs: P.kwargs) -> V_co | U:
-            try:
-                result: V_co = await _exec(self._under, *p_args, **p_kwargs)
-            except Exception:
-                return fn
-            return result
-
-        r: AsyncTry[P, V_co | U, T_err] = AsyncTry(compose, self.errors)
-        r.args = self.args
-        r.kwargs = self.kwargs
-        return r
+        return t.cast("AsyncTry[P, V_co | U, T_err]", self._then(_RECOVER_WITH, fn))
 
     def recover(
         self,
@@ -384,17 +1060,7 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
         ```
         """
 
-        async def compose(*p_args: P.args, **p_kwargs: P.kwargs) -> V_co:
-            try:
-                result: V_co = await _exec(self._under, *p_args, **p_kwargs)
-            except Exception:
-                result = await _exec(fn, *a, **kw)
-            return result
-
-        r: AsyncTry[P, V_co, T_err] = AsyncTry(compose, self.errors)
-        r.args = self.args
-        r.kwargs = self.kwargs
-        return r
+        return t.cast("AsyncTry[P, V_co, T_err]", self._then(_RECOVER, (fn, a, kw)))
 
     async def get(self):
         """
@@ -529,15 +1195,10 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
         ```
         """
 
-        async def compose(*args: P.args, **kwargs: P.kwargs) -> t.Any:
-            result: V_co = await _exec(self._under, *args, **kwargs)
-            r: t.Any = await _exec(getattr, result, name)
-            return r
-
-        r = AsyncTry(compose, self.errors)
-        r.args = self.args
-        r.kwargs = self.kwargs
-        return r
+        if name.startswith("__"):
+            # dunder lookups (copy, pickle, inspect...) are not steps
+            raise AttributeError(name)
+        return self._then(_GETATTR, name)
 
     async def match(
         self, *whens: When[t.Any, t.Any] | MatchableMixin[t.Any] | Default[t.Any]
@@ -591,6 +1252,77 @@ class AsyncTry(AsyncTryBase[P, V_co, T_err]):
                 raise ValueError("Invalid result")
 
 
+class SharedAsyncTry(AsyncTry[P, V_co, T_err]):
+    """
+    AsyncTry running its source at most once, see `AsyncTry.shared`.
+    """
+
+    __slots__ = ("_source", "_cache_errors", "_result", "_flight")
+
+    def __init__(
+        self, source: AsyncTry[P, V_co, T_err], cache_errors: bool = True
+    ) -> None:
+        super().__init__(self._value, source.errors, source.traceback_policy)
+        self._source = source
+        self._cache_errors = cache_errors
+        self._result: Result[V_co, T_err] | None = None
+        self._flight: asyncio.Future[Result[V_co, T_err]] | None = None
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> te.Self:
+        # a shared template: each call shares the run of its own arguments
+        return t.cast(
+            te.Self, SharedAsyncTry(self._source(*args, **kwargs), self._cache_errors)
+        )
+
+    async def _value(self, *args: t.Any, **kwargs: t.Any) -> V_co:
+        # chains built on a shared AsyncTry read the stored result
+        if args or kwargs:
+            raise TypeError(
+                "a chain built on a shared AsyncTry takes no arguments, "
+                "call the shared AsyncTry instead"
+            )
+        result = await self._execute()
+        if isinstance(result, Err):
+            raise result._under
+        return result._under
+
+    async def _execute(self) -> Result[V_co, T_err]:
+        if self._result is not None:
+            return self._result
+        flight = self._flight
+        if flight is None:
+            flight = self._flight = asyncio.ensure_future(self._source._execute())
+            flight.add_done_callback(self._landed)
+        # shielded, cancelling one awaiter does not cancel the others
+        return await asyncio.shield(flight)
+
+    def _landed(self, flight: "asyncio.Future[Result[V_co, T_err]]") -> None:
+        self._flight = None
+        if flight.cancelled() or flight.exception() is not None:
+            return
+        result = flight.result()
+        if self._cache_errors or not isinstance(result, Err):
+            self._result = result
+
+    def __await__(self) -> t.Generator[t.Any, None, Result[V_co, T_err]]:
+        return self._execute().__await__()
+
+    def run_sync(self) -> Result[V_co, T_err]:
+        if self._result is not None:
+            return self._result
+        result = self._source.run_sync()
+        if self._cache_errors or not isinstance(result, Err):
+            self._result = result
+        return result
+
+    def forget(self) -> None:
+        """Drop the stored result, the next await runs the chain again."""
+        self._result = None
+
+    def __str__(self) -> str:
+        return f"<SharedAsyncTry {self._source}>"
+
+
 async_try = AsyncTry
 Future = AsyncTry
 
@@ -627,3 +1359,103 @@ def lift_future(
         return async_try(f)(*args, **kwargs)
 
     return wrapper
+
+
+def _await_step(step: t.Any) -> t.Awaitable[t.Any] | None:
+    # awaitable giving the result of a do_async step, None if step is a result
+    if isawaitable(step):
+        return step
+    if isinstance(step, AsyncTryBase):
+        return step.execute()
+    if isinstance(step, (Ok, Err)):
+        return None
+    raise TypeError(f"do_async steps must yield results, got {step!r}")
+
+
+def _stop_step(step: t.Any) -> Err[t.Any]:
+    if isinstance(step, Err):
+        return step
+    raise TypeError(f"do_async steps must yield results, got {step!r}")
+
+
+def do_async(
+    f: t.Callable[
+        P_mapper, t.Generator[t.Any, t.Any, t.Any] | t.AsyncGenerator[t.Any, t.Any]
+    ]
+) -> t.Callable[P_mapper, t.Awaitable[Result[t.Any, t.Any]]]:
+    """
+    Async counterpart of `do_result`: each step `yield`s a result, or an awaitable /
+    `AsyncTry` giving a result, which is awaited by the runner. An `Ok` sends back its
+    value while the first `Err` stops the generator and is returned, without raising
+    anything.
+
+    f is either a generator function, whose returned value is wrapped in `Ok` unless
+    it already is a result, or an `async def` generator function. As async
+    generators can not return a value, the result is then their last yielded step.
+    Generator functions are faster as the runner does all the awaiting.
+
+    ```python linenums="1"
+    @do_async
+    def compute(user_id: int):
+        user = yield fetch_user(user_id)  # coroutine returning a result
+        orders = yield async_try(fetch_orders)(user)
+        return len(orders)
+
+    @do_async
+    async def compute_async(user_id: int):
+        user = yield await fetch_user(user_id)
+        orders = yield async_try(fetch_orders)(user)
+        yield Ok(len(orders))  # the result
+
+    assert await compute(1) == await compute_async(1) == Ok(3)
+    ```
+    """
+
+    if inspect.isasyncgenfunction(f):
+
+        @functools.wraps(f)
+        async def inner_async(
+            *args: P_mapper.args, **kwargs: P_mapper.kwargs
+        ) -> Result[t.Any, t.Any]:
+            gen = f(*args, **kwargs)
+            step: t.Any = Ok(None)
+            value: t.Any = None
+            while True:
+                try:
+                    step = await gen.asend(value)  # type: ignore
+                except StopAsyncIteration:
+                    return step
+                if type(step) is not Ok and type(step) is not Err:
+                    if (awaitable := _await_step(step)) is not None:
+                        step = await awaitable
+                if type(step) is Ok or isinstance(step, Ok):
+                    value = step._under
+                    continue
+                await gen.aclose()  # type: ignore
+                return _stop_step(step)
+
+        return inner_async
+
+    @functools.wraps(f)
+    async def inner(
+        *args: P_mapper.args, **kwargs: P_mapper.kwargs
+    ) -> Result[t.Any, t.Any]:
+        gen = f(*args, **kwargs)
+        send = gen.send  # type: ignore
+        value: t.Any = None
+        try:
+            while True:
+                step = send(value)
+                if type(step) is not Ok and type(step) is not Err:
+                    if (awaitable := _await_step(step)) is not None:
+                        step = await awaitable
+                if type(step) is Ok or isinstance(step, Ok):
+                    value = step._under
+                    continue
+                gen.close()  # type: ignore
+                return _stop_step(step)
+        except StopIteration as stop:
+            result = stop.value
+            return result if isinstance(result, (Ok, Err)) else Ok(result)
+
+    return inner
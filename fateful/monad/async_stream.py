@@ -0,0 +1,335 @@
+import asyncio
+import contextlib
+import typing as t
+from inspect import isawaitable
+
+from fateful.monad.async_result import AsyncTry
+from fateful.monad.result import Err, Ok, Result, TracebackPolicy
+
+U = t.TypeVar("U")
+V_co = t.TypeVar("V_co", covariant=True)
+T_err = t.TypeVar("T_err", bound=Exception, covariant=True)
+
+Source = t.Union[t.AsyncIterable[U], t.Iterable[U]]
+Results = t.AsyncGenerator[Result[t.Any, t.Any], None]
+
+_TRY, _FILTER, _FLAT_MAP, _BUFFER = range(4)
+_DONE = object()
+
+
+def _unwrap(result: Result[U, Exception]) -> U:
+    # head of the AsyncTry run on each element, an Err goes to the next recover
+    if isinstance(result, Err):
+        raise result._under
+    return result._under
+
+
+async def _source(
+    source: Source[t.Any],
+    errors: tuple[type[Exception], ...],
+    traceback_policy: TracebackPolicy,
+) -> Results:
+    # an error of the source ends the stream with an Err
+    if not hasattr(source, "__aiter__"):
+        iterator = iter(source)
+        while True:
+            try:
+                value = next(iterator)
+            except StopIteration:
+                return
+            except Exception as e:
+                if not isinstance(e, errors):
+                    raise
+                yield Err(e, traceback_policy)
+                return
+            yield Ok(value)
+    aiterator = source.__aiter__()
+    try:
+        while True:
+            try:
+                value = await aiterator.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                if not isinstance(e, errors):
+                    raise
+                yield Err(e, traceback_policy)
+                return
+            yield Ok(value)
+    finally:
+        aclose = getattr(aiterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def _tried(upstream: Results, template: AsyncTry[t.Any, t.Any, t.Any]) -> Results:
+    async with contextlib.aclosing(upstream):
+        async for result in upstream:
+            yield await template(result)
+
+
+async def _filtered(
+    upstream: Results,
+    predicate: t.Callable[[t.Any], t.Any],
+    errors: tuple[type[Exception], ...],
+    traceback_policy: TracebackPolicy,
+) -> Results:
+    async with contextlib.aclosing(upstream):
+        async for result in upstream:
+            if isinstance(result, Ok):
+                try:
+                    keep = predicate(result._under)
+                    if isawaitable(keep):
+                        keep = await keep
+                except Exception as e:
+                    if not isinstance(e, errors):
+                        raise
+                    yield Err(e, traceback_policy)
+                    continue
+                if not keep:
+                    continue
+            yield result
+
+
+async def _flattened(
+    upstream: Results,
+    fn: t.Callable[[t.Any], t.Any],
+    errors: tuple[type[Exception], ...],
+    traceback_policy: TracebackPolicy,
+) -> Results:
+    async with contextlib.aclosing(upstream):
+        async for result in upstream:
+            if isinstance(result, Err):
+                yield result
+                continue
+            try:
+                inner = fn(result._under)
+                if isawaitable(inner):
+                    inner = await inner
+            except Exception as e:
+                if not isinstance(e, errors):
+                    raise
+                yield Err(e, traceback_policy)
+                continue
+            if isinstance(inner, AsyncTryStream):
+                results = inner.__aiter__()
+            else:
+                results = _source(inner, errors, traceback_policy)
+            async with contextlib.aclosing(results):
+                async for item in results:
+                    yield item
+
+
+async def _buffered(upstream: Results, size: int) -> Results:
+    # the upstream runs in a task, at most size results ahead of the consumer
+    queue: asyncio.Queue[t.Any] = asyncio.Queue(size)
+    failure: list[BaseException] = []
+
+    async def produce() -> None:
+        try:
+            async for result in upstream:
+                await queue.put(result)
+        except Exception as e:
+            failure.append(e)
+        finally:
+            await upstream.aclose()
+        await queue.put(_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            result = await queue.get()
+            if result is _DONE:
+                break
+            yield result
+    finally:
+        producer.cancel()
+    if failure:
+        raise failure[0]
+
+
+class AsyncTryStream(t.Generic[V_co, T_err]):
+    """
+    Stream of results built from an async iterable, e.g. an async generator of
+    pages, or an iterable. Its steps have the semantics of the `AsyncTry` ones,
+    element by element, and the results are produced lazily when iterating over
+    the stream, so nothing is collected in memory.
+
+    Without `buffer`, an element is only read from the source when the consumer asks
+    for the next result. `buffer(size)` runs the stream built so far in a task at
+    most size results ahead of the consumer: a slow consumer pauses the producer.
+
+    An error of the source ends the stream with an Err. The source is consumed by
+    the iteration, like an async generator a stream is iterated once.
+
+    ```python linenums="1"
+    async def pages(session):
+        url = first_page_url
+        while url:
+            page = await session.get(url)
+            yield page
+            url = page.next_url
+
+    users = (
+        AsyncTryStream(pages(session), ClientError)
+        .flat_map(lambda page: page.items)
+        .filter(lambda user: user.active)
+        .map(enrich_user)  # async
+        .recover_with(None)
+        .buffer(10)
+    )
+    async for user in users:
+        ...  # Ok(User) or Ok(None)
+    ```
+    """
+
+    __slots__ = ("_source", "errors", "traceback_policy", "_stages")
+
+    def __init__(
+        self,
+        source: Source[V_co],
+        exc: type[T_err] | tuple[type[T_err], ...] = t.cast(
+            tuple[type[T_err], ...], (Exception,)
+        ),
+        traceback_policy: TracebackPolicy = TracebackPolicy.KEEP,
+    ) -> None:
+        """
+        Args:
+            source (t.AsyncIterable[V_co] | t.Iterable[V_co]): elements of the stream.
+            exc: exceptions turned into Err, others are raised by the iteration.
+            traceback_policy (TracebackPolicy, optional): what the Err keep of the
+                traceback. Defaults to TracebackPolicy.KEEP.
+        """
+        self._source = source
+        self.errors = exc if isinstance(exc, tuple) else (exc,)
+        self.traceback_policy = traceback_policy
+        self._stages: tuple[tuple[int, t.Any], ...] = ()
+
+    def _copy(self, stages: tuple[tuple[int, t.Any], ...]) -> "AsyncTryStream":
+        stream = object.__new__(AsyncTryStream)
+        stream._source = self._source
+        stream.errors = self.errors
+        stream.traceback_policy = self.traceback_policy
+        stream._stages = stages
+        return stream
+
+    def _then(self, kind: int, arg: t.Any) -> "AsyncTryStream":
+        return self._copy((*self._stages, (kind, arg)))
+
+    def _on_try(
+        self, step: t.Callable[[AsyncTry[t.Any, t.Any, t.Any]], t.Any]
+    ) -> "AsyncTryStream":
+        # consecutive map / recover steps run in one AsyncTry per element
+        stages = self._stages
+        if stages and stages[-1][0] is _TRY:
+            template, stages = stages[-1][1], stages[:-1]
+        else:
+            template = AsyncTry(_unwrap, self.errors, self.traceback_policy)
+        return self._copy((*stages, (_TRY, step(template))))
+
+    def map(
+        self, fn: t.Callable[[V_co], U] | t.Callable[[V_co], t.Awaitable[U]]
+    ) -> "AsyncTryStream[U, T_err]":
+        """
+        Map the Ok elements with fn, sync or async, see `AsyncTry.map`.
+
+        ```python linenums="1"
+        squares = AsyncTryStream(range(3)).map(lambda x: x * x)
+        assert [r async for r in squares] == [Ok(0), Ok(1), Ok(4)]
+        ```
+        """
+        return self._on_try(lambda template: template.map(fn))
+
+    def recover(
+        self, fn: t.Callable[..., t.Awaitable[U] | U], *args: t.Any, **kwargs: t.Any
+    ) -> "AsyncTryStream[V_co | U, T_err]":
+        """
+        Replace the Err elements by the result of fn(*args, **kwargs), see
+        `AsyncTry.recover`.
+        """
+        return self._on_try(lambda template: template.recover(fn, *args, **kwargs))
+
+    def recover_with(self, value: U) -> "AsyncTryStream[V_co | U, T_err]":
+        """Replace the Err elements by Ok(value), see `AsyncTry.recover_with`."""
+        return self._on_try(lambda template: template.recover_with(value))
+
+    def filter(
+        self,
+        predicate: t.Callable[[V_co], bool] | t.Callable[[V_co], t.Awaitable[bool]],
+    ) -> "AsyncTryStream[V_co, T_err]":
+        """
+        Drop the Ok elements for which predicate, sync or async, is false. Err
+        elements are kept, an error of predicate gives an Err.
+
+        ```python linenums="1"
+        evens = AsyncTryStream(range(5)).filter(lambda x: x % 2 == 0)
+        assert [r async for r in evens] == [Ok(0), Ok(2), Ok(4)]
+        ```
+        """
+        return self._then(_FILTER, predicate)
+
+    def flat_map(
+        self,
+        fn: t.Callable[
+            [V_co],
+            "Source[U] | t.Awaitable[Source[U]] | AsyncTryStream[U, t.Any]",
+        ],
+    ) -> "AsyncTryStream[U, T_err]":
+        """
+        Replace each Ok element by the elements of fn(element): an iterable, an async
+        iterable, an AsyncTryStream or an awaitable of an iterable, e.g. the items of
+        a page. Err elements are kept.
+
+        ```python linenums="1"
+        async def page(number: int) -> list[int]:
+            return [number * 10, number * 10 + 1]
+
+        items = AsyncTryStream(range(2)).flat_map(page)
+        assert [r async for r in items] == [Ok(0), Ok(1), Ok(10), Ok(11)]
+        ```
+        """
+        return self._then(_FLAT_MAP, fn)
+
+    def buffer(self, size: int) -> "AsyncTryStream[V_co, T_err]":
+        """
+        Run the stream built so far in a task, at most size results ahead of the
+        consumer, e.g. to fetch the next pages while the current one is processed.
+        The queue is bounded: a slow consumer pauses the producer.
+
+        Args:
+            size (int): maximum number of results waiting for the consumer.
+
+        Raises:
+            ValueError: size is lower than 1.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        return self._then(_BUFFER, size)
+
+    def __aiter__(self) -> t.AsyncIterator[Result[V_co, T_err]]:
+        """
+        Iterate over the results, read lazily from the source.
+
+        ```python linenums="1"
+        async for result in AsyncTryStream(pages(session)).map(parse):
+            print(result)  # Ok(...) or Err(...)
+        ```
+        """
+        errors, traceback_policy = self.errors, self.traceback_policy
+        results = _source(self._source, errors, traceback_policy)
+        for kind, arg in self._stages:
+            if kind is _TRY:
+                results = _tried(results, arg)
+            elif kind is _FILTER:
+                results = _filtered(results, arg, errors, traceback_policy)
+            elif kind is _FLAT_MAP:
+                results = _flattened(results, arg, errors, traceback_policy)
+            else:
+                results = _buffered(results, arg)
+        return results
+
+    def __str__(self) -> str:
+        return f"<AsyncTryStream {self._source!r}>"
+
+
+async_try_stream = AsyncTryStream
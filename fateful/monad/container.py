@@ -18,6 +18,8 @@ P = t.ParamSpec("P")
 
 
 class MappableContainerMixin(t.Generic[T_co], abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def map(
         self, fn: t.Callable[[t.Any], V]
@@ -28,6 +30,8 @@ class MappableContainerMixin(t.Generic[T_co], abc.ABC):
 class CommonContainer(MappableContainerMixin[T_co], MatchableMixin[T_co], abc.ABC):
     """ """
 
+    __slots__ = ()
+
     __match_args__: tuple[t.Literal["_under"]] = ("_under",)
 
     def __init__(self, under: T_co) -> None:
@@ -1,14 +1,26 @@
 import dataclasses
+import re
+import types
 import typing as t
 from dataclasses import dataclass
+from enum import Enum
+from operator import attrgetter
 
-from pampy import _ as __
-from pampy.helpers import UnderscoreType
-from pampy.pampy import match_dict as pampy_dict_matcher
+T = t.TypeVar("T")
 
-_ = __
 
-T = t.TypeVar("T")
+class UnderscoreType:
+    """
+    Type of the `_` wildcard, matching any value and extracting it.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "_"
+
+
+_ = UnderscoreType()
 
 
 def identity(x: T) -> T:
@@ -110,23 +122,6 @@ U = t.TypeVar("U")
 Nested: t.TypeAlias = "MatchableMixin[Q | Nested[Q]]"
 
 
-def convert_to_dict(obj: dict[str, t.Any]) -> dict[str, t.Any]:
-    """
-    convert a dataclass to a dict without deep copying it
-
-    Args:
-        obj (dict[str, t.Any]): _description_
-
-    Returns:
-        dict[str, t.Any]: _description_
-    """
-    for key, value in obj.items():
-        if dataclasses.is_dataclass(value):
-            obj[key] = value.__dict__
-            convert_to_dict(obj[key])
-    return obj
-
-
 class MatchableMixin(t.Generic[T_co]):
     """
     Mixin class for pattern matching.
@@ -142,23 +137,24 @@ class MatchableMixin(t.Generic[T_co]):
         _type_: _description_
     """
 
-    __matchable_classes__: t.ClassVar[set[t.Any]] = set()
+    __slots__ = ()
+
+    __matchable_classes__: t.ClassVar[frozenset[t.Any]] = frozenset()
 
     @t.overload
     def __rshift__(
         self: "MatchableMixin[UnderscoreType]", other: t.Callable[[T_co], T_co]
-    ) -> When[T, T]:
-        ...
+    ) -> When[T, T]: ...
 
     @t.overload
-    def __rshift__(self: "MatchableMixin[V]", other: t.Callable[[V], U]) -> When[V, U]:
-        ...
+    def __rshift__(
+        self: "MatchableMixin[V]", other: t.Callable[[V], U]
+    ) -> When[V, U]: ...
 
     @t.overload
     def __rshift__(
         self: "MatchableMixin[T_co]", other: t.Callable[[T_co], U]
-    ) -> When[T_co, U]:
-        ...
+    ) -> When[T_co, U]: ...
 
     def __rshift__(self, other: t.Callable) -> When:
         """ """
@@ -168,18 +164,17 @@ class MatchableMixin(t.Generic[T_co]):
     def match(
         self: "Nested[T]",
         *whens: "When[Nested[UnderscoreType], Nested[UnderscoreType]]  | Default[T]",
-    ) -> T:
-        ...
+    ) -> T: ...
 
     @t.overload
-    def match(self, *whens: When[UnderscoreType, UnderscoreType]) -> T_co:
+    def match(self, *whens: "When[UnderscoreType, UnderscoreType]") -> T_co:
         """
         >>> v = opt(1).match(Ok(_under=_) >> identity)
         """
         ...
 
     @t.overload
-    def match(self, *whens: When[UnderscoreType, Q] | Default[t.Any]) -> Q:
+    def match(self, *whens: "When[UnderscoreType, Q] | Default[t.Any]") -> Q:
         """
         >>> value.match(
         >>>    when(Some(_)).then(lambda x: "match first"),
@@ -209,7 +204,7 @@ class MatchableMixin(t.Generic[T_co]):
         ...
 
     @t.overload
-    def match(self, *whens: "MatchableMixin[UnderscoreType]" | Default[T_co]) -> T_co:
+    def match(self, *whens: "MatchableMixin[UnderscoreType] | Default[T_co]") -> T_co:
         """
         >>> d = opt(1).match(*(Some(_), default >>  100))
         """
@@ -237,37 +232,404 @@ class MatchableMixin(t.Generic[T_co]):
         ...
 
     def match(
-        self, *whens: "When[t.Any, t.Any] | MatchableMixin[t.Any] | Default[t.Any]"
+        self,
+        *whens: "When[t.Any, t.Any] | MatchableMixin[t.Any] | Default[t.Any]"
+        " | CompiledMatch",
     ) -> t.Any:
+        if len(whens) == 1 and isinstance(whens[0], CompiledMatch):
+            return whens[0](self)
+        # guards used once are interpreted, compiling them would cost more
         for w in whens:
             if isinstance(w, Default):
-                assert w.action is not None
-                return w.action()
-
-            when_inst = w
-            if not isinstance(when_inst, When):
-                # assert isinstance(when_inst, Matchable)
-                when_inst = When(when_inst)
-
-            if isinstance(when_inst, when):
-                clazz = when_inst.value.__class__
-
-                if clazz not in self.__matchable_classes__:
-                    raise MatchError(
-                        f"Incompatible match class found: {when_inst.value} "
-                        f"not in {self.__matchable_classes__}"
-                    )
-
-                if clazz == self.__class__:
-                    match_dict, self_dict = convert_to_dict(
-                        when_inst.value.__dict__
-                    ), convert_to_dict(self.__dict__)
-                    is_a_match, extracted = pampy_dict_matcher(match_dict, self_dict)
-                    if not is_a_match:
-                        continue
-                    if when_inst.action is None:
-                        if len(extracted) == 1:
-                            return extracted[0]
-                        return extracted
-                    return when_inst.action(*extracted)
+                return _run_default(w.action)
+            when_inst = w if isinstance(w, When) else When(w)
+            pattern = when_inst.value
+            clazz = pattern.__class__
+            if clazz not in self.__matchable_classes__:
+                raise MatchError(
+                    f"Incompatible match class found: {pattern} "
+                    f"not in {self.__matchable_classes__}"
+                )
+            if clazz is self.__class__:
+                extracted: list[t.Any] = []
+                if _match_fields(pattern, self, extracted):
+                    return _run_action(when_inst.action, extracted)
         raise MatchError(f"No default guard found, enable to match {self}")
+
+
+Matcher = t.Callable[[t.Any, list[t.Any]], bool]
+
+_NO_DEFAULT = object()
+
+
+class CompiledMatch:
+    """
+    Decision tree built by `compile_match`: guards are grouped by the class of their
+    pattern, so only the guards of the class of the matched value are tried. Each
+    pattern is compiled once into a function comparing the fields in place, without
+    copying nor mutating the matched value.
+    """
+
+    __slots__ = ("_arms", "_default", "_plans")
+
+    def __init__(
+        self, whens: t.Iterable["When[t.Any, t.Any] | MatchableMixin | Default[t.Any]"]
+    ) -> None:
+        arms: list[When[t.Any, t.Any]] = []
+        self._default: t.Any = _NO_DEFAULT
+        for w in whens:
+            if isinstance(w, Default):
+                # guards after the default can not be reached
+                self._default = w.action
+                break
+            arms.append(w if isinstance(w, When) else When(w))
+        self._arms = tuple(arms)
+        # value class -> (matcher or None if incompatible, action), built lazily
+        self._plans: dict[type, tuple[tuple[Matcher | None, t.Any], ...]] = {}
+
+    def _plan(self, clazz: type) -> tuple[tuple[Matcher | None, t.Any], ...]:
+        matchable = getattr(clazz, "__matchable_classes__", frozenset())
+        steps: list[tuple[Matcher | None, t.Any]] = []
+        for arm in self._arms:
+            pattern_class = arm.value.__class__
+            if pattern_class not in matchable:
+                steps.append((None, arm.value))
+                break
+            if pattern_class is clazz:
+                steps.append((_compile_fields(arm.value), arm.action))
+        plan = tuple(steps)
+        self._plans[clazz] = plan
+        return plan
+
+    def __call__(self, value: t.Any) -> t.Any:
+        """
+        Match a value against the compiled guards.
+
+        Raises:
+            MatchError: if no guard matches and there is no default, or if a guard of
+                an incompatible class is reached.
+        """
+        clazz = value.__class__
+        plan = self._plans.get(clazz)
+        if plan is None:
+            plan = self._plan(clazz)
+        for matcher, action in plan:
+            if matcher is None:
+                raise MatchError(
+                    f"Incompatible match class found: {action} "
+                    f"not in {getattr(clazz, '__matchable_classes__', set())}"
+                )
+            extracted: list[t.Any] = []
+            if matcher(value, extracted):
+                return _run_action(action, extracted)
+        if self._default is _NO_DEFAULT:
+            raise MatchError(f"No default guard found, enable to match {value}")
+        return _run_default(self._default)
+
+    def __repr__(self) -> str:
+        return f"<CompiledMatch {len(self._arms)} guards>"
+
+
+def compile_match(
+    *whens: "When[t.Any, t.Any] | MatchableMixin[t.Any] | Default[t.Any]",
+) -> CompiledMatch:
+    """
+    Compile guards once into a reusable matcher, to call on each value or to pass to
+    `.match`.
+
+    ```python
+    route = compile_match(
+        Ok(Created(_)) >> on_created,
+        Ok(Deleted(_)) >> on_deleted,
+        Err(ErrorCode("not_found", _)) >> on_not_found,
+        default >> None,
+    )
+    for message in messages:
+        route(message)  # same as message.match(route)
+    ```
+    """
+    return CompiledMatch(whens)
+
+
+_LITERALS = frozenset({int, float, str, bool})
+_KEYS = (int, str, bool, Enum)
+
+
+def _is_wildcard(pattern: t.Any) -> bool:
+    # pampy's own `_` is accepted too
+    return pattern is _ or type(pattern).__name__ == "UnderscoreType"
+
+
+def _is_pampy_marker(pattern: t.Any) -> bool:
+    # HEAD / TAIL
+    return type(pattern).__module__ == "pampy.helpers" and not _is_wildcard(pattern)
+
+
+def _is_typing(pattern: t.Any) -> bool:
+    return (
+        pattern is t.Any
+        or isinstance(pattern, (types.UnionType, types.GenericAlias))
+        or type(pattern).__module__ == "typing"
+    )
+
+
+def _match_any(value: t.Any, extracted: list[t.Any]) -> bool:
+    extracted.append(value)
+    return True
+
+
+def _match_none(value: t.Any, extracted: list[t.Any]) -> bool:
+    return value is None
+
+
+def _never(value: t.Any, extracted: list[t.Any]) -> bool:
+    return False
+
+
+def _run_action(action: t.Callable[..., t.Any] | None, extracted: list[t.Any]) -> t.Any:
+    if action is None:
+        return extracted[0] if len(extracted) == 1 else extracted
+    return action(*extracted)
+
+
+def _run_default(action: t.Any) -> t.Any:
+    return action() if callable(action) else action
+
+
+_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def _fields_of(clazz: type) -> tuple[str, ...]:
+    # dataclasses.fields is slow, field names are memoized per class
+    names = _field_names.get(clazz)
+    if names is None:
+        names = _field_names[clazz] = tuple(f.name for f in dataclasses.fields(clazz))
+    return names
+
+
+def _match_fields(pattern: t.Any, value: t.Any, extracted: list[t.Any]) -> bool:
+    # the class has been checked already
+    for name in _fields_of(pattern.__class__):
+        if not _match_value(getattr(pattern, name), getattr(value, name), extracted):
+            return False
+    return True
+
+
+def _match_value(pattern: t.Any, value: t.Any, extracted: list[t.Any]) -> bool:
+    """interpreted counterpart of _compile, for guards used once"""
+    if pattern is _:
+        extracted.append(value)
+        return True
+    pattern_type = type(pattern)
+    if pattern_type in _LITERALS:
+        return value == pattern and type(value) is pattern_type
+    if pattern is None:
+        return value is None
+    if _is_typing(pattern):
+        return _pampy_match(pattern, value, extracted)
+    if isinstance(pattern, Enum):
+        return value == pattern and type(value) is pattern_type
+    if isinstance(pattern, type):
+        if isinstance(value, pattern):
+            extracted.append(value)
+            return True
+        return False
+    if isinstance(pattern, (list, tuple)):
+        if not isinstance(value, (list, tuple)) or any(map(_is_pampy_marker, pattern)):
+            return _pampy_match(pattern, value, extracted)
+        if len(value) != len(pattern):
+            return False
+        for item_pattern, item in zip(pattern, value):
+            if not _match_value(item_pattern, item, extracted):
+                return False
+        return True
+    if isinstance(pattern, dict):
+        if not all(isinstance(key, _KEYS) for key in pattern):
+            return _pampy_match(pattern, value, extracted)
+        if not isinstance(value, dict):
+            return False
+        for key, item_pattern in pattern.items():
+            if key not in value or not _match_value(
+                item_pattern, value[key], extracted
+            ):
+                return False
+        return True
+    if dataclasses.is_dataclass(pattern):
+        return value.__class__ is pattern_type and _match_fields(
+            pattern, value, extracted
+        )
+    if callable(pattern):
+        return _run_predicate(pattern, value, extracted)
+    if isinstance(pattern, re.Pattern):
+        return _match_regex(pattern, value, extracted)
+    if _is_wildcard(pattern):
+        extracted.append(value)
+        return True
+    if _is_pampy_marker(pattern):
+        return _pampy_match(pattern, value, extracted)
+    return False
+
+
+def _compile_fields(pattern: t.Any) -> Matcher:
+    # the class has been checked already
+    fields = [
+        (attrgetter(name), _compile(getattr(pattern, name)))
+        for name in _fields_of(pattern.__class__)
+    ]
+    if len(fields) == 1:
+        [(get, matcher)] = fields
+        if matcher is _match_any:
+            return lambda value, extracted: _match_any(get(value), extracted)
+        return lambda value, extracted: matcher(get(value), extracted)
+
+    def match(value: t.Any, extracted: list[t.Any]) -> bool:
+        for get, matcher in fields:
+            if not matcher(get(value), extracted):
+                return False
+        return True
+
+    return match
+
+
+def _compile(pattern: t.Any) -> Matcher:
+    """compile a pattern, with the same semantics as pampy.match_value"""
+    if _is_typing(pattern):
+        return _pampy_matcher(pattern)
+    if type(pattern) in _LITERALS or isinstance(pattern, Enum):
+        pattern_type = type(pattern)
+        return lambda value, extracted: (
+            value == pattern and type(value) is pattern_type
+        )
+    if pattern is None:
+        return _match_none
+    if isinstance(pattern, type):
+
+        def match_type(value: t.Any, extracted: list[t.Any]) -> bool:
+            if isinstance(value, pattern):
+                extracted.append(value)
+                return True
+            return False
+
+        return match_type
+    if isinstance(pattern, (list, tuple)):
+        return _compile_sequence(pattern)
+    if isinstance(pattern, dict):
+        return _compile_dict(pattern)
+    if dataclasses.is_dataclass(pattern):
+        # before callables: containers forward calls to their value
+        pattern_class = pattern.__class__
+        fields = _compile_fields(pattern)
+        return lambda value, extracted: (
+            value.__class__ is pattern_class and fields(value, extracted)
+        )
+    if callable(pattern):
+        return _compile_predicate(pattern)
+    if isinstance(pattern, re.Pattern):
+        return lambda value, extracted: _match_regex(pattern, value, extracted)
+    if _is_wildcard(pattern):
+        return _match_any
+    if _is_pampy_marker(pattern):
+        return _pampy_matcher(pattern)
+    return _never
+
+
+def _compile_sequence(pattern: list[t.Any] | tuple[t.Any, ...]) -> Matcher:
+    if any(_is_pampy_marker(item) for item in pattern):
+        return _pampy_matcher(pattern)
+    matchers = [_compile(item) for item in pattern]
+    size = len(matchers)
+    fallback = _pampy_matcher(pattern)
+
+    def match(value: t.Any, extracted: list[t.Any]) -> bool:
+        if not isinstance(value, (list, tuple)):
+            # other iterables, e.g. strings
+            return fallback(value, extracted)
+        if len(value) != size:
+            return False
+        for matcher, item in zip(matchers, value):
+            if not matcher(item, extracted):
+                return False
+        return True
+
+    return match
+
+
+def _compile_dict(pattern: dict[t.Any, t.Any]) -> Matcher:
+    if not all(isinstance(key, _KEYS) for key in pattern):
+        # keys are patterns too
+        return _pampy_matcher(pattern)
+    matchers = [(key, _compile(item)) for key, item in pattern.items()]
+
+    def match(value: t.Any, extracted: list[t.Any]) -> bool:
+        if not isinstance(value, dict):
+            return False
+        for key, matcher in matchers:
+            if key not in value or not matcher(value[key], extracted):
+                return False
+        return True
+
+    return match
+
+
+def _compile_predicate(predicate: t.Callable[[t.Any], t.Any]) -> Matcher:
+    return lambda value, extracted: _run_predicate(predicate, value, extracted)
+
+
+def _run_predicate(
+    predicate: t.Callable[[t.Any], t.Any], value: t.Any, extracted: list[t.Any]
+) -> bool:
+    result = predicate(value)
+    if isinstance(result, bool):
+        if result:
+            extracted.append(value)
+        return result
+    if (
+        isinstance(result, tuple)
+        and len(result) == 2
+        and isinstance(result[0], bool)
+        and isinstance(result[1], list)
+    ):
+        if result[0]:
+            extracted.extend(result[1])
+        return result[0]
+    raise MatchError(
+        f"pattern function {predicate} is not returning a boolean "
+        f"nor a tuple of (boolean, list), but instead {result}"
+    )
+
+
+def _match_regex(
+    pattern: re.Pattern[str], value: t.Any, extracted: list[t.Any]
+) -> bool:
+    found = pattern.search(value)
+    if found is None:
+        return False
+    extracted.extend(found.groups())
+    return True
+
+
+def _to_pampy(pattern: t.Any) -> t.Any:
+    from pampy import _ as pampy_wildcard
+
+    if _is_wildcard(pattern):
+        return pampy_wildcard
+    if isinstance(pattern, (list, tuple)):
+        return type(pattern)(_to_pampy(item) for item in pattern)
+    if isinstance(pattern, dict):
+        return {_to_pampy(k): _to_pampy(v) for k, v in pattern.items()}
+    return pattern
+
+
+def _pampy_match(pattern: t.Any, value: t.Any, extracted: list[t.Any]) -> bool:
+    # pampy is imported on first use only
+    from pampy.pampy import match_value
+
+    matched, values = match_value(_to_pampy(pattern), value)
+    if matched:
+        extracted.extend(values)
+    return matched
+
+
+def _pampy_matcher(pattern: t.Any) -> Matcher:
+    """typing constructs, HEAD / TAIL and pattern keys are left to pampy"""
+    return lambda value, extracted: _pampy_match(pattern, value, extracted)
@@ -1,5 +1,8 @@
 import abc
+import copy
+import functools
 import typing as t
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from fateful.monad.container import CommonContainer, EmptyError
@@ -10,6 +13,8 @@ P = t.ParamSpec("P")
 
 
 class OptionContainer(CommonContainer[T_co], abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def is_some(self) -> bool:  # pragma: no cover
         ...
@@ -36,12 +41,15 @@ Q = t.TypeVar("Q")
 Nested: t.TypeAlias = "Some[Q | Nested[Q]]"
 
 
-@dataclass(unsafe_hash=True, frozen=True)
+@dataclass(unsafe_hash=True, frozen=True, slots=True, init=False)
 class Some(OptionContainer[T_co]):
     """ """
 
     _under: T_co
 
+    def __init__(self, _under: T_co) -> None:
+        _set_some_under(self, _under)
+
     def get(self) -> T_co:
         """
         get the value of the Some container
@@ -311,12 +319,43 @@ class Some(OptionContainer[T_co]):
         """
         return f"<Some {str(self._under)}>"
 
+    def __reduce__(self) -> tuple[type["Some[T_co]"], tuple[T_co]]:
+        # compact pickle payload: the class and the value, no dataclass state
+        return Some, (self._under,)
+
+    def __deepcopy__(self, memo: dict[int, t.Any]) -> "Some[T_co]":
+        # explicit, otherwise the lookup is forwarded to the value by __getattr__
+        return Some(copy.deepcopy(self._under, memo))
+
+
+# frozen containers write their single slot through the slot descriptor directly,
+# which is cheaper than the object.__setattr__ call generated by dataclasses
+_set_some_under = Some._under.__set__  # type: ignore[attr-defined]
+
+_null: "Empty | None" = None
+
+
+def _new_empty(cls: type["Empty"]) -> "Empty":
+    # only called once, to build Null
+    empty = object.__new__(cls)
+    Empty._under.__set__(empty, None)  # type: ignore[attr-defined]
+    return empty
+
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, frozen=True, slots=True, init=False)
 class Empty(OptionContainer[None]):
-    """ """
+    """
+    Empty option. It holds no state, so `Empty()` always returns the immutable `Null`
+    singleton, which is safe to share between threads.
+    """
+
+    _under: None
 
-    _under: None = None
+    def __new__(cls, _under: None = None) -> "Empty":
+        return _null if _null is not None else _new_empty(cls)
+
+    def __init__(self, _under: None = None) -> None:
+        pass
 
     def get(self) -> t.NoReturn:
         """
@@ -505,6 +544,10 @@ class Empty(OptionContainer[None]):
     def __str__(self) -> str:
         return "<Empty>"
 
+    def __reduce__(self) -> tuple[t.Callable[[None], "Empty"], tuple[None]]:
+        # unpickled with option(None), i.e. the Null singleton
+        return option, (None,)
+
     def flatten(self) -> "Empty":
         """
         Flatten the container.
@@ -518,7 +561,7 @@ class Empty(OptionContainer[None]):
 T_err = t.TypeVar("T_err", bound=Exception, covariant=True)
 
 
-OPT_MATCHABLE_CLASSES = {Some, Empty}
+OPT_MATCHABLE_CLASSES = frozenset({Some, Empty})
 Some.__matchable_classes__ = OPT_MATCHABLE_CLASSES
 Empty.__matchable_classes__ = OPT_MATCHABLE_CLASSES
 
@@ -550,6 +593,80 @@ def lift_opt(f: t.Callable[P, V]) -> t.Callable[P, Some[V] | Empty]:
     return wrapper
 
 
+_mapping_types: dict[type, bool] = {}
+
+
+def _is_mapping(clazz: type) -> bool:
+    # memoized per type, isinstance checks against ABCs are slow on hot paths. A plain
+    # dict rather than functools.cache: reads do not lock on free-threaded builds
+    is_mapping = _mapping_types.get(clazz)
+    if is_mapping is None:
+        is_mapping = _mapping_types[clazz] = issubclass(clazz, Mapping)
+    return is_mapping
+
+
+def _compile_hop(hop: str | int) -> t.Callable[[t.Any], t.Any]:
+    if isinstance(hop, int):
+        return lambda obj: obj[hop]
+
+    def get(obj: t.Any) -> t.Any:
+        if _is_mapping(type(obj)):
+            return obj[hop]
+        return getattr(obj, hop)
+
+    return get
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(
+    path: str | tuple[str | int, ...]
+) -> t.Callable[[t.Any], Some[t.Any] | Empty]:
+    hops = tuple(
+        _compile_hop(hop) for hop in (path.split(".") if isinstance(path, str) else path)
+    )
+
+    def access(obj: t.Any) -> Some[t.Any] | Empty:
+        try:
+            for hop in hops:
+                if obj is None:
+                    return Null
+                obj = hop(obj)
+        except (AttributeError, LookupError, TypeError):
+            return Null
+        return Null if obj is None else Some(obj)
+
+    return access
+
+
+def opt_path(
+    path: str | t.Sequence[str | int],
+) -> t.Callable[[t.Any], Some[t.Any] | Empty]:
+    """
+    Compile an attribute / key path into a function returning `Some` of the value at
+    the end of the path, or `Empty` if one of the hops is missing or None.
+
+    `opt_path("b.c")(a)` is the same as `opt(a).b.c` without allocating one container
+    per hop. Compiled paths are cached, building the same path twice is cheap.
+
+    Args:
+        path (str | t.Sequence[str | int]): dotted names, or a sequence of names and
+            integer indexes. A name is looked up as a key on mappings and as an
+            attribute on other objects, an integer is used as an index.
+
+    Returns:
+        t.Callable[[t.Any], Some[t.Any] | Empty]: compiled accessor.
+
+    ```python
+    get_id = opt_path(["items", 0, "id"])
+    assert get_id({"items": [{"id": 1}]}) == Some(1)
+    assert get_id({"items": []}) == Null
+
+    opt_path("user.name")(request).or_("anonymous")
+    ```
+    """
+    return _compile_path(path if isinstance(path, str) else tuple(path))
+
+
 # aliases
-none = nope = empty = Null = Empty(None)
+none = nope = empty = Null = _null = Empty(None)
 opt = option
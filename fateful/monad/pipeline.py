@@ -0,0 +1,205 @@
+import typing as t
+
+from fateful.monad.option import Empty, Null, Some
+from fateful.monad.result import Err, Ok, Result
+
+T = t.TypeVar("T")
+V = t.TypeVar("V")
+U = t.TypeVar("U")
+T_err = t.TypeVar("T_err", bound=Exception)
+
+
+class OptionPipeline(t.Generic[T, V]):
+    """
+    Lazy counterpart of `opt(x).map(f).map(g)`: steps are recorded, then run by a
+    single compiled function that checks for None after each step without
+    allocating intermediate containers. Pipelines are immutable and can be applied
+    to as many values as needed.
+
+    ```python
+    p = opt_pipeline().map(str.strip).map(lambda s: s or None).map(str.upper)
+    assert p("  a ") == Some("A")
+    assert p(None) == Null
+
+    # same as opt(x).map(...).or_("")
+    to_upper = p.or_("")
+    assert list(map(to_upper, [" a", "  "])) == ["A", ""]
+    ```
+    """
+
+    __slots__ = ("_steps", "_run")
+
+    def __init__(self, steps: tuple[t.Callable[[t.Any], t.Any], ...] = ()) -> None:
+        self._steps = steps
+        self._run = self._compile(Null, Some)
+
+    def map(self, fn: t.Callable[[V], U | None]) -> "OptionPipeline[T, U]":
+        """
+        Record a new step.
+
+        Args:
+            fn (t.Callable[[V], U | None]): function to apply on the current value,
+                returning None ends the pipeline with an empty result.
+
+        Returns:
+            OptionPipeline[T, U]: a new pipeline.
+        """
+        return OptionPipeline(self._steps + (fn,))
+
+    def _compile(
+        self, default: t.Any, wrap: t.Callable[[t.Any], t.Any] | None
+    ) -> t.Callable[[t.Any], t.Any]:
+        steps = self._steps
+
+        def run(value: t.Any) -> t.Any:
+            if value is None:
+                return default
+            for step in steps:
+                value = step(value)
+                if value is None:
+                    return default
+            return value if wrap is None else wrap(value)
+
+        return run
+
+    def or_(self, obj: U) -> t.Callable[[T | None], V | U]:
+        """
+        Compile the pipeline into a function returning the raw value or obj, like
+        `opt(x).map(...).or_(obj)`.
+
+        Args:
+            obj (U): value returned when the pipeline ends empty.
+
+        Returns:
+            t.Callable[[T | None], V | U]: compiled function.
+        """
+        return self._compile(obj, None)
+
+    def or_none(self) -> t.Callable[[T | None], V | None]:
+        """
+        Compile the pipeline into a function returning the raw value or None.
+
+        Returns:
+            t.Callable[[T | None], V | None]: compiled function.
+        """
+        return self._compile(None, None)
+
+    def __call__(self, value: T | None) -> Some[V] | Empty:
+        """
+        Run the pipeline on a value.
+
+        Args:
+            value (T | None): input value, None gives an empty result.
+
+        Returns:
+            Some[V] | Empty: the result of the pipeline.
+        """
+        return self._run(value)
+
+    def __str__(self) -> str:
+        return f"<OptionPipeline {len(self._steps)} steps>"
+
+
+class ResultPipeline(t.Generic[T, V, T_err]):
+    """
+    Lazy counterpart of `Ok(x).map(f).map(g)`: steps are recorded, then run by a
+    single compiled function inside one try block. Pipelines are immutable and can be
+    applied to as many values as needed.
+
+    ```python
+    p = try_pipeline(ValueError).map(str.strip).map(int).map(lambda v: v * 2)
+    assert p(" 21 ") == Ok(42)
+    assert p("x").is_error()
+    assert p.or_(0)("x") == 0
+    ```
+    """
+
+    __slots__ = ("_steps", "errors", "_run")
+
+    def __init__(
+        self,
+        exc: type[T_err] | tuple[type[T_err], ...] = (Exception,),  # type: ignore
+        steps: tuple[t.Callable[[t.Any], t.Any], ...] = (),
+    ) -> None:
+        """
+        Args:
+            exc (tuple[type[T_err], ...], optional): exceptions turned into `Err`,
+                other exceptions are raised. Defaults to (Exception,)
+            steps (tuple[t.Callable[[t.Any], t.Any], ...], optional): recorded steps.
+        """
+        self._steps = steps
+        self.errors = exc if isinstance(exc, tuple) else (exc,)
+        self._run = self._compile(Err, Ok)
+
+    def map(self, fn: t.Callable[[V], U]) -> "ResultPipeline[T, U, T_err]":
+        """
+        Record a new step.
+
+        Args:
+            fn (t.Callable[[V], U]): function to apply on the current value.
+
+        Returns:
+            ResultPipeline[T, U, T_err]: a new pipeline.
+        """
+        return ResultPipeline(self.errors, self._steps + (fn,))
+
+    def _compile(
+        self,
+        on_error: t.Callable[[Exception], t.Any],
+        wrap: t.Callable[[t.Any], t.Any] | None,
+    ) -> t.Callable[[t.Any], t.Any]:
+        steps, errors = self._steps, self.errors
+
+        def run(value: t.Any) -> t.Any:
+            try:
+                for step in steps:
+                    value = step(value)
+            except errors as e:
+                return on_error(e)
+            return value if wrap is None else wrap(value)
+
+        return run
+
+    def or_(self, obj: U) -> t.Callable[[T], V | U]:
+        """
+        Compile the pipeline into a function returning the raw value or obj when one
+        of the steps failed.
+
+        Args:
+            obj (U): value returned on failure.
+
+        Returns:
+            t.Callable[[T], V | U]: compiled function.
+        """
+        return self._compile(lambda _: obj, None)
+
+    def or_none(self) -> t.Callable[[T], V | None]:
+        """
+        Compile the pipeline into a function returning the raw value or None when one
+        of the steps failed.
+
+        Returns:
+            t.Callable[[T], V | None]: compiled function.
+        """
+        return self.or_(None)
+
+    def __call__(self, value: T) -> Result[V, T_err]:
+        """
+        Run the pipeline on a value.
+
+        Args:
+            value (T): input value.
+
+        Returns:
+            Result[V, T_err]: Ok with the result of the last step or Err with the
+            first caught exception.
+        """
+        return self._run(value)
+
+    def __str__(self) -> str:
+        return f"<ResultPipeline {len(self._steps)} steps>"
+
+
+# aliases
+opt_pipeline = OptionPipeline
+try_pipeline = ResultPipeline
@@ -1,7 +1,10 @@
 import abc
+import copy
 import functools
+import traceback
 import typing as t
 from dataclasses import dataclass
+from enum import Enum
 
 from fateful.monad.container import CommonContainer
 
@@ -11,6 +14,8 @@ P = t.ParamSpec("P")
 
 
 class ResultContainer(CommonContainer[T_co], abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def is_ok(self) -> bool:  # pragma: no cover
         ...
@@ -44,10 +49,72 @@ class ResultContainer(CommonContainer[T_co], abc.ABC):
 Nested: t.TypeAlias = "Ok[U | Nested[U]]"
 
 
-@dataclass(unsafe_hash=True, frozen=True)
+@dataclass(unsafe_hash=True, frozen=True, slots=True, init=False)
+class ErrorCode:
+    """
+    Lightweight error value for expected failures: an error code and an optional
+    payload. `Err` accepts it in place of an exception, the exception is only built
+    when the error is actually raised, see `CodedError`.
+
+    ```python
+    def find(user_id: int) -> Ok[User] | Err[ErrorCode]:
+        user = users.get(user_id)
+        return Ok(user) if user else err_code("not_found")
+
+    find(1).match(
+        Ok(_) >> identity,
+        Err(ErrorCode("not_found", _)) >> (lambda payload: None),
+    )
+    ```
+    """
+
+    code: str
+    payload: t.Any = None
+
+    def __init__(self, code: str, payload: t.Any = None) -> None:
+        _set_code(self, code)
+        _set_payload(self, payload)
+
+    def to_exception(self) -> "CodedError":
+        """
+        Returns:
+            CodedError: a new exception carrying the code and the payload.
+        """
+        return CodedError(self)
+
+    def __str__(self) -> str:
+        if self.payload is None:
+            return self.code
+        return f"{self.code}: {self.payload!r}"
+
+
+_set_code = ErrorCode.code.__set__  # type: ignore[attr-defined]
+_set_payload = ErrorCode.payload.__set__  # type: ignore[attr-defined]
+
+
+class CodedError(Exception):
+    """
+    Exception raised when getting the value of an `Err` carrying an `ErrorCode`.
+    """
+
+    def __init__(self, error: ErrorCode):
+        super().__init__(str(error))
+        self.error = error
+        self.code = error.code
+        self.payload = error.payload
+
+
+def _raisable(error: "BaseException | ErrorCode") -> BaseException:
+    return error.to_exception() if isinstance(error, ErrorCode) else error
+
+
+@dataclass(unsafe_hash=True, frozen=True, slots=True, init=False)
 class Ok(ResultContainer[T_co]):
     _under: T_co
 
+    def __init__(self, _under: T_co) -> None:
+        _set_ok_under(self, _under)
+
     def is_error(self) -> bool:
         return False
 
@@ -83,7 +150,11 @@ class Ok(ResultContainer[T_co]):
         return self
 
     def map(self, fn: t.Callable[[T_co], U]) -> "Ok[U] | Err[Exception]":
-        return sync_try(fn)(self._under)
+        # same semantic as sync_try(fn)(self._under) without building a closure
+        try:
+            return Ok(fn(self._under))
+        except Exception as e:
+            return Err(e)
 
     def __iter__(self) -> "t.Iterator[T_co]":
         yield self.flatten().get()
@@ -120,7 +191,7 @@ class Ok(ResultContainer[T_co]):
         x = self._under
         while isinstance(x, CommonContainer):
             x = x._under  # type: ignore
-        return Ok(x) if not isinstance(x, Exception) else Err(x)
+        return Ok(x) if not isinstance(x, (Exception, ErrorCode)) else Err(x)
 
     @property
     def _(self) -> T_co:
@@ -132,19 +203,113 @@ class Ok(ResultContainer[T_co]):
     def __str__(self):
         return f"<Ok {repr(self._under)}>"
 
+    def __reduce__(self) -> tuple[type["Ok[T_co]"], tuple[T_co]]:
+        # compact pickle payload: the class and the value, no dataclass state
+        return Ok, (self._under,)
+
+    def __deepcopy__(self, memo: dict[int, t.Any]) -> "Ok[T_co]":
+        # explicit, otherwise the lookup is forwarded to the value by __getattr__
+        return Ok(copy.deepcopy(self._under, memo))
+
+
+# frozen containers write their single slot through the slot descriptor directly,
+# which is cheaper than the object.__setattr__ call generated by dataclasses
+_set_ok_under = Ok._under.__set__  # type: ignore[attr-defined]
 
-T_error = t.TypeVar("T_error", bound=BaseException, covariant=True)
 
+T_error = t.TypeVar("T_error", bound=BaseException | ErrorCode, covariant=True)
+E = t.TypeVar("E", bound=BaseException)
 
-@dataclass(unsafe_hash=True, frozen=True)
+
+class TracebackPolicy(str, Enum):
+    """
+    What an `Err` keeps of the traceback of its exception. A live traceback keeps
+    every frame of the stack, and their local variables, alive.
+    """
+
+    KEEP = "keep"
+    """keep the live traceback"""
+    SUMMARY = "summary"
+    """replace the traceback by a `traceback.StackSummary`, without locals"""
+    DROP = "drop"
+    """drop the traceback"""
+
+
+def trim_traceback(error: E, policy: TracebackPolicy = TracebackPolicy.DROP) -> E:
+    """
+    Release the traceback of an exception, of its cause and context, and of the
+    members of exception groups, according to the policy. With
+    `TracebackPolicy.SUMMARY`, the summary is kept in the `__stack_summary__`
+    attribute of the exception, see `Err.stack`.
+
+    Args:
+        error (E): exception to trim, modified in place.
+        policy (TracebackPolicy, optional): Defaults to TracebackPolicy.DROP.
+
+    Returns:
+        E: the exception.
+    """
+    if policy is TracebackPolicy.KEEP:
+        return error
+    # cause, context and members of exception groups, the seen set guards cycles
+    pending: list[t.Any] = [error]
+    seen: set[int] = set()
+    while pending:
+        current = pending.pop()
+        if not isinstance(current, BaseException) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        tb = current.__traceback__
+        if tb is not None:
+            if policy is TracebackPolicy.SUMMARY:
+                current.__stack_summary__ = traceback.extract_tb(tb)  # type: ignore
+            current.__traceback__ = None
+        pending.append(current.__cause__)
+        pending.append(current.__context__)
+        members = getattr(current, "exceptions", None)
+        if isinstance(members, tuple):
+            pending.extend(members)
+    return error
+
+
+@dataclass(unsafe_hash=True, frozen=True, slots=True, init=False)
 class Err(ResultContainer[T_error]):
     """ """
 
     _under: T_error
 
-    def __post_init__(self):
-        if not issubclass(self._under.__class__, Exception):
-            raise ValueError("Err should carry an exception class")
+    def __init__(
+        self,
+        _under: T_error,
+        traceback_policy: TracebackPolicy = TracebackPolicy.KEEP,
+    ) -> None:
+        """
+        Args:
+            _under (T_error): the exception or the error code.
+            traceback_policy (TracebackPolicy, optional): what to keep of the
+                traceback of the exception. Defaults to TracebackPolicy.KEEP.
+        """
+        if not isinstance(_under, (Exception, ErrorCode)):
+            raise ValueError("Err should carry an exception class or an ErrorCode")
+        if traceback_policy is not TracebackPolicy.KEEP and isinstance(
+            _under, Exception
+        ):
+            trim_traceback(_under, traceback_policy)
+        _set_err_under(self, _under)
+
+    def stack(self) -> traceback.StackSummary | None:
+        """
+        Summary of the traceback of the exception, either extracted from the live
+        traceback or kept by `TracebackPolicy.SUMMARY`.
+
+        Returns:
+            traceback.StackSummary | None: None if the traceback was dropped.
+        """
+        if isinstance(self._under, ErrorCode):
+            return None
+        if self._under.__traceback__ is not None:
+            return traceback.extract_tb(self._under.__traceback__)
+        return getattr(self._under, "__stack_summary__", None)
 
     def unwrap(self) -> T_error:
         return self._under
@@ -167,7 +332,7 @@ class Err(ResultContainer[T_error]):
         return False
 
     def get(self) -> t.NoReturn:
-        raise self._under
+        raise _raisable(self._under)
 
     def or_(self, obj: U) -> U:
         return obj
@@ -177,8 +342,8 @@ class Err(ResultContainer[T_error]):
 
     def or_raise(self, exc: Exception | None = None) -> t.NoReturn:
         if exc is not None:
-            raise exc from self._under
-        raise self._under
+            raise exc from _raisable(self._under)
+        raise _raisable(self._under)
 
     def or_none(self):
         return None
@@ -208,8 +373,43 @@ class Err(ResultContainer[T_error]):
     def __str__(self) -> str:
         return f"<Err {repr(self._under)}>"
 
+    def __reduce__(self) -> tuple[type["Err[T_error]"], tuple[T_error]]:
+        # exceptions pickle their class and args only: the traceback frames,
+        # __cause__ and __context__ are not sent
+        return Err, (self._under,)
+
+
+_set_err_under = Err._under.__set__  # type: ignore[attr-defined]
+
+_interned_codes: dict[str, Err[ErrorCode]] = {}
+
+
+def err_code(code: str, payload: t.Any = None) -> Err[ErrorCode]:
+    """
+    Build an `Err` carrying an `ErrorCode`. Without payload, the same `Err` instance
+    is returned for a given code, so returning an expected error does not allocate.
 
-RESULT_MATCHABLE_CLASSES = {Ok, Err}
+    Args:
+        code (str): error code, expected to belong to a fixed set of codes.
+        payload (t.Any, optional): data attached to the error. Defaults to None.
+
+    Returns:
+        Err[ErrorCode]: the error.
+
+    ```python
+    assert err_code("not_found") is err_code("not_found")
+    err_code("invalid", {"field": "name"}).or_raise()  # 🔥 CodedError
+    ```
+    """
+    if payload is not None:
+        return Err(ErrorCode(code, payload))
+    interned = _interned_codes.get(code)
+    if interned is None:
+        interned = _interned_codes.setdefault(code, Err(ErrorCode(code)))
+    return interned
+
+
+RESULT_MATCHABLE_CLASSES = frozenset({Ok, Err})
 
 Ok.__matchable_classes__ = RESULT_MATCHABLE_CLASSES
 Err.__matchable_classes__ = RESULT_MATCHABLE_CLASSES
@@ -220,11 +420,14 @@ Result = t.Union[Ok[T_co], Err[T_error]]
 def sync_try(
     f: t.Callable[P, T_co],
     exc: type[T_error] | tuple[type[T_error], ...] = (Exception,),  # type: ignore
+    traceback_policy: TracebackPolicy = TracebackPolicy.KEEP,
 ) -> t.Callable[P, Result[T_co, T_error]]:
     """
     Run a function that may raise an exception and return a Result type.
     Args:
         exc (tuple[type[T_err], ...], optional): _description_. Defaults to (Exception,)
+        traceback_policy (TracebackPolicy, optional): what the returned Err keeps of
+            the traceback. Defaults to TracebackPolicy.KEEP.
     """
 
     def inner(*args: P.args, **kwargs: P.kwargs) -> Result[T_co, T_error]:
@@ -234,25 +437,30 @@ def sync_try(
             errors = exc if isinstance(exc, tuple) else (exc,)
             for err in errors:
                 if isinstance(e, err):
-                    return Err(e)
+                    return Err(e, traceback_policy)
             raise
 
     return inner
 
 
 def to_result(
-    exc: type[T_error] | tuple[type[T_error], ...] = (Exception,)  # type: ignore
+    exc: type[T_error] | tuple[type[T_error], ...] = (Exception,),  # type: ignore
+    traceback_policy: TracebackPolicy = TracebackPolicy.KEEP,
 ) -> t.Callable[[t.Callable[P, T_co]], t.Callable[P, Result[T_co, T_error]]]:
     """
     Decorator to convert a function that may raise an exception to a Result type.
 
     Args:
         exc (tuple[type[T_err], ...], optional): _description_. Defaults to (Exception,)
+        traceback_policy (TracebackPolicy, optional): what the returned Err keeps of
+            the traceback. Defaults to TracebackPolicy.KEEP.
 
     Returns:
         _type_: _description_
     """
-    return functools.partial(sync_try, exc=exc)  # type: ignore
+    return functools.partial(  # type: ignore
+        sync_try, exc=exc, traceback_policy=traceback_policy
+    )
 
 
 class ResultShortcutError(Exception, t.Generic[T_error]):
@@ -267,25 +475,99 @@ class ResultShortcutError(Exception, t.Generic[T_error]):
         self.error = error
 
 
+@t.overload
 def result_shortcut(
-    f: t.Callable[P, Result[T_co, T_error]]
+    f: t.Callable[P, Result[T_co, T_error]],
+    *,
+    traceback_policy: TracebackPolicy = ...,
 ) -> t.Callable[P, Result[T_co, T_error]]:
+    ...
+
+
+@t.overload
+def result_shortcut(
+    f: None = None,
+    *,
+    traceback_policy: TracebackPolicy = ...,
+) -> t.Callable[
+    [t.Callable[P, Result[T_co, T_error]]], t.Callable[P, Result[T_co, T_error]]
+]:
+    ...
+
+
+def result_shortcut(
+    f: t.Callable[P, Result[T_co, T_error]] | None = None,
+    *,
+    traceback_policy: TracebackPolicy = TracebackPolicy.KEEP,
+) -> t.Any:
     """
     _summary_
 
     Args:
         f (t.Callable[P_mapper, V]): _description_
+        traceback_policy (TracebackPolicy, optional): what the returned Err keeps of
+            the traceback. Defaults to TracebackPolicy.KEEP.
 
     Returns:
         t.Callable[P_mapper, Ok[V] | Err[t.Any]]: _description_
+
+    ```python
+    @result_shortcut(traceback_policy=TracebackPolicy.DROP)
+    def compute(x: int) -> Ok[float] | Err[ZeroDivisionError]:
+        return Ok(divide(x)._ + 1)
+    ```
     """
+    if f is None:
+        return functools.partial(result_shortcut, traceback_policy=traceback_policy)
 
     def inner(*args: P.args, **kwargs: P.kwargs) -> Ok[T_co] | Err[T_error]:
         try:
-            return Ok(f(*args, **kwargs))  # type: ignore[arg-type]
+            return Ok(f(*args, **kwargs))  # type: ignore[arg-type, misc]
         except Exception as e:
             if isinstance(e, ResultShortcutError):
-                return Err(e.error)
+                return Err(e.error, traceback_policy)
             raise
 
     return inner
+
+
+def do_result(
+    f: t.Callable[P, t.Generator[Result[t.Any, T_error], t.Any, T_co]]
+) -> t.Callable[P, Result[T_co, T_error]]:
+    """
+    Exception free counterpart of `result_shortcut`: each step `yield`s a result, an
+    `Ok` sends back its value while the first `Err` stops the generator and is
+    returned, without raising anything. The returned value is wrapped in `Ok` unless
+    it already is a result.
+
+    ```python
+    @do_result
+    def compute(x: int) -> t.Generator[Ok[float] | Err[Exception], float, float]:
+        val = yield divide(x)
+        result = yield square(val)
+        return result
+
+    assert compute(0).is_error()
+    ```
+    """
+
+    @functools.wraps(f)
+    def inner(*args: P.args, **kwargs: P.kwargs) -> Result[T_co, T_error]:
+        gen = f(*args, **kwargs)
+        send = gen.send
+        value: t.Any = None
+        try:
+            while True:
+                step = send(value)
+                if type(step) is Ok or isinstance(step, Ok):
+                    value = step._under
+                    continue
+                gen.close()
+                if isinstance(step, Err):
+                    return step
+                raise TypeError(f"do_result steps must yield results, got {step!r}")
+        except StopIteration as stop:
+            result = stop.value
+            return result if isinstance(result, (Ok, Err)) else Ok(result)
+
+    return inner
@@ -0,0 +1,142 @@
+import os
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+from fateful.iter import chunked
+from fateful.monad.result import Result, sync_try
+
+T = t.TypeVar("T")
+U = t.TypeVar("U")
+T_err = t.TypeVar("T_err", bound=Exception)
+
+Backend = t.Literal["thread", "process"]
+
+_pools: dict[tuple[Backend, int], Executor] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool(backend: Backend, workers: int) -> Executor:
+    """return a warm executor shared by all calls with the same backend / workers"""
+    key = (backend, workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            if backend == "thread":
+                pool = ThreadPoolExecutor(workers, thread_name_prefix="fateful")
+            elif backend == "process":
+                pool = ProcessPoolExecutor(workers)
+            else:
+                raise ValueError(f"Unknown backend {backend!r}")
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    """
+    Shutdown the executors created by `try_map`, next calls start new ones.
+
+    Args:
+        wait (bool, optional): wait for running tasks. Defaults to True.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+def _run_chunk(
+    fn: t.Callable[[T], U],
+    exc: type[T_err] | tuple[type[T_err], ...],
+    items: list[T],
+) -> list[Result[U, T_err]]:
+    # runs in the worker, exceptions not in exc propagate through the future
+    f = sync_try(fn, exc)
+    return [f(item) for item in items]
+
+
+def try_map(
+    fn: t.Callable[[T], U],
+    iterable: t.Iterable[T],
+    *,
+    exc: type[T_err] | tuple[type[T_err], ...] = (Exception,),  # type: ignore
+    backend: Backend = "thread",
+    workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+    executor: Executor | None = None,
+) -> t.Iterator[Result[U, T_err]]:
+    """
+    Parallel `map(sync_try(fn, exc), iterable)` over a thread or process pool.
+
+    Exceptions of the exc types raised in workers come back as `Err` carrying the
+    original exception, other exceptions are raised when the corresponding result is
+    reached. Pools are kept warm between calls, see `shutdown_pools`.
+
+    Items are sent to workers by chunks of chunksize items and at most
+    2 * workers chunks are in flight, so the iterable is consumed lazily.
+
+    Args:
+        fn (t.Callable[[T], U]): function to run, it must be picklable with the
+            process backend (i.e. defined at module level).
+        iterable (t.Iterable[T]): items.
+        exc (tuple[type[T_err], ...], optional): exceptions turned into `Err`.
+            Defaults to (Exception,).
+        backend (t.Literal["thread", "process"], optional): pool type.
+            Defaults to "thread".
+        workers (int | None, optional): number of workers. Defaults to the number
+            of cpus.
+        chunksize (int, optional): number of items per task. Defaults to 1.
+        ordered (bool, optional): yield results in the order of the items, or as
+            soon as their chunk is done. Defaults to True.
+        executor (Executor | None, optional): executor to use instead of a shared
+            warm pool.
+
+    Yields:
+        Result[U, T_err]: one result per item.
+
+    ```python
+    for result in try_map(parse_file, paths, exc=OSError, backend="process"):
+        match result:
+            case Ok(content):
+                ...
+            case Err(e):
+                logging.error(e)
+    ```
+    """
+    workers = workers or os.cpu_count() or 1
+    pool = executor if executor is not None else _pool(backend, workers)
+    chunks = chunked(iterable, chunksize)
+    window = 2 * workers
+
+    def submit() -> Future | None:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return None
+        return pool.submit(_run_chunk, fn, exc, chunk)
+
+    pending: deque[Future] = deque()
+    try:
+        while len(pending) < window and (future := submit()) is not None:
+            pending.append(future)
+        while pending:
+            if ordered:
+                done = pending.popleft()
+            else:
+                done = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                pending.remove(done)
+            if (future := submit()) is not None:
+                pending.append(future)
+            yield from done.result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,128 @@
+import random
+import threading
+import typing as t
+from dataclasses import dataclass
+
+from fateful.monad.result import Result
+
+Backoff = t.Literal["exponential", "linear", "constant"] | t.Callable[[int], float]
+Jitter = t.Literal["full", "equal"] | None
+
+
+class RetryBudget:
+    """
+    Retry budget shared by the calls to a dependency, so that retries can not
+    multiply the load on a failing dependency.
+
+    A token bucket: it starts full, each failed attempt takes one token, each
+    success gives back token_ratio token. Retries are allowed while more than half
+    of the tokens are left, i.e. under sustained failures at most one retry per
+    1 / token_ratio successful calls.
+
+    ```python
+    users_budget = RetryBudget(max_tokens=10, token_ratio=0.1)
+
+    get_user = async_try(fetch_user).retry(3, budget=users_budget)
+    get_users = async_try(fetch_users).retry(3, budget=users_budget)
+    ```
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1) -> None:
+        """
+        Args:
+            max_tokens (float, optional): size of the bucket. Defaults to 10.
+            token_ratio (float, optional): tokens given back by a success.
+                Defaults to 0.1.
+        """
+        if max_tokens <= 0 or token_ratio < 0:
+            raise ValueError("max_tokens must be positive, token_ratio not negative")
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """tokens left"""
+        return self._tokens
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of an attempt."""
+        with self._lock:
+            if ok:
+                self._tokens = min(self._tokens + self.token_ratio, self.max_tokens)
+            else:
+                self._tokens = max(self._tokens - 1, 0.0)
+
+    def allows_retry(self) -> bool:
+        """Whether a failed attempt can be retried."""
+        return self._tokens > self.max_tokens / 2
+
+    def __repr__(self) -> str:
+        return f"<RetryBudget {self._tokens:g}/{self.max_tokens:g} tokens>"
+
+
+@dataclass(frozen=True)
+class RetryEvent:
+    """
+    Attempt reported to the hook of `AsyncTry.retry`.
+
+    Attributes:
+        attempt (int): number of the attempt, from 1.
+        result (Result[t.Any, t.Any]): its result.
+        delay (float | None): seconds before the next attempt, None if there is no
+            next attempt.
+        final (bool): the result is the one of the AsyncTry.
+    """
+
+    attempt: int
+    result: Result[t.Any, t.Any]
+    delay: float | None
+    final: bool
+
+
+def delays(
+    backoff: Backoff = "exponential",
+    delay: float = 0.1,
+    max_delay: float = 10.0,
+    jitter: Jitter = "full",
+) -> t.Callable[[int], float]:
+    """
+    Build the function giving the delay before the retry following an attempt.
+
+    Args:
+        backoff (Backoff, optional): "exponential" (delay * 2 ** (attempt - 1)),
+            "linear" (delay * attempt), "constant" (delay) or a function of the
+            attempt number. Defaults to "exponential".
+        delay (float, optional): base delay in seconds. Defaults to 0.1.
+        max_delay (float, optional): delays are capped to max_delay seconds.
+            Defaults to 10.
+        jitter (t.Literal["full", "equal"] | None, optional): randomize the delays
+            so that clients failing together do not retry together: "full" draws
+            the delay in [0, d], "equal" in [d / 2, d]. Defaults to "full".
+
+    Returns:
+        t.Callable[[int], float]: delay in seconds after an attempt.
+    """
+    if not callable(backoff) and backoff not in ("exponential", "linear", "constant"):
+        raise ValueError(f"Unknown backoff {backoff!r}")
+    if jitter not in (None, "full", "equal"):
+        raise ValueError(f"Unknown jitter {jitter!r}")
+
+    def next_delay(attempt: int) -> float:
+        if callable(backoff):
+            d = backoff(attempt)
+        elif backoff == "exponential":
+            d = delay * 2 ** min(attempt - 1, 64)
+        elif backoff == "linear":
+            d = delay * attempt
+        else:
+            d = delay
+        d = min(d, max_delay)
+        if jitter == "full":
+            return random.uniform(0, d)
+        if jitter == "equal":
+            return d / 2 + random.uniform(0, d / 2)
+        return d
+
+    return next_delay
@@ -0,0 +1,82 @@
+import asyncio
+import contextlib
+import sys
+import time
+import typing as t
+from contextvars import ContextVar
+
+T = t.TypeVar("T")
+
+# absolute deadline on the time.monotonic clock, shared by the tasks started inside
+_deadline: ContextVar[float | None] = ContextVar("fateful_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float | None) -> t.Iterator[float | None]:
+    """
+    Set a deadline seconds from now for the code run inside the context, including
+    the tasks it starts. Nested deadlines can only shorten the current one.
+
+    The deadline is enforced by `AsyncTry.timeout` and turned into the timeout of
+    `fateful.http` requests, steps can read their budget with `remaining`.
+
+    Args:
+        seconds (float | None): budget, None keeps the current deadline.
+
+    Yields:
+        float | None: the deadline, on the time.monotonic clock, None if there is no
+        deadline.
+
+    ```python
+    with deadline(0.5):
+        user = await try_get(user_url, session=session).timeout()
+        # the requests of get_orders share what is left of the 500 ms
+        orders = await async_try(get_orders).timeout()(user)
+    ```
+    """
+    current = _deadline.get()
+    if seconds is None:
+        yield current
+        return
+    at = time.monotonic() + seconds
+    if current is not None and current < at:
+        at = current
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """
+    Returns:
+        float | None: seconds left before the current deadline, 0 when it has
+        passed, None outside of a deadline.
+    """
+    at = _deadline.get()
+    if at is None:
+        return None
+    return max(at - time.monotonic(), 0.0)
+
+
+async def wait_until(awaitable: t.Awaitable[T], at: float) -> T:
+    """
+    Await awaitable, cancelling it and raising TimeoutError at the deadline.
+
+    Args:
+        awaitable (t.Awaitable[T]): awaitable to run.
+        at (float): deadline on the time.monotonic clock.
+
+    Raises:
+        TimeoutError: the deadline has passed.
+    """
+    if sys.version_info >= (3, 11):
+        loop = asyncio.get_running_loop()
+        async with asyncio.timeout_at(loop.time() + at - time.monotonic()):
+            return await awaitable
+    try:  # pragma: no cover
+        return await asyncio.wait_for(awaitable, at - time.monotonic())
+    except asyncio.TimeoutError:  # pragma: no cover
+        # not the builtin TimeoutError before python 3.11
+        raise TimeoutError() from None
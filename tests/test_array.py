@@ -0,0 +1,136 @@
+import pytest
+from assertpy import assert_that
+
+import fateful.monad.array as array_module
+from fateful.monad.array import OptionArray, ResultArray, opt_array, sync_try_array
+from fateful.monad.option import Null, Some
+from fateful.monad.result import Err, Ok
+
+
+def test_option_array():
+    x = opt_array([1, None, 3])
+    assert_that(len(x)).is_equal_to(3)
+    assert_that(x.count()).is_equal_to(2)
+    assert_that(x.to_list()).is_equal_to([Some(1), Null, Some(3)])
+    assert_that(list(x)).is_equal_to([Some(1), Null, Some(3)])
+    assert_that(x[1]).is_equal_to(Null)
+    assert_that(x[-1]).is_equal_to(Some(3))
+    assert_that(list(x.or_(0))).is_equal_to([1, 0, 3])
+    assert_that(x.or_none()).is_equal_to([1, None, 3])
+    assert_that(list(x.is_some())).is_equal_to([True, False, True])
+    assert_that(list(x.is_empty())).is_equal_to([False, True, False])
+
+
+def test_option_array_map():
+    x = opt_array([1, None, 3, 4], dtype=int)
+    assert_that(x.map(lambda v: v * 2).to_list()).is_equal_to(
+        [Some(2), Null, Some(6), Some(8)]
+    )
+    assert_that(x.map(lambda v: None if v == 3 else v).to_list()).is_equal_to(
+        [Some(1), Null, Null, Some(4)]
+    )
+    doubled = x.map(lambda values: [v * 2 for v in values], vectorized=True)
+    assert_that(doubled.or_none()).is_equal_to([2, None, 6, 8])
+
+    nested = opt_array([[1, 2], None])
+    assert_that(nested.to_list()).is_equal_to([Some([1, 2]), Null])
+
+
+def test_option_array_filter_flatten():
+    x = opt_array([1, 2, None, 4])
+    assert_that(x.filter(lambda v: v % 2 == 0).to_list()).is_equal_to(
+        [Null, Some(2), Null, Some(4)]
+    )
+    evens = x.filter(lambda values: [v % 2 == 0 for v in values], vectorized=True)
+    assert_that(evens.or_none()).is_equal_to([None, 2, None, 4])
+
+    nested = OptionArray.from_options([Some(Some(1)), Some(Null), Null])
+    assert_that(nested.flatten().to_list()).is_equal_to([Some(1), Null, Null])
+
+
+def test_option_array_numpy():
+    np = pytest.importorskip("numpy")
+    x = opt_array([1.0, None, 4.0], dtype=float)
+    assert_that(x.map(np.sqrt, vectorized=True).or_none()).is_equal_to([1.0, None, 2.0])
+    assert_that(x.or_(np.nan).dtype).is_equal_to(np.dtype(float))
+
+
+def test_result_array():
+    x = sync_try_array(lambda v: 1 / v)([1, 0, 2])
+    assert_that(len(x)).is_equal_to(3)
+    assert_that(x.errors()).contains_key(1)
+    assert_that(x[1]).is_instance_of(Err)
+    assert_that(x[0]).is_equal_to(Ok(1.0))
+    assert_that(list(x.or_(0.0))).is_equal_to([1.0, 0.0, 0.5])
+    assert_that(list(x.is_ok())).is_equal_to([True, False, True])
+    assert_that(list(x.is_error())).is_equal_to([False, True, False])
+
+    mapped = x.map(lambda v: v / (v - 1))
+    assert_that([r.is_ok() for r in mapped]).is_equal_to([False, False, True])
+    assert_that(mapped.to_list()[2]).is_equal_to(Ok(-1.0))
+
+    failed = x.map(lambda values: 1 / 0, vectorized=True)
+    assert_that(failed.errors().keys()).is_length(3)
+
+    with pytest.raises(ZeroDivisionError):
+        sync_try_array(lambda v: 1 / v, ValueError)([0])
+
+
+def test_result_array_flatten():
+    error = ValueError()
+    x = ResultArray.from_results([Ok(Ok(1)), Ok(Err(error)), Err(error)])
+    assert_that(x.flatten().to_list()).is_equal_to([Ok(1), Err(error), Err(error)])
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(array_module, "np", None)
+    return request.param
+
+
+def _types(values: list) -> list:
+    return [type(v.or_none()) if hasattr(v, "or_none") else type(v) for v in values]
+
+
+def test_backends(backend):
+    ints = opt_array([1, None, 3], dtype="int64")
+    assert_that(ints.to_list()).is_equal_to([Some(1), Null, Some(3)])
+    assert_that(_types(ints.to_list())).is_equal_to([int, type(None), int])
+    assert_that(_types(list(ints))).is_equal_to([int, type(None), int])
+    assert_that(_types(ints.or_none())).is_equal_to([int, type(None), int])
+    assert_that(type(ints[0].get())).is_equal_to(int)
+    seen = []
+    ints.map(seen.append)
+    assert_that(_types(seen)).is_equal_to([int, int])
+
+    flags = opt_array([True, None, False], dtype=bool)
+    assert_that(flags.or_none()).is_equal_to([True, None, False])
+    assert_that(_types(flags.or_none())).is_equal_to([bool, type(None), bool])
+    assert_that(type(flags[2].get())).is_equal_to(bool)
+
+    parsed = sync_try_array(int, ValueError, dtype="int64")(["1", "x", "3"])
+    assert_that([r.or_none() for r in parsed]).is_equal_to([1, None, 3])
+    assert_that(type(parsed[0].get())).is_equal_to(int)
+    assert_that(type(parsed.to_list()[2].get())).is_equal_to(int)
+    floats = opt_array([0.5, None], dtype="float64")
+    assert_that(_types(floats.or_none())).is_equal_to([float, type(None)])
+
+    with pytest.raises(TypeError):
+        opt_array([1], dtype=3)
+
+
+def test_numpy_dtype():
+    np = pytest.importorskip("numpy")
+    x = opt_array([1, None], dtype=np.dtype("int32"))
+    assert_that(x.or_none()).is_equal_to([1, None])
+    assert_that(type(x[0].get())).is_equal_to(int)
+
+    y = ResultArray.from_results([Ok(1.0), Ok(4.0)], dtype=float)
+    roots = y.map(np.sqrt, vectorized=True).to_list()
+    assert_that(roots).is_equal_to([Ok(1.0), Ok(2.0)])
+    assert_that([type(r.get()) for r in roots]).is_equal_to([float, float])
+    roots = y.map(lambda v: [np.sqrt(x) for x in v], vectorized=True).to_list()
+    assert_that([type(r.get()) for r in roots]).is_equal_to([float, float])
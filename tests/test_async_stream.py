@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from assertpy import assert_that
+
+from fateful.monad.async_stream import AsyncTryStream
+from fateful.monad.result import Err, Ok
+
+
+async def numbers(n: int, produced: list[int] | None = None):
+    for i in range(n):
+        await asyncio.sleep(0)
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+async def collect(stream: AsyncTryStream) -> list:
+    return [result async for result in stream]
+
+
+async def double_async(x: int) -> int:
+    await asyncio.sleep(0)
+    return x * 2
+
+
+@pytest.mark.asyncio
+async def test_steps():
+    stream = AsyncTryStream(numbers(4)).map(double_async).map(lambda x: 12 // (x - 2))
+    results = await collect(stream)
+    assert_that(results[0]).is_equal_to(Ok(-6))
+    assert_that(results[1]._under).is_instance_of(ZeroDivisionError)
+    assert_that(results[2:]).is_equal_to([Ok(6), Ok(3)])
+
+    stream = (
+        AsyncTryStream(range(4))
+        .map(lambda x: 12 // (x - 1))
+        .recover(lambda: 0)
+        .filter(lambda x: x >= 0)
+        .flat_map(lambda x: [x, x])
+    )
+    assert_that(await collect(stream)).is_equal_to(
+        [Ok(0), Ok(0), Ok(12), Ok(12), Ok(6), Ok(6)]
+    )
+
+    async def page(n: int) -> list[int]:
+        return [n * 10, n * 10 + 1]
+
+    pages = (
+        AsyncTryStream(numbers(2))
+        .flat_map(page)
+        .flat_map(lambda x: AsyncTryStream([x]).map(str))
+    )
+    assert_that(await collect(pages)).is_equal_to(
+        [Ok("0"), Ok("1"), Ok("10"), Ok("11")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_errors():
+    async def failing():
+        yield 1
+        raise ConnectionError()
+
+    results = await collect(AsyncTryStream(failing()).map(str))
+    assert_that(results[0]).is_equal_to(Ok("1"))
+    assert_that(results[1]._under).is_instance_of(ConnectionError)
+    assert_that(results).is_length(2)
+
+    results = await collect(AsyncTryStream(range(2)).filter(lambda x: 1 / x))
+    assert_that(results[0]).is_instance_of(Err)
+    assert_that(results[1:]).is_equal_to([Ok(1)])
+
+    with pytest.raises(ZeroDivisionError):
+        await collect(AsyncTryStream(range(2), KeyError).map(lambda x: 1 / x))
+    with pytest.raises(ValueError):
+        AsyncTryStream(range(2)).buffer(0)
+
+
+@pytest.mark.asyncio
+async def test_backpressure():
+    produced: list[int] = []
+    stream = AsyncTryStream(numbers(100, produced)).map(lambda x: x + 1)
+
+    # lazy: nothing is read before iterating, then one element at a time
+    iterator = stream.__aiter__()
+    assert_that(produced).is_empty()
+    assert_that(await iterator.__anext__()).is_equal_to(Ok(1))
+    assert_that(produced).is_equal_to([0])
+    # closing the stream closes the source
+    await iterator.aclose()
+    assert_that(await collect(stream)).is_empty()
+
+    produced.clear()
+    stream = AsyncTryStream(numbers(100, produced)).map(lambda x: x + 1)
+    iterator = stream.buffer(5).__aiter__()
+    assert_that(await iterator.__anext__()).is_equal_to(Ok(1))
+    for _ in range(20):
+        await asyncio.sleep(0)
+    # the queue holds 5 results, the producer waits with the next one
+    assert_that(len(produced)).is_between(6, 7)
+    await iterator.aclose()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    count = len(produced)
+    await asyncio.sleep(0.01)
+    assert_that(produced).is_length(count)
+
+    async def failing():
+        yield 1
+        raise KeyError()
+
+    with pytest.raises(KeyError):
+        await collect(AsyncTryStream(failing(), ValueError).buffer(2))
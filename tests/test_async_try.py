@@ -3,10 +3,13 @@ import asyncio
 import pytest
 from assertpy import assert_that
 
-from fateful.monad.async_result import AsyncTry, async_try, lift_future
-from fateful.monad.func import _, default
+from fateful.hedge import LatencyPercentile
+from fateful.monad.async_result import AsyncTry, async_try, do_async, lift_future
+from fateful.monad.func import _, compile_match, default
 from fateful.monad.option import Some, opt
-from fateful.monad.result import Ok
+from fateful.monad.result import Err, Ok, TracebackPolicy, sync_try
+from fateful.retry import RetryBudget
+from fateful.timeouts import deadline, remaining
 
 
 class A:
@@ -92,6 +95,8 @@ async def test_async_opt():
         .match(Ok(_), default >> 1)
     )
     assert_that(value).is_equal_to(3.0)
+    route = compile_match(Ok(_) >> (lambda v: v + 1), default >> 0)
+    assert_that(await async_try(add_async)(1, 2).match(route)).is_equal_to(4)
 
     assert_that(await async_try(add_async)(1, 2).is_error()).is_false()
     #
@@ -177,3 +182,466 @@ async def test_async_opt():
     x = AsyncTry(f, ZeroDivisionError)
     await x(1).map(lambda x: x + 1).or_(0.0)
     await x(0).map(lambda x: str(x)).or_("")
+
+
+@pytest.mark.asyncio
+async def test_call_does_not_mutate():
+    add = async_try(add_async)
+    one, two = add(0, 1), add(1, 1)
+    assert_that(one).is_not_same_as(add)
+    assert_that(add.args).is_equal_to(())
+    results = await asyncio.gather(one.execute(), two.execute())
+    assert_that(results).is_equal_to([Ok(1), Ok(2)])
+
+
+@pytest.mark.asyncio
+async def test_traceback_policy():
+    result = (
+        await async_try(async_raise, traceback_policy=TracebackPolicy.DROP)()
+        .map(lambda x: x)
+        .execute()
+    )
+    assert_that(result.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(result.unwrap().__traceback__).is_none()
+
+    result = await async_try(async_raise).execute()
+    assert_that(result.unwrap().__traceback__).is_not_none()
+
+
+@pytest.mark.asyncio
+async def test_do_async():
+    @do_async
+    async def compute(a: int, b: int):
+        total = yield await async_try(add_async)(a, b).execute()
+        doubled = yield async_try(async_identity)(total * 2)
+        inverse = yield sync_try(lambda: 1 / doubled)()
+        yield Ok(inverse)
+
+    assert_that(await compute(1, 1)).is_equal_to(Ok(0.25))
+    result = await compute(0, 0)
+    assert_that(result).is_instance_of(Err)
+    assert_that(result.unwrap()).is_instance_of(ZeroDivisionError)
+
+    @do_async
+    async def from_coroutine():
+        value = yield async_identity(Ok(1))
+        yield Ok(value + 1)
+
+    assert_that(await from_coroutine()).is_equal_to(Ok(2))
+
+    @do_async
+    async def empty():
+        if False:
+            yield
+
+    assert_that(await empty()).is_equal_to(Ok(None))
+
+    @do_async
+    def from_generator(a: int):
+        value = yield async_identity(Ok(a))
+        total = yield async_try(add_async)(value, 1)
+        return total * 2
+
+    assert_that(await from_generator(1)).is_equal_to(Ok(4))
+
+    @do_async
+    def not_a_result():
+        yield 1
+
+    with pytest.raises(TypeError):
+        await not_a_result()
+
+
+@pytest.mark.asyncio
+async def test_shared():
+    calls = []
+
+    async def fetch(x: int) -> float:
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return 1 / x
+
+    one = async_try(fetch)(1).shared()
+    results = await asyncio.gather(one.execute(), one.get(), one.is_ok())
+    assert_that(results).is_equal_to([Ok(1.0), 1.0, True])
+    assert_that(await one.map(lambda v: v + 1).get()).is_equal_to(2.0)
+    assert_that(await one.match(Ok(_), default >> 0)).is_equal_to(1.0)
+    assert_that(calls).is_equal_to([1])
+
+    zero = async_try(fetch)(0).memoize()
+    assert_that(await zero.is_error()).is_true()
+    assert_that(await zero.recover_with(0).get()).is_equal_to(0)
+    assert_that(calls).is_equal_to([1, 0])
+
+    retried = async_try(fetch)(0).shared(cache_errors=False)
+    results = await asyncio.gather(retried.is_error(), retried.is_error())
+    assert_that(results).is_equal_to([True, True])
+    assert_that(await retried.or_none()).is_none()
+    assert_that(calls).is_equal_to([1, 0, 0, 0])
+
+    one.forget()
+    await one.get()
+    assert_that(calls).is_equal_to([1, 0, 0, 0, 1])
+
+    # a cancelled awaiter does not cancel the shared run
+    two = async_try(fetch)(2).shared()
+    task = asyncio.ensure_future(two.get())
+    await asyncio.sleep(0)
+    task.cancel()
+    assert_that(await two.get()).is_equal_to(0.5)
+    assert_that(calls[-1]).is_equal_to(2)
+    assert_that(len(calls)).is_equal_to(6)
+
+    # a shared template shares the run of each call
+    template = async_try(fetch).shared()
+    four = template(4)
+    results = await asyncio.gather(four.get(), four.get(), template(5).get())
+    assert_that(results).is_equal_to([0.25, 0.25, 0.2])
+    assert_that(calls[-2:]).is_equal_to([4, 5])
+    assert_that(await template.run_many([8])).is_equal_to([Ok(0.125)])
+    result = await template.map(str)(4)
+    assert_that(result._under).is_instance_of(TypeError)
+
+
+@pytest.mark.asyncio
+async def test_template():
+    running = []
+
+    async def fetch(x: int) -> float:
+        running.append(x)
+        assert_that(len(running)).is_less_than_or_equal_to(2)
+        await asyncio.sleep(0.01)
+        running.remove(x)
+        return 1 / x
+
+    template = async_try(fetch, ZeroDivisionError).map(lambda v: v * 2)
+    results = await asyncio.gather(template(1).get(), template(2).get())
+    assert_that(results).is_equal_to([2.0, 1.0])
+    assert_that(template.args).is_equal_to(())
+    assert_that(AsyncTry.__dictoffset__).is_equal_to(0)
+
+    results = await template.recover_with(0).run_many([1, 0, 4, 2], limit=2)
+    assert_that(results).is_equal_to([Ok(2.0), Ok(0), Ok(0.5), Ok(1.0)])
+    assert_that(await template.run_many([])).is_empty()
+
+
+@pytest.mark.asyncio
+async def test_flat_steps():
+    chain = async_try(async_identity)(0)
+    for _i in range(5000):
+        chain = chain.map(lambda v: v + 1)
+    assert_that(await chain).is_equal_to(Ok(5000))
+
+    # chains built on a common prefix share its steps
+    base = async_try(async_identity).map(lambda v: v * 2)
+    plus, minus = base.map(lambda v: v + 1), base.map(lambda v: v - 1)
+    assert_that(await plus(3)).is_equal_to(Ok(7))
+    assert_that(await base(3)).is_equal_to(Ok(6))
+    assert_that(await minus(3)).is_equal_to(Ok(5))
+    assert_that(plus._steps.parent).is_same_as(minus._steps.parent)
+
+    result = await (
+        async_try(async_identity, ZeroDivisionError)(0)
+        .map(lambda v: 1 / v)
+        .map(lambda v: v + 1)  # skipped
+        .recover(lambda: 1 / 0)
+        .map(lambda v: v + 1)  # skipped
+        .recover_with(10)
+        .map(async_identity)
+        .real
+    )
+    assert_that(result).is_equal_to(Ok(10))
+    assert_that(await async_try(async_raise, ZeroDivisionError)()).is_instance_of(Err)
+    with pytest.raises(ZeroDivisionError):
+        await async_try(async_raise, KeyError)().map(str)
+
+
+def test_run_sync():
+    parse = async_try(int, ValueError).map(lambda v: v * 2).recover_with(0)
+    assert_that(parse("21").run_sync()).is_equal_to(Ok(42))
+    assert_that(parse("x").run_sync()).is_equal_to(Ok(0))
+    assert_that(async_try(int, ValueError)("x").run_sync()).is_instance_of(Err)
+
+    async def no_wait(v: int) -> int:
+        return v + 1
+
+    assert_that(parse("1").map(no_wait).run_sync()).is_equal_to(Ok(3))
+    with pytest.raises(RuntimeError):
+        parse("1").map(lambda v: asyncio.sleep(0, v)).run_sync()
+
+    shared = parse("2").shared()
+    assert_that(shared.run_sync()).is_same_as(shared.run_sync())
+
+
+@pytest.mark.asyncio
+async def test_sync_steps():
+    chain = async_try(async_identity)(1).map(str).map(lambda v: async_identity(v))
+    assert_that(await chain).is_equal_to(Ok("1"))
+    assert_that(await chain.map(lambda v: v + "2").run_many(["a", "b"])).is_equal_to(
+        [Ok("a2"), Ok("b2")]
+    )
+
+
+@pytest.mark.asyncio
+async def test_gather():
+    running = []
+
+    async def fetch(x: int) -> float:
+        running.append(x)
+        assert_that(len(running)).is_less_than_or_equal_to(3)
+        await asyncio.sleep(0.01 * (x % 3))
+        running.remove(x)
+        if x == 4:
+            raise KeyError(x)
+        return 1 / x
+
+    consumed = []
+
+    def tries():
+        for x in range(8):
+            consumed.append(x)
+            yield async_try(fetch, ZeroDivisionError)(x)
+
+    results = await AsyncTry.gather(tries(), limit=3)
+    assert_that(results).is_length(8)
+    assert_that(results[0]).is_instance_of(Err)
+    assert_that(results[4]._under).is_instance_of(KeyError)
+    assert_that(results[5]).is_equal_to(Ok(0.2))
+
+    unordered = await AsyncTry.gather(tries(), limit=3, ordered=False)
+    assert_that(unordered).is_length(8).contains(Ok(0.2), Ok(1.0))
+    assert_that(unordered).is_not_equal_to(results)
+    assert_that(await AsyncTry.gather([])).is_empty()
+    with pytest.raises(ValueError):
+        await AsyncTry.gather([], limit=0)
+
+    consumed.clear()
+    seen = []
+    async for result in AsyncTry.as_completed(tries(), limit=2):
+        seen.append(result)
+        if len(seen) == 2:
+            break
+    assert_that(len(consumed)).is_less_than(8)
+    assert_that(len(seen)).is_equal_to(2)
+    seen = [r async for r in AsyncTry.as_completed(tries())]
+    assert_that(seen).is_length(8)
+
+    # an error of the source is raised to the consumer
+    def failing():
+        yield async_try(async_identity)(1)
+        raise ValueError()
+
+    async def consume():
+        return [r async for r in AsyncTry.as_completed(failing(), limit=2)]
+
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(consume(), 5)
+    with pytest.raises(ValueError):
+        await AsyncTry.gather(failing(), limit=2)
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    cancelled = []
+    budgets = []
+
+    async def slow(x: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    async def fallback() -> int:
+        budgets.append(remaining())
+        await asyncio.sleep(10)
+        return 0
+
+    template = async_try(slow, KeyError).timeout(0.05)
+    result = await template(1)
+    assert_that(result).is_instance_of(Err)
+    assert_that(result._under).is_instance_of(TimeoutError)
+    assert_that(cancelled).is_equal_to([1])
+    assert_that(await template.recover_with(2)(1)).is_equal_to(Ok(2))
+
+    result = await (
+        async_try(lambda: 1 / 0).recover(fallback).timeout(0.1).timeout(5)().execute()
+    )
+    assert_that(result._under).is_instance_of(TimeoutError)
+    assert_that(budgets[0]).is_between(0, 0.1)
+
+    assert_that(await async_try(async_identity).timeout()(3)).is_equal_to(Ok(3))
+    with deadline(0.05):
+        result = await async_try(async_identity).timeout()(3)
+    assert_that(result._under).is_instance_of(TimeoutError)
+    assert_that(remaining()).is_none()
+
+
+@pytest.mark.asyncio
+async def test_retry():
+    calls = []
+
+    async def flaky(x: int, fail: int = 2) -> int:
+        calls.append(x)
+        if len(calls) <= fail:
+            raise ConnectionError(len(calls))
+        return x
+
+    events = []
+    template = async_try(flaky).retry(
+        3, delay=0.001, jitter=None, on=ConnectionError, hook=events.append
+    )
+    assert_that(await template(1)).is_equal_to(Ok(1))
+    assert_that(calls).is_equal_to([1, 1, 1])
+    assert_that([(e.attempt, e.delay, e.final) for e in events]).is_equal_to(
+        [(1, 0.001, False), (2, 0.002, False), (3, None, True)]
+    )
+
+    calls.clear()
+    events.clear()
+    result = await template(2, fail=5)
+    assert_that(result._under).is_instance_of(ConnectionError)
+    assert_that(calls).is_length(3)
+    assert_that(events[-1].final).is_true()
+    assert_that(events[-1].result._under).is_same_as(result._under)
+
+    calls.clear()
+    not_retried = async_try(flaky).retry(3, delay=0.001, on=KeyError)
+    assert_that((await not_retried(1)).is_error()).is_true()
+    assert_that(calls).is_length(1)
+
+    # the budget stops retrying once half of its tokens are spent
+    budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+    calls.clear()
+    throttled = async_try(flaky).retry(10, delay=0.001, budget=budget)
+    assert_that((await throttled(1, fail=100)).is_error()).is_true()
+    assert_that(calls).is_length(2)
+    assert_that(budget.allows_retry()).is_false()
+
+    calls.clear()
+    with deadline(0.05):
+        result = await async_try(flaky).retry(5, delay=1, jitter=None)(1)
+    assert_that(calls).is_length(1)
+
+    with pytest.raises(ValueError):
+        async_try(flaky).retry(0)
+
+
+@pytest.mark.asyncio
+async def test_hedge():
+    runs = []
+    cancelled = []
+    starts = []
+
+    async def read(x: int, delays: list[float]) -> int:
+        delay = delays[len(runs)]
+        runs.append(delay)
+        starts.append(asyncio.get_running_loop().time())
+        try:
+            # a negative delay: the run fails after -delay seconds
+            await asyncio.sleep(abs(delay))
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        if delay < 0:
+            raise ConnectionError()
+        return x
+
+    template = async_try(read).hedge(after=0.02)
+    assert_that(await template(1, [0.001, 0.001])).is_equal_to(Ok(1))
+    assert_that(runs).is_length(1)
+
+    runs.clear()
+    assert_that(await template(2, [1.0, 0.001])).is_equal_to(Ok(2))
+    assert_that(runs).is_equal_to([1.0, 0.001])
+    await asyncio.sleep(0)
+    assert_that(cancelled).is_equal_to([1.0])
+
+    runs.clear()
+    result = await async_try(read).hedge(0.01, max_extra=2)(3, [1.0, 1.0, 0.001])
+    assert_that(result).is_equal_to(Ok(3))
+    assert_that(runs).is_length(3)
+
+    # a failed run waits for the others, the Err is kept when all fail
+    runs.clear()
+    assert_that(await template(4, [0.05, -0.01])).is_equal_to(Ok(4))
+    runs.clear()
+    result = await template(5, [-0.05, -0.01])
+    assert_that(result._under).is_instance_of(ConnectionError)
+
+    # a failed run does not delay the next extra run
+    runs.clear()
+    starts.clear()
+    hedged = async_try(read).hedge(0.05, max_extra=2)
+    assert_that(await hedged(6, [1.0, -0.04, 0.001])).is_equal_to(Ok(6))
+    assert_that(starts[2] - starts[0]).is_between(0.095, 0.13)
+
+    with pytest.raises(ValueError):
+        async_try(read).hedge(0.01, max_extra=-1)
+
+
+@pytest.mark.asyncio
+async def test_hedge_percentile():
+    p90 = LatencyPercentile(0.9, window=10, initial=0.5, min_samples=5)
+    assert_that(p90.delay()).is_equal_to(0.5)
+    for latency in range(20):
+        p90.record(latency)
+    assert_that(p90._sorted).is_equal_to(list(range(10, 20)))
+    assert_that(p90.delay()).is_equal_to(19)
+
+    adaptive = LatencyPercentile(0.5, initial=0.001, min_samples=1)
+    result = await async_try(async_identity).hedge(after=adaptive)(1)
+    assert_that(result).is_equal_to(Ok(1))
+    assert_that(adaptive._sorted).is_length(1)
+
+    # the failed runs are recorded too
+    async def flaky(fail: bool) -> int:
+        await asyncio.sleep(0.01)
+        if fail:
+            raise ConnectionError()
+        return 1
+
+    calls = iter([True, False])
+    tracker = LatencyPercentile(0.5, initial=0.001, min_samples=1)
+    result = await async_try(lambda: flaky(next(calls))).hedge(after=tracker)()
+    assert_that(result).is_equal_to(Ok(1))
+    assert_that(tracker._sorted).is_length(2)
+
+    with pytest.raises(ValueError):
+        LatencyPercentile(0)
+
+
+@pytest.mark.asyncio
+async def test_first_ok():
+    cancelled = []
+
+    async def answer(x: int, delay: float) -> int:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        if x < 0:
+            raise ConnectionError(x)
+        return x
+
+    fast_error = async_try(answer)(-1, 0.001)
+    result = await AsyncTry.first_ok(fast_error, async_try(answer)(2, 0.02))
+    assert_that(result).is_equal_to(Ok(2))
+    result = await AsyncTry.race(async_try(answer)(-1, 0.001), async_try(answer)(3, 1))
+    assert_that(result._under).is_instance_of(ConnectionError)
+    await asyncio.sleep(0)
+    assert_that(cancelled).is_equal_to([3])
+
+    result = await AsyncTry.first_ok(
+        async_try(answer)(-2, 0.02), async_try(lambda: 1 / 0)()
+    )
+    group = result._under
+    assert_that(type(group).__name__).is_equal_to("ExceptionGroup")
+    assert_that([type(e) for e in group.exceptions]).is_equal_to(
+        [ConnectionError, ZeroDivisionError]
+    )
+
+    with pytest.raises(ValueError):
+        await AsyncTry.race()
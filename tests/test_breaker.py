@@ -0,0 +1,117 @@
+import pytest
+from assertpy import assert_that
+
+from fateful.breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    circuit_breaker,
+)
+from fateful.monad.async_result import async_try, lift_future
+from fateful.monad.result import Err, Ok
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_states():
+    clock = Clock()
+    transitions = []
+    cb = CircuitBreaker(
+        "users",
+        failure_rate=0.5,
+        window=4,
+        min_calls=4,
+        open_for=10,
+        probes=2,
+        listener=lambda cb, old, new: transitions.append((old, new)),
+        clock=clock,
+    )
+    for success in (True, False, True):
+        assert_that(cb.acquire()).is_true()
+        cb.record(success)
+    assert_that(cb.state).is_equal_to(CircuitState.CLOSED)
+    cb.acquire()
+    cb.record(False)
+    assert_that(cb.state).is_equal_to(CircuitState.OPEN)
+    assert_that(cb.acquire()).is_false()
+    assert_that(cb.retry_after()).is_equal_to(10)
+
+    clock.now = 10
+    assert_that(cb.state).is_equal_to(CircuitState.HALF_OPEN)
+    assert_that([cb.acquire() for _ in range(3)]).is_equal_to([True, True, False])
+    cb.record(True)
+    cb.release()
+    assert_that(cb.acquire()).is_true()
+    cb.record(False)
+    assert_that(cb.state).is_equal_to(CircuitState.OPEN)
+
+    clock.now = 25
+    assert_that(cb.acquire()).is_true()
+    assert_that(cb.acquire()).is_true()
+    cb.record(True)
+    cb.record(True)
+    assert_that(cb.state).is_equal_to(CircuitState.CLOSED)
+    assert_that(transitions).is_equal_to(
+        [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+    )
+    # the window starts again empty
+    cb.acquire()
+    cb.record(False)
+    assert_that(cb.state).is_equal_to(CircuitState.CLOSED)
+
+
+def test_registry():
+    cb = circuit_breaker("test_registry", open_for=1)
+    assert_that(circuit_breaker("test_registry")).is_same_as(cb)
+    assert_that(cb.open_for).is_equal_to(1)
+    with pytest.raises(ValueError):
+        CircuitBreaker("bad", failure_rate=0)
+
+
+@pytest.mark.asyncio
+async def test_async_try_breaker():
+    clock = Clock()
+    calls = []
+
+    async def fetch(x: int) -> float:
+        calls.append(x)
+        return 1 / x
+
+    cb = CircuitBreaker("fetch", window=2, min_calls=2, open_for=5, clock=clock)
+    get = async_try(fetch, ZeroDivisionError).breaker(cb)
+    assert_that(await get(1)).is_equal_to(Ok(1.0))
+    assert_that((await get(0))._under).is_instance_of(ZeroDivisionError)
+    result = await get(1)
+    assert_that(result._under).is_instance_of(CircuitOpenError)
+    assert_that(result._under.retry_after).is_equal_to(5)
+    assert_that(calls).is_equal_to([1, 0])
+
+    clock.now = 5
+    assert_that(await get.map(lambda v: v + 1)(2)).is_equal_to(Ok(1.5))
+    assert_that(cb.state).is_equal_to(CircuitState.CLOSED)
+
+    # errors not counted as failures
+    ignoring = CircuitBreaker("ignoring", window=1, min_calls=1, on=KeyError)
+    assert_that(await async_try(fetch).breaker(ignoring)(0)).is_instance_of(Err)
+    assert_that(ignoring.state).is_equal_to(CircuitState.CLOSED)
+
+    @cb
+    @lift_future
+    async def lifted(x: int) -> float:
+        return 1 / x
+
+    for _ in range(2):
+        assert_that((await lifted(0))._under).is_instance_of(ZeroDivisionError)
+    assert_that((await lifted(1))._under).is_instance_of(CircuitOpenError)
@@ -0,0 +1,139 @@
+import pytest
+from assertpy import assert_that
+
+from fateful.cache import CacheInfo, memoize
+from fateful.monad.option import Null, Some, lift_opt
+from fateful.monad.result import Err, Ok, err_code, to_result
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memoize_values():
+    calls = []
+
+    @memoize(maxsize=2)
+    @to_result(exc=ValueError)
+    def parse(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    assert_that(parse("1")).is_equal_to(Ok(1))
+    assert_that(parse("1")).is_equal_to(Ok(1))
+    assert_that(calls).is_equal_to(["1"])
+
+    parse("2")
+    parse("3")  # evicts "1"
+    parse("1")
+    assert_that(calls).is_equal_to(["1", "2", "3", "1"])
+    assert_that(parse.cache_info()).is_equal_to(
+        CacheInfo(
+            hits=1,
+            negative_hits=0,
+            misses=4,
+            evictions=2,
+            expirations=0,
+            currsize=2,
+            negative_currsize=0,
+        )
+    )
+
+    # failures are not cached by default
+    assert_that(parse("x").is_error()).is_true()
+    assert_that(parse("x").is_error()).is_true()
+    assert_that(calls[-2:]).is_equal_to(["x", "x"])
+
+    parse.cache_clear()
+    assert_that(parse.cache_info().currsize).is_equal_to(0)
+    assert_that(parse.cache_info().misses).is_equal_to(0)
+
+
+def test_memoize_ttl():
+    clock = Clock()
+    calls = []
+
+    @memoize(ttl=10, negative_ttl=1, clock=clock)
+    @lift_opt
+    def find(key: str, default: int | None = None) -> int | None:
+        calls.append(key)
+        return {"a": 1}.get(key, default)
+
+    assert_that(find("a")).is_equal_to(Some(1))
+    assert_that(find("b")).is_equal_to(Null)
+    assert_that(find("b", default=2)).is_equal_to(Some(2))
+    clock.now = 0.5
+    find("a")
+    find("b")
+    assert_that(calls).is_equal_to(["a", "b", "b"])
+    assert_that(find.cache_info().negative_hits).is_equal_to(1)
+
+    clock.now = 2
+    find("a")
+    find("b")  # negative entry expired
+    assert_that(calls).is_equal_to(["a", "b", "b", "b"])
+
+    clock.now = 11
+    find("a")
+    assert_that(calls).is_equal_to(["a", "b", "b", "b", "a"])
+    assert_that(find.cache_info().expirations).is_equal_to(2)
+
+
+def test_memoize_policies():
+    clock = Clock()
+    calls = []
+
+    class NotFound(KeyError):
+        pass
+
+    @memoize(
+        negative_ttl=1,
+        policies={KeyError: 60, TimeoutError: 0, "gone": None},
+        clock=clock,
+    )
+    def fetch(key: str) -> Ok[int] | Err[Exception]:
+        calls.append(key)
+        match key:
+            case "missing":
+                return Err(NotFound(key))
+            case "slow":
+                return Err(TimeoutError())
+            case "gone":
+                return err_code("gone")
+            case _:
+                return Err(ValueError(key))
+
+    for key in ["missing", "slow", "gone", "bad"]:
+        fetch(key)
+    clock.now = 30
+    for key in ["missing", "slow", "gone", "bad"]:
+        fetch(key)
+    # NotFound uses the KeyError policy, timeouts are never cached, "bad" expired
+    assert_that(calls).is_equal_to(["missing", "slow", "gone", "bad", "slow", "bad"])
+
+    clock.now = 1e9
+    fetch("gone")
+    assert_that(calls.count("gone")).is_equal_to(1)
+
+
+def test_memoize_method():
+    class Service:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @memoize
+        def get(self, value: int) -> Ok[int]:
+            self.calls += 1
+            return Ok(value)
+
+    service = Service()
+    assert_that(service.get(1)).is_equal_to(Ok(1))
+    assert_that(service.get(1)).is_equal_to(Ok(1))
+    assert_that(service.calls).is_equal_to(1)
+
+    with pytest.raises(TypeError):
+        service.get([1])
@@ -1,3 +1,5 @@
+import asyncio
+
 import aiohttp
 import pytest
 from assertpy import assert_that
@@ -6,6 +8,7 @@ from fateful.http import HttpMethods, get, request, try_get
 from fateful.monad.async_result import async_try
 from fateful.monad.func import _, default, identity
 from fateful.monad.result import Err, Ok
+from fateful.timeouts import deadline
 
 
 @pytest.mark.asyncio
@@ -54,3 +57,47 @@ async def test_request_fetch_error():
     result = await get("https://jsonplaceholder.typicode.com/todos/0", session=session)
     assert_that(result).is_instance_of(Err)
     await session.close()
+
+
+class RecordingSession:
+    """fake session failing all requests, keeps the arguments of the last one"""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.kwargs: dict = {}
+
+    def request(self, method, url, **kwargs):
+        self.kwargs = kwargs
+        return self
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        raise aiohttp.ClientConnectionError()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_deadline_request():
+    session = RecordingSession()
+    result = await get("http://localhost", session=session)
+    assert_that(result).is_instance_of(Err)
+    assert_that(session.kwargs).does_not_contain_key("timeout")
+
+    with deadline(10):
+        await get("http://localhost", session=session)
+        assert_that(session.kwargs["timeout"].total).is_between(9, 10)
+        timeout = aiohttp.ClientTimeout(total=60, connect=1)
+        await get("http://localhost", session=session, timeout=timeout)
+        assert_that(session.kwargs["timeout"].total).is_less_than_or_equal_to(10)
+        assert_that(session.kwargs["timeout"].connect).is_equal_to(1)
+
+    slow = RecordingSession(delay=10)
+    result = await async_try(get).timeout(0.05)("http://localhost", session=slow)
+    assert_that(result._under).is_instance_of(TimeoutError)
+    assert_that(slow.kwargs["timeout"].total).is_less_than_or_equal_to(0.05)
+
+    with deadline(0):
+        result = await get("http://localhost", session=session)
+    assert_that(result._under).is_instance_of(TimeoutError)
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pytest
+from assertpy import assert_that
+
+# microseconds, as reported by python -X importtime
+IMPORT_BUDGET = 20_000
+CORE_IMPORT_BUDGET = 150_000
+
+HEAVY_MODULES = ("aiohttp", "asyncio", "numpy", "orjson", "pampy")
+
+
+def _import_time(statement: str) -> int:
+    """import time of fateful and of the modules it loads lazily, in microseconds"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like "import time:  self [us] | cumulative | imported package",
+    # nested imports are indented. Lazy imports are top level lines after fateful
+    total, started = 0, False
+    for line in completed.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        started = started or name.strip() == "fateful"
+        if started and len(name) - len(name.lstrip()) == 1:
+            total += int(cumulative)
+    if not started:
+        raise AssertionError(f"fateful not imported by {statement!r}")
+    return total
+
+
+def _loaded(statement: str) -> list[str]:
+    code = f"{statement}\nimport sys\nprint(' '.join(sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.split()
+
+
+def test_import_budget():
+    assert_that(_import_time("import fateful")).is_less_than(IMPORT_BUDGET)
+    assert_that(
+        _import_time("from fateful import opt, Null, Some, Ok, Err, sync_try")
+    ).is_less_than(CORE_IMPORT_BUDGET)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fateful",
+        "from fateful import opt, Null, Some, Ok, Err, sync_try, memoize",
+        "from fateful import Some, _\nSome(1).match(Some(_) >> (lambda v: v))",
+        "import fateful.http",
+        "import fateful.json",
+    ],
+)
+def test_lazy_imports(statement: str):
+    loaded = _loaded(statement)
+    # fateful.http is built on AsyncTry, asyncio is expected
+    heavy = [m for m in HEAVY_MODULES if m != "asyncio" or "http" not in statement]
+    assert_that(loaded).does_not_contain(*heavy)
+
+
+def test_exports():
+    import fateful
+    from fateful.monad.option import Null
+
+    assert_that(fateful.Null).is_same_as(Null)
+    assert_that(dir(fateful)).contains("opt", "async_try", "sync_try")
+    with pytest.raises(AttributeError):
+        fateful.missing  # noqa: B018
@@ -0,0 +1,92 @@
+import itertools
+
+import pytest
+from assertpy import assert_that
+
+from fateful.iter import (
+    chunked,
+    collect,
+    filter_ok,
+    filter_some,
+    partition_results,
+    sequence,
+    traverse,
+)
+from fateful.monad.option import Null, Some
+from fateful.monad.result import Err, Ok, sync_try
+
+
+def test_sequence():
+    assert_that(sequence([Some(1), Some(2)])).is_equal_to(Some([1, 2]))
+    assert_that(sequence([Ok(1), Ok(2)])).is_equal_to(Ok([1, 2]))
+    assert_that(sequence([])).is_equal_to(Some([]))
+    assert_that(sequence([], flavour=Ok)).is_equal_to(Ok([]))
+    assert_that(sequence([Ok(1)], flavour=Ok)).is_equal_to(Ok([1]))
+    assert_that(sequence([Some(1), Null, Some(2)])).is_equal_to(Null)
+
+    error = ValueError()
+    assert_that(sequence([Ok(1), Err(error), Ok(2)])).is_equal_to(Err(error))
+
+    # short-circuit on unbounded inputs
+    infinite = itertools.chain([Ok(1), Err(error)], itertools.repeat(Ok(2)))
+    assert_that(sequence(infinite)).is_equal_to(Err(error))
+
+
+def test_collect_traverse():
+    assert_that(collect([Ok(1), Ok(1)], set)).is_equal_to(Ok({1}))
+    assert_that(collect([Some(("a", 1))], dict)).is_equal_to(Some({"a": 1}))
+    assert_that(collect((Some(i) for i in range(4)), sum)).is_equal_to(Some(6))
+
+    calls = []
+
+    def parse(value: str):
+        calls.append(value)
+        return sync_try(int)(value)
+
+    assert_that(traverse(parse, ["1", "2"])).is_equal_to(Ok([1, 2]))
+    assert_that(traverse(parse, ["x", "2"]).is_error()).is_true()
+    assert_that(calls).is_equal_to(["1", "2", "x"])
+    assert_that(traverse(parse, [], flavour=Ok)).is_equal_to(Ok([]))
+    assert_that(collect([], set, flavour=Ok)).is_equal_to(Ok(set()))
+    with pytest.raises(TypeError):
+        collect([], set, flavour=list)
+
+
+def test_filter():
+    assert_that(list(filter_some([Some(1), Null, Some(2)]))).is_equal_to([1, 2])
+    assert_that(list(filter_ok([Ok(1), Err(ValueError())]))).is_equal_to([1])
+    first = next(filter_some(Some(i) for i in itertools.count()))
+    assert_that(first).is_equal_to(0)
+
+
+def test_partition_results():
+    oks, errors = partition_results(sync_try(int)(v) for v in ["1", "x", "3"])
+    assert_that(list(oks)).is_equal_to([1, 3])
+    assert_that([type(e) for e in errors]).is_equal_to([ValueError])
+
+    results = (Ok(i) if i % 2 else Err(ValueError(i)) for i in range(10_000))
+    oks, errors = partition_results(results, maxsize=2)
+    pairs = list(itertools.zip_longest(oks, errors))
+    assert_that(pairs).is_length(5000)
+
+    oks, errors = partition_results((Err(ValueError()) for _ in range(10)), maxsize=2)
+    with pytest.raises(BufferError):
+        list(oks)
+    # the item that would have overflowed the buffer is not lost
+    assert_that(list(errors)).is_length(10)
+
+    # the raising iterator resumes once the other one has been consumed
+    results = [Err(ValueError()), Err(ValueError()), Err(ValueError()), Ok(1)]
+    oks, errors = partition_results(results, maxsize=2)
+    with pytest.raises(BufferError):
+        list(oks)
+    assert_that(list(errors)).is_length(3)
+    assert_that(list(oks)).is_equal_to([1])
+
+
+def test_chunked():
+    assert_that(list(chunked(range(5), 2))).is_equal_to([[0, 1], [2, 3], [4]])
+    assert_that(list(chunked([], 2))).is_equal_to([])
+    assert_that(next(chunked(itertools.count(), 3))).is_equal_to([0, 1, 2])
+    with pytest.raises(ValueError):
+        list(chunked([1], 0))
@@ -11,13 +11,23 @@ from fateful.monad.container import EmptyError
 from fateful.monad.func import (
     MatchError,
     _,
+    compile_match,
     default,
     identity,
     raise_err,
     raise_error,
     when,
 )
-from fateful.monad.option import Empty, Null, Some, lift_opt, none, opt, option
+from fateful.monad.option import (
+    Empty,
+    Null,
+    Some,
+    lift_opt,
+    none,
+    opt,
+    opt_path,
+    option,
+)
 from fateful.monad.result import Err, Ok
 
 
@@ -278,3 +288,114 @@ class Test(unittest.TestCase):
 
         opt(1).match(*(Some(_), default >> 100))
         opt(1).match(Some(_))
+
+    def test_slots(self):
+        self.assertEqual(Some.__dictoffset__, 0)
+        self.assertEqual(Empty.__dictoffset__, 0)
+        with self.assertRaises(AttributeError):
+            Some(1)._under = 2  # type: ignore[misc]
+
+    def test_match_does_not_mutate(self):
+        nested = Some(Some(1))
+        val = nested.match(Some(Some(_)) >> identity, default >> 10)
+        assert_that(val).is_equal_to(1)
+        assert_that(nested.get()).is_equal_to(Some(1))
+
+    def test_compile_match(self):
+        import re
+
+        import pampy
+
+        route = compile_match(
+            Some(0) >> (lambda: "zero"),
+            Some(Some(_)) >> (lambda v: f"nested {v}"),
+            Some({"type": "user", "id": _}) >> (lambda i: f"user {i}"),
+            Some([_, 2]) >> (lambda a: f"pair {a}"),
+            Some(str) >> (lambda v: f"str {v}"),
+            Some(lambda v: isinstance(v, int) and v > 100) >> (lambda v: "large"),
+            Null >> (lambda: "empty"),
+            default >> "other",
+        )
+        assert_that(route(Some(0))).is_equal_to("zero")
+        assert_that(route(Some(False))).is_equal_to("other")
+        assert_that(route(Some(Some(1)))).is_equal_to("nested 1")
+        # nested classes are compared
+        assert_that(route(Some(Ok(1)))).is_equal_to("other")
+        assert_that(route(Some({"type": "user", "id": 3, "x": 1}))).is_equal_to(
+            "user 3"
+        )
+        assert_that(route(Some([1, 2]))).is_equal_to("pair 1")
+        assert_that(route(Some([1, 2, 3]))).is_equal_to("other")
+        assert_that(route(Some("a"))).is_equal_to("str a")
+        assert_that(route(Some(101))).is_equal_to("large")
+        assert_that(route(Null)).is_equal_to("empty")
+        assert_that(Some(101).match(route)).is_equal_to("large")
+
+        # guards of other classes raise once reached, like .match
+        mixed = compile_match(Some(1) >> (lambda: "one"), Ok(_) >> identity)
+        assert_that(mixed(Some(1))).is_equal_to("one")
+        with self.assertRaises(MatchError):
+            mixed(Some(2))
+        with self.assertRaises(MatchError):
+            compile_match(Some(1))(Some(2))
+
+        # pampy patterns and wildcard
+        assert_that(opt(3).match(Some(pampy._) >> identity)).is_equal_to(3)
+        assert_that(
+            opt([1, 2, 3]).match(Some([pampy.HEAD, pampy.TAIL]) >> (lambda h, t: t))
+        ).is_equal_to([2, 3])
+        assert_that(
+            opt("id-12").match(Some(re.compile(r"id-(\d+)")) >> identity)
+        ).is_equal_to("12")
+
+    def test_opt_path(self):
+        class B:
+            def __init__(self, c):
+                self.c = c
+
+        obj = {"items": [{"id": 1}], "b": B(A(5)), "none": None}
+        assert_that(opt_path(["items", 0, "id"])(obj)).is_equal_to(Some(1))
+        assert_that(opt_path("b.c.x")(obj)).is_equal_to(Some(5))
+        assert_that(opt_path("b.c.x")(obj)).is_equal_to(opt(obj["b"]).c.x)
+        assert_that(opt_path("b.c.y")(obj)).is_equal_to(Null)
+        assert_that(opt_path("none.x")(obj)).is_equal_to(Null)
+        assert_that(opt_path("none")(obj)).is_equal_to(Null)
+        assert_that(opt_path(["items", 1, "id"])(obj)).is_equal_to(Null)
+        assert_that(opt_path(["b", 0])(obj)).is_equal_to(Null)
+        assert_that(opt_path("x")(None)).is_equal_to(Null)
+        assert_that(opt_path("b.c")).is_same_as(opt_path("b.c"))
+        assert_that(opt_path(["b", "c"])).is_same_as(opt_path(("b", "c")))
+
+    def test_pickle(self):
+        import copy
+        import pickle
+
+        assert_that(pickle.loads(pickle.dumps(Some([1])))).is_equal_to(Some([1]))
+        assert_that(pickle.loads(pickle.dumps(Null))).is_same_as(Null)
+        assert_that(pickle.loads(pickle.dumps(Empty()))).is_same_as(Null)
+        assert_that(copy.deepcopy(Some([1]))).is_equal_to(Some([1]))
+        assert_that(copy.deepcopy(Null)).is_same_as(Null)
+
+    def test_null_is_immutable(self):
+        from dataclasses import FrozenInstanceError
+
+        assert_that(Empty()).is_same_as(Null)
+        assert_that(Empty(None)).is_same_as(Null)
+        with self.assertRaises(FrozenInstanceError):
+            Null._under = 1  # type: ignore[misc]
+
+    def test_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def work(i: int) -> list[int]:
+            return [
+                opt(i if j % 2 else None)
+                .map(lambda v: v + 1)
+                .match(Some(_) >> identity, Null >> (lambda: -1))
+                for j in range(200)
+            ]
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(work, range(32)))
+        for i, result in enumerate(results):
+            assert_that(result).is_equal_to([-1, i + 1] * 100)
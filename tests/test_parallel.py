@@ -0,0 +1,72 @@
+import itertools
+import threading
+
+import pytest
+from assertpy import assert_that
+
+from fateful.monad.result import Err, Ok
+from fateful.parallel import shutdown_pools, try_map
+
+
+def inverse(x: int) -> float:
+    return 1 / x
+
+
+def test_try_map_thread():
+    results = list(try_map(inverse, [1, 0, 2], workers=2))
+    assert_that(results[0]).is_equal_to(Ok(1.0))
+    assert_that(results[1]).is_instance_of(Err)
+    assert_that(results[1].unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(results[2]).is_equal_to(Ok(0.5))
+
+    # 0 completes once the other results have been received
+    release = threading.Event()
+
+    def zero_last(x: int) -> int:
+        if x == 0:
+            assert release.wait(5)
+        return x
+
+    results = try_map(zero_last, range(4), workers=4, ordered=False)
+    first = [next(results) for _ in range(3)]
+    release.set()
+    assert_that(sorted(r.get() for r in first)).is_equal_to([1, 2, 3])
+    assert_that(list(results)).is_equal_to([Ok(0)])
+
+    chunked = list(try_map(inverse, range(1, 10), workers=2, chunksize=4))
+    assert_that([r.get() for r in chunked]).is_equal_to([1 / i for i in range(1, 10)])
+
+    with pytest.raises(ZeroDivisionError):
+        list(try_map(inverse, [1, 0], exc=ValueError, workers=2))
+
+
+def test_try_map_lazy():
+    seen = []
+
+    def source():
+        for i in itertools.count(1):
+            seen.append(i)
+            yield i
+
+    first = next(try_map(inverse, source(), workers=1))
+    assert_that(first).is_equal_to(Ok(1.0))
+    assert_that(len(seen)).is_less_than_or_equal_to(3)
+
+
+def test_try_map_warm_pool():
+    idents = set()
+
+    def record(_):
+        idents.add(threading.get_ident())
+
+    list(try_map(record, range(4), workers=1))
+    list(try_map(record, range(4), workers=1))
+    assert_that(idents).is_length(1)
+    shutdown_pools()
+
+
+def test_try_map_process():
+    results = list(try_map(inverse, [1, 0], backend="process", workers=2))
+    assert_that(results[0]).is_equal_to(Ok(1.0))
+    assert_that(results[1].unwrap()).is_instance_of(ZeroDivisionError)
+    shutdown_pools()
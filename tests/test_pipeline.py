@@ -0,0 +1,44 @@
+import pytest
+from assertpy import assert_that
+
+from fateful.monad.option import Null, Some, opt
+from fateful.monad.pipeline import opt_pipeline, try_pipeline
+from fateful.monad.result import Err, Ok
+
+
+def test_option_pipeline():
+    p = opt_pipeline().map(str.strip).map(lambda s: s or None).map(str.upper)
+    assert_that(p("  a ")).is_equal_to(Some("A"))
+    assert_that(p("   ")).is_equal_to(Null)
+    assert_that(p(None)).is_equal_to(Null)
+    assert_that(list(map(p.or_(""), [" a", "  "]))).is_equal_to(["A", ""])
+    assert_that(p.or_none()("  ")).is_none()
+    assert_that(opt_pipeline()(1)).is_equal_to(Some(1))
+
+    # pipelines are immutable
+    base = opt_pipeline().map(lambda x: x + 1)
+    longer = base.map(lambda x: x * 10)
+    assert_that(base(1)).is_equal_to(Some(2))
+    assert_that(longer(1)).is_equal_to(Some(20))
+    assert_that(longer(1)).is_equal_to(
+        opt(1).map(lambda x: x + 1).map(lambda x: x * 10)
+    )
+
+    with pytest.raises(ZeroDivisionError):
+        opt_pipeline().map(lambda x: x / 0)(1)
+
+
+def test_result_pipeline():
+    p = try_pipeline(ValueError).map(str.strip).map(int).map(lambda v: v * 2)
+    assert_that(p(" 21 ")).is_equal_to(Ok(42))
+    assert_that(p("x")).is_instance_of(Err)
+    assert_that(p("x").unwrap()).is_instance_of(ValueError)
+    assert_that(p.or_(0)("x")).is_equal_to(0)
+    assert_that(p.or_none()("x")).is_none()
+    assert_that(p.or_(0)("2")).is_equal_to(4)
+
+    with pytest.raises(ZeroDivisionError):
+        try_pipeline(ValueError).map(lambda x: x / 0)(1)
+
+    assert_that(try_pipeline().map(lambda x: x / 0)(1)).is_instance_of(Err)
+    assert_that(try_pipeline()(1)).is_equal_to(Ok(1))
@@ -1,7 +1,26 @@
+import gc
+import sys
+import weakref
+
 import pytest
 from assertpy import assert_that
 
-from fateful.monad.result import Err, Ok, result_shortcut, sync_try, to_result
+from fateful.monad.func import _, default
+from fateful.monad.result import (
+    CodedError,
+    Err,
+    ErrorCode,
+    Ok,
+    TracebackPolicy,
+    do_result,
+    err_code,
+    result_shortcut,
+    sync_try,
+    to_result,
+)
+
+if sys.version_info < (3, 11):  # pragma: no cover
+    from exceptiongroup import ExceptionGroup
 
 
 def error(x: int) -> float:
@@ -82,7 +101,7 @@ def tests_misc():
     with pytest.raises(ValueError):
         Err(ValueError()).map(lambda x: 1).get()
 
-    for _ in Err(ValueError()):
+    for _item in Err(ValueError()):
         value = "Passed"
     else:
         value = "Not passed"
@@ -115,3 +134,183 @@ def test_result_shortcut():
 
     hj = Ok(Ok(1))
     hj.flatten()
+
+
+def test_slots():
+    assert_that(Ok.__dictoffset__).is_equal_to(0)
+    assert_that(Err.__dictoffset__).is_equal_to(0)
+    with pytest.raises(ValueError):
+        Err(1)  # type: ignore[type-var]
+    assert_that(Ok(1)).is_equal_to(Ok(_under=1))
+    assert_that(hash(Ok(1))).is_equal_to(hash(Ok(1)))
+    assert_that(Ok(1).map(lambda x: x / 0)).is_instance_of(Err)
+
+
+def test_pickle():
+    import copy
+    import pickle
+
+    assert_that(pickle.loads(pickle.dumps(Ok([1])))).is_equal_to(Ok([1]))
+    assert_that(copy.deepcopy(Ok([1]))).is_equal_to(Ok([1]))
+
+    err = sync_try(error)(1)
+    assert_that(err.unwrap().__traceback__).is_not_none()
+    loaded = pickle.loads(pickle.dumps(err))
+    assert_that(loaded).is_instance_of(Err)
+    assert_that(loaded.unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(loaded.unwrap().__traceback__).is_none()
+
+
+class Big:
+    pass
+
+
+def fails(refs: list) -> None:
+    big = Big()
+    refs.append(weakref.ref(big))
+    try:
+        1 / 0
+    except ZeroDivisionError as e:
+        raise ValueError() from e
+
+
+def test_traceback_policy():
+    refs: list = []
+    kept = sync_try(fails)(refs)
+    gc.collect()
+    assert_that(refs[-1]()).is_not_none()
+    assert_that(kept.unwrap().__traceback__).is_not_none()
+    assert_that(kept.stack()[-1].name).is_equal_to("fails")
+
+    summary = sync_try(fails, traceback_policy=TracebackPolicy.SUMMARY)(refs)
+    gc.collect()
+    assert_that(refs[-1]()).is_none()
+    assert_that(summary.unwrap().__traceback__).is_none()
+    assert_that(summary.unwrap().__cause__.__traceback__).is_none()
+    assert_that(summary.stack()[-1].name).is_equal_to("fails")
+
+    dropped = to_result(ValueError, TracebackPolicy.DROP)(fails)(refs)
+    gc.collect()
+    assert_that(refs[-1]()).is_none()
+    assert_that(dropped.stack()).is_none()
+
+    @result_shortcut(traceback_policy=TracebackPolicy.DROP)
+    def shortcut() -> Ok[int] | Err[ValueError]:
+        return sync_try(fails)(refs)._
+
+    assert_that(shortcut().stack()).is_none()
+
+
+def fails_in_handler(refs: list) -> None:
+    # the cause and the context are different exceptions
+    try:
+        fails(refs)
+    except ValueError:
+        other = Big()
+        refs.append(weakref.ref(other))
+        raise KeyError() from TypeError()
+
+
+def test_trim_traceback():
+    refs: list = []
+    dropped = sync_try(fails_in_handler, traceback_policy=TracebackPolicy.DROP)(refs)
+    gc.collect()
+    assert_that([ref() for ref in refs]).is_equal_to([None, None])
+    error = dropped.unwrap()
+    assert_that(error.__cause__).is_instance_of(TypeError)
+    assert_that(error.__context__.__traceback__).is_none()
+    assert_that(error.__context__.__cause__.__traceback__).is_none()
+
+    members = [sync_try(fails)(refs).unwrap() for _i in range(2)]
+    group = ExceptionGroup("all failed", members)
+    summary = Err(group, TracebackPolicy.SUMMARY)
+    gc.collect()
+    assert_that([ref() for ref in refs[2:]]).is_equal_to([None, None])
+    for member in summary.unwrap().exceptions:
+        assert_that(member.__traceback__).is_none()
+        assert_that(member.__stack_summary__[-1].name).is_equal_to("fails")
+
+
+def test_error_code():
+    not_found = err_code("not_found")
+    assert_that(not_found).is_same_as(err_code("not_found"))
+    assert_that(not_found.unwrap()).is_equal_to(ErrorCode("not_found"))
+    assert_that(not_found.is_error()).is_true()
+    assert_that(not_found.or_(1)).is_equal_to(1)
+    assert_that(not_found.recover(lambda: 2)).is_equal_to(Ok(2))
+    assert_that(not_found.stack()).is_none()
+    assert_that(Ok(Ok(not_found)).flatten()).is_equal_to(not_found)
+
+    with pytest.raises(CodedError) as e:
+        not_found.get()
+    assert_that(e.value.code).is_equal_to("not_found")
+
+    invalid = err_code("invalid", {"field": "name"})
+    with pytest.raises(CodedError) as e:
+        invalid.or_raise()
+    assert_that(e.value.payload).is_equal_to({"field": "name"})
+    with pytest.raises(KeyError) as e:
+        invalid.or_raise(KeyError())
+    assert_that(e.value.__cause__).is_instance_of(CodedError)
+
+    field = invalid.match(
+        Err(ErrorCode("not_found", _)) >> (lambda payload: "not found"),
+        Err(ErrorCode("invalid", _)) >> (lambda payload: payload["field"]),
+        default >> None,
+    )
+    assert_that(field).is_equal_to("name")
+
+    match not_found:
+        case Err(ErrorCode("not_found")):
+            value = "matched"
+        case _:
+            value = "not matched"
+    assert_that(value).is_equal_to("matched")
+
+
+def test_do_result():
+    def divide(x: int) -> Ok[float] | Err[ZeroDivisionError]:
+        if not x:
+            return Err(ZeroDivisionError())
+        return Ok(1 / x)
+
+    steps = []
+
+    @do_result
+    def compute(x: int):
+        val = yield divide(x)
+        steps.append(val)
+        result = yield Ok(val * 2)
+        return result
+
+    assert_that(compute(1)).is_equal_to(Ok(2.0))
+    assert_that(compute(0)).is_instance_of(Err)
+    assert_that(compute(0).unwrap()).is_instance_of(ZeroDivisionError)
+    assert_that(steps).is_equal_to([1.0])
+
+    @do_result
+    def returns_result(x: int):
+        val = yield Ok(x)
+        return err_code("negative") if val < 0 else Ok(val)
+
+    assert_that(returns_result(1)).is_equal_to(Ok(1))
+    assert_that(returns_result(-1)).is_same_as(err_code("negative"))
+
+    closed = []
+
+    @do_result
+    def cleanup():
+        try:
+            yield err_code("fail")
+        finally:
+            closed.append(True)
+
+    assert_that(cleanup()).is_same_as(err_code("fail"))
+    assert_that(closed).is_equal_to([True])
+
+    @do_result
+    def not_a_result():
+        yield 1
+
+    with pytest.raises(TypeError):
+        not_a_result()